@@ -277,9 +277,12 @@ def status(project: str, environment: str, profile: Optional[str]) -> None:
 @click.option(
     "--build-env", "-E", multiple=True, help="Build environment variables (key=value)"
 )
+@click.option(
+    "--upload-workers", type=int, help="Concurrent S3 uploads (default: 16)"
+)
 @click.option("--profile", help="AWS profile to use")
 @click.option("--dry-run", is_flag=True, help="Show what would be deployed")
-def frontend(project: str, environment: str, skip_build: bool, build_env: Tuple[str, ...], profile: Optional[str], dry_run: bool) -> None:
+def frontend(project: str, environment: str, skip_build: bool, build_env: Tuple[str, ...], upload_workers: Optional[int], profile: Optional[str], dry_run: bool) -> None:
     """Deploy frontend to S3 and CloudFront."""
     try:
         # Parse build environment
@@ -298,6 +301,7 @@ def frontend(project: str, environment: str, skip_build: bool, build_env: Tuple[
             environment=environment,
             build_env=env_vars,
             skip_build=skip_build,
+            upload_workers=upload_workers,
             profile=profile,
             dry_run=dry_run,
         )
@@ -6,15 +6,19 @@ import json
 import os
 import subprocess
 import sys
+import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import boto3
-from botocore.exceptions import ClientError
+from botocore.config import Config
+from botocore.exceptions import ClientError, WaiterError
 
 try:
     from config import ProjectConfig, get_project_config
@@ -23,6 +27,16 @@ except ImportError:
     get_project_config = None
 
 
+def _safe_get(response: Any, *keys: Any) -> Any:
+    """Walk keys and indexes into an AWS response, returning None if one is missing."""
+    for key in keys:
+        try:
+            response = response[key]
+        except (KeyError, IndexError, TypeError):
+            return None
+    return response
+
+
 class DeploymentStatus(Enum):
     """Status of a deployment operation."""
 
@@ -53,6 +67,17 @@ class DeploymentResult:
 class BaseDeployer(ABC):
     """Base class for all deployers."""
 
+    # Shared by every client; subclasses that run N requests in parallel
+    # must raise max_pool_connections to at least N (see FrontendDeployer)
+    CLIENT_CONFIG = Config(
+        max_pool_connections=10,
+        tcp_keepalive=True,
+        retries={"mode": "adaptive", "max_attempts": 10},
+    )
+
+    # boto3 sessions are not thread-safe, so clients are created under this lock
+    _client_lock = threading.Lock()
+
     def __init__(
         self,
         project_name: str,
@@ -99,9 +124,12 @@ class BaseDeployer(ABC):
 
     def _get_client(self, service: str) -> Any:
         """Get or create AWS client for a service."""
-        if service not in self._clients:
-            self._clients[service] = self._session.client(service)
-        return self._clients[service]
+        with self._client_lock:
+            if service not in self._clients:
+                self._clients[service] = self._session.client(
+                    service, config=self.CLIENT_CONFIG
+                )
+            return self._clients[service]
 
     @property
     def cloudformation(self) -> Any:
@@ -217,8 +245,9 @@ class BaseDeployer(ABC):
         """Check CloudFormation stack status."""
         try:
             response = self.cloudformation.describe_stacks(StackName=stack_name)
-            if response["Stacks"]:
-                return str(response["Stacks"][0]["StackStatus"])
+            status = _safe_get(response, "Stacks", 0, "StackStatus")
+            if status:
+                return str(status)
         except ClientError as e:
             if "does not exist" in str(e):
                 return None
@@ -312,18 +341,36 @@ class BaseDeployer(ABC):
 
         try:
             response = self.cloudformation.describe_stacks(StackName=stack_name)
-            if response["Stacks"]:
-                outputs = {}
-                for output in response["Stacks"][0].get("Outputs", []):
-                    outputs[output["OutputKey"]] = output["OutputValue"]
-                return outputs
+            outputs = {}
+            for output in _safe_get(response, "Stacks", 0, "Outputs") or ():
+                outputs[output["OutputKey"]] = output["OutputValue"]
+            return outputs
         except Exception as e:
             self.add_warning(f"Failed to get stack outputs: {e}")
 
         return {}
 
+    @cached_property
+    def stack_outputs(self) -> Dict[str, str]:
+        """
+        Outputs of this deployer's stack, fetched once per deployer.
+
+        Use ``del self.stack_outputs`` to force a refresh after the stack
+        has been updated.
+        """
+        return self.get_stack_outputs()
+
+    @cached_property
+    def project_dir(self) -> Path:
+        """Project checkout beside the current directory, resolved once."""
+        return (Path.cwd().parent / self.project_name).resolve()
+
     def wait_for_stack(
-        self, stack_name: str, operation: str = "create", max_attempts: int = 120
+        self,
+        stack_name: str,
+        operation: str = "create",
+        max_attempts: int = 720,
+        delay: int = 5,
     ) -> bool:
         """Wait for CloudFormation stack operation to complete."""
         if self.dry_run:
@@ -334,63 +381,90 @@ class BaseDeployer(ABC):
             waiter = self.cloudformation.get_waiter(f"stack_{operation}_complete")
             waiter.wait(
                 StackName=stack_name,
-                WaiterConfig={"Delay": 30, "MaxAttempts": max_attempts},
+                WaiterConfig={"Delay": delay, "MaxAttempts": max_attempts},
             )
             return True
-        except Exception as e:
-            self.add_error(f"Stack {operation} failed: {e}")
-
-            # Get stack events to understand the failure
-            try:
-                self.log("Getting stack events to diagnose failure...", "INFO")
-                response = self.cloudformation.describe_stack_events(
-                    StackName=stack_name
+        except WaiterError as e:
+            # The waiter stops on failure acceptors as well as on timeout; the
+            # last DescribeStacks response tells the two apart
+            status = _safe_get(e.last_response, "Stacks", 0, "StackStatus")
+            if status and status.endswith("_IN_PROGRESS"):
+                self.add_error(
+                    f"Timed out waiting for stack {operation}; "
+                    f"stack is still {status}"
                 )
+                return False
 
-                # Find all failure events, not just the first
-                failed_events = []
-                for event in response["StackEvents"]:
-                    status = event.get("ResourceStatus", "")
-                    if (
-                        "FAILED" in status
-                        and "Resource creation cancelled"
-                        not in event.get("ResourceStatusReason", "")
-                    ):
-                        failed_events.append(event)
-
-                # Sort by timestamp to get the first real failure
-                failed_events.sort(key=lambda x: x["Timestamp"])
-
-                # Report the first real failure
-                if failed_events:
-                    event = failed_events[0]
-                    self.add_error(
-                        f"Root cause: Resource {event['LogicalResourceId']} ({event['ResourceType']}) failed: "
-                        f"{event.get('ResourceStatusReason', 'No reason provided')}"
-                    )
-            except Exception as event_error:
-                self.log(f"Could not retrieve stack events: {event_error}", "WARNING")
+            self.add_error(f"Stack {operation} failed: {status or e}")
+            self.report_stack_failure(stack_name)
+            return False
+        except Exception as e:
+            self.add_error(f"Stack {operation} failed: {e}")
 
+            self.report_stack_failure(stack_name)
             return False
 
+    def report_stack_failure(self, stack_name: str) -> None:
+        """Record the first real resource failure from a stack's events."""
+        try:
+            self.log("Getting stack events to diagnose failure...", "INFO")
+            response = self.cloudformation.describe_stack_events(StackName=stack_name)
+
+            # Find all failure events, not just the first
+            failed_events = []
+            for event in _safe_get(response, "StackEvents") or ():
+                status = event.get("ResourceStatus", "")
+                if (
+                    "FAILED" in status
+                    and "Resource creation cancelled"
+                    not in event.get("ResourceStatusReason", "")
+                ):
+                    failed_events.append(event)
+
+            # Sort by timestamp to get the first real failure
+            failed_events.sort(key=lambda x: x["Timestamp"])
+
+            # Report the first real failure
+            if failed_events:
+                event = failed_events[0]
+                self.add_error(
+                    f"Root cause: Resource {event['LogicalResourceId']} ({event['ResourceType']}) failed: "
+                    f"{event.get('ResourceStatusReason', 'No reason provided')}"
+                )
+        except Exception as event_error:
+            self.log(f"Could not retrieve stack events: {event_error}", "WARNING")
+
     def validate_prerequisites(self) -> bool:
         """Validate deployment prerequisites."""
         self.log("Validating prerequisites...", "INFO")
 
-        # Check AWS credentials
-        try:
-            self.sts.get_caller_identity()
-        except Exception as e:
-            self.add_error(f"AWS credentials not configured: {e}")
-            return False
+        project_dir = self.project_dir
 
-        # Check project directory exists
-        project_dir = Path.cwd() / ".." / self.project_name
-        if not project_dir.exists():
-            self.add_error(f"Project directory not found: {project_dir}")
-            return False
+        # Independent checks run concurrently; wall-clock is the slowest one
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                executor.submit(self.sts.get_caller_identity): "sts",
+                executor.submit(project_dir.exists): "dir",
+            }
 
-        return True
+            valid = True
+            for future in as_completed(futures):
+                check = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    if check == "sts":
+                        self.add_error(f"AWS credentials not configured: {e}")
+                    else:
+                        self.add_error(f"Failed to check project directory: {e}")
+                    valid = False
+                    continue
+
+                if check == "dir" and not result:
+                    self.add_error(f"Project directory not found: {project_dir}")
+                    valid = False
+
+        return valid
 
     @abstractmethod
     def deploy(self) -> DeploymentResult:
@@ -5,12 +5,23 @@ This script orchestrates the deployment of all infrastructure and application co
 """
 
 import argparse
+import io
 import json
+import mimetypes
 import os
 import subprocess
 import sys
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -18,7 +29,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from config import DeploymentConfig
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from patterns.media_register_cf import MediaRegisterApp
+
+# boto3, the deployment package and the CDK patterns are imported where they
+# are used so `--help` and argument errors return without loading the SDK
 
 
 class MediaRegisterDeployment:
@@ -29,22 +42,44 @@ class MediaRegisterDeployment:
         self.config = DeploymentConfig(environment, config_overrides)
         self.project_root = Path(__file__).parent.parent
 
+        import boto3
+        from botocore.config import Config
+
+        # One session and one client per service for the whole deployment,
+        # instead of paying CLI startup and a TLS handshake per `aws` call
+        self._session = boto3.Session(
+            region_name=os.environ.get("AWS_DEFAULT_REGION")
+            or self.config.get("aws_region")
+        )
+        # Sized for the parallel Lambda and S3 upload pools plus the stack
+        # poller; adaptive retries back off when AWS signals throttling
+        client_config = Config(
+            max_pool_connections=32,
+            retries={"mode": "adaptive", "max_attempts": 8},
+            tcp_keepalive=True,
+            connect_timeout=5,
+            read_timeout=60,
+        )
+        self._sts = self._session.client("sts", config=client_config)
+        self._cfn = self._session.client("cloudformation", config=client_config)
+        self._lambda = self._session.client("lambda", config=client_config)
+        self._s3 = self._session.client("s3", config=client_config)
+        self._cf = self._session.client("cloudfront", config=client_config)
+
     def validate_prerequisites(self) -> bool:
         """Validate deployment prerequisites."""
+        from botocore.exceptions import ClientError
+
         print("🔍 Validating prerequisites...")
 
         # Check AWS credentials
         try:
-            result = subprocess.run(
-                ["aws", "sts", "get-caller-identity"], capture_output=True, text=True
-            )
-            if result.returncode != 0:
-                print("❌ AWS credentials not configured")
-                return False
-
-            identity = json.loads(result.stdout)
+            identity = self._sts.get_caller_identity()
             print(f"✅ AWS Account: {identity['Account']}")
 
+        except ClientError:
+            print("❌ AWS credentials not configured")
+            return False
         except Exception as e:
             print(f"❌ Failed to validate AWS credentials: {e}")
             return False
@@ -73,60 +108,110 @@ class MediaRegisterDeployment:
 
         return True
 
+    @staticmethod
+    def _run_streaming(
+        command: List[str],
+        cwd: Path,
+        tag: str,
+        env: Optional[Dict[str, str]] = None,
+    ) -> int:
+        """Run a command, echoing its combined output line by line with a tag.
+
+        Output is not accumulated, so long builds show progress live without
+        growing an in-memory buffer.
+        """
+        with subprocess.Popen(
+            command,
+            cwd=cwd,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True,
+        ) as process:
+            for line in process.stdout or []:
+                print(f"{tag} {line}", end="")
+        return process.returncode
+
+    def _install_npm_dependencies(self, package_path: Path, tag: str) -> bool:
+        """
+        Install npm dependencies, skipping the install when nothing changed.
+
+        With a package-lock.json, the install is skipped if the lock file hash
+        matches the last successful install and node_modules is present;
+        otherwise ``npm ci`` is used. Both builds share one npm cache under
+        the project root.
+        """
+        from deployment.deploy_utils import (
+            lock_file_hash,
+            npm_install_current,
+            npm_stamp_file,
+        )
+
+        stamp_file = npm_stamp_file(self.project_root, package_path)
+        lock_hash = lock_file_hash(package_path)
+        if lock_hash:
+            if npm_install_current(package_path, stamp_file, lock_hash):
+                print(f"{tag} ⏭️ package-lock.json unchanged, skipping install")
+                return True
+            command = ["npm", "ci", "--prefer-offline", "--no-audit", "--no-fund"]
+        else:
+            command = ["npm", "install"]
+
+        env = os.environ.copy()
+        env["NPM_CONFIG_CACHE"] = str(self.project_root / ".npm-cache")
+
+        returncode = self._run_streaming(command, package_path, tag, env=env)
+        if returncode != 0:
+            print(f"{tag} ❌ Failed to install dependencies (exit code {returncode})")
+            return False
+
+        if lock_hash:
+            stamp_file.write_text(lock_hash)
+        return True
+
     def build_lambda_functions(self) -> bool:
         """Build TypeScript Lambda functions."""
-        print("\n🔨 Building Lambda functions...")
+        print("\n[lambda] 🔨 Building Lambda functions...")
 
         lambda_path = self.project_root / "src" / "lambda"
 
         try:
             # Install dependencies
-            print("📦 Installing Lambda dependencies...")
-            result = subprocess.run(
-                ["npm", "install"], cwd=lambda_path, capture_output=True, text=True
-            )
-            if result.returncode != 0:
-                print(f"❌ Failed to install dependencies: {result.stderr}")
+            print("[lambda] 📦 Installing Lambda dependencies...")
+            if not self._install_npm_dependencies(lambda_path, "[lambda]"):
                 return False
 
             # Build TypeScript
-            print("🏗️ Compiling TypeScript...")
-            result = subprocess.run(
-                ["npm", "run", "build:lambdas"],
-                cwd=lambda_path,
-                capture_output=True,
-                text=True,
+            print("[lambda] 🏗️ Compiling TypeScript...")
+            returncode = self._run_streaming(
+                ["npm", "run", "build:lambdas"], lambda_path, "[lambda]"
             )
-            if result.returncode != 0:
-                print(f"❌ Failed to build Lambda functions: {result.stderr}")
+            if returncode != 0:
+                print(
+                    f"[lambda] ❌ Failed to build Lambda functions (exit code {returncode})"
+                )
                 return False
 
-            print("✅ Lambda functions built successfully")
+            print("[lambda] ✅ Lambda functions built successfully")
             return True
 
         except Exception as e:
-            print(f"❌ Failed to build Lambda functions: {e}")
+            print(f"[lambda] ❌ Failed to build Lambda functions: {e}")
             return False
 
     def build_frontend(self) -> bool:
         """Build Next.js frontend."""
-        print("\n🎨 Building frontend...")
+        print("\n[frontend] 🎨 Building frontend...")
 
         try:
             # Install dependencies
-            print("📦 Installing frontend dependencies...")
-            result = subprocess.run(
-                ["npm", "install"],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode != 0:
-                print(f"❌ Failed to install dependencies: {result.stderr}")
+            print("[frontend] 📦 Installing frontend dependencies...")
+            if not self._install_npm_dependencies(self.project_root, "[frontend]"):
                 return False
 
             # Build Next.js
-            print("🏗️ Building Next.js application...")
+            print("[frontend] 🏗️ Building Next.js application...")
 
             # Set environment variables for build
             env = os.environ.copy()
@@ -134,19 +219,17 @@ class MediaRegisterDeployment:
                 f"https://api.{self.config.get('domain_name', 'media-register.com')}"
             )
 
-            result = subprocess.run(
-                ["npm", "run", "build"],
-                cwd=self.project_root,
-                env=env,
-                capture_output=True,
-                text=True,
+            returncode = self._run_streaming(
+                ["npm", "run", "build"], self.project_root, "[frontend]", env=env
             )
-            if result.returncode != 0:
-                print(f"❌ Failed to build frontend: {result.stderr}")
+            if returncode != 0:
+                print(
+                    f"[frontend] ❌ Failed to build frontend (exit code {returncode})"
+                )
                 return False
 
             # Export static files
-            print("📤 Exporting static files...")
+            print("[frontend] 📤 Exporting static files...")
             result = subprocess.run(
                 ["npm", "run", "export"],
                 cwd=self.project_root,
@@ -156,19 +239,46 @@ class MediaRegisterDeployment:
 
             if result.returncode != 0:
                 # Next.js 13+ doesn't need separate export command
-                print("ℹ️ Using Next.js built output")
+                print("[frontend] ℹ️ Using Next.js built output")
 
-            print("✅ Frontend built successfully")
+            print("[frontend] ✅ Frontend built successfully")
             return True
 
         except Exception as e:
-            print(f"❌ Failed to build frontend: {e}")
+            print(f"[frontend] ❌ Failed to build frontend: {e}")
+            return False
+
+    def _stack_exists(self, stack_name: str) -> bool:
+        """Check whether a CloudFormation stack exists."""
+        from botocore.exceptions import ClientError
+
+        try:
+            self._cfn.describe_stacks(StackName=stack_name)
+            return True
+        except ClientError as e:
+            if "does not exist" not in str(e):
+                raise
             return False
 
-    def deploy_infrastructure(self) -> Dict[str, str]:
-        """Deploy infrastructure using CDK."""
+    def deploy_infrastructure(
+        self,
+        while_updating: Optional[Callable[[], None]] = None,
+        stack_exists: Optional[bool] = None,
+    ) -> Dict[str, str]:
+        """Deploy infrastructure using CDK.
+
+        Args:
+            while_updating: Optional work to run while an existing stack is
+                updating, if the update leaves its Lambda resources unchanged;
+                skipped for new stacks, no-op updates and Lambda changes
+            stack_exists: Result of an earlier existence check, if known
+        """
+        from botocore.exceptions import ClientError
+
         print("\n🚀 Deploying infrastructure...")
 
+        from patterns.media_register_cf import MediaRegisterApp
+
         # Create MediaRegisterApp instance
         app = MediaRegisterApp(self.config.environment, self.config.config)
 
@@ -179,108 +289,79 @@ class MediaRegisterDeployment:
         template_path = (
             self.project_root / "deploy" / f"template-{self.environment}.json"
         )
-        with open(template_path, "w") as f:
-            json.dump(template, f, indent=2)
+        if orjson is not None:
+            with open(template_path, "wb") as f:
+                f.write(orjson.dumps(template, option=orjson.OPT_INDENT_2))
+            template_body = orjson.dumps(template).decode()
+        else:
+            with open(template_path, "w") as f:
+                json.dump(template, f, indent=2)
+            template_body = json.dumps(template)
 
         print(f"📄 CloudFormation template saved to {template_path}")
 
-        # Deploy using AWS CLI
         stack_name = f"media-register-{self.environment}"
 
         try:
+            stack_args: Dict[str, Any] = {
+                "StackName": stack_name,
+                **self._template_source(stack_name, template_body),
+                "Capabilities": ["CAPABILITY_IAM", "CAPABILITY_NAMED_IAM"],
+            }
+
             # Check if stack exists
-            result = subprocess.run(
-                [
-                    "aws",
-                    "cloudformation",
-                    "describe-stacks",
-                    "--stack-name",
-                    stack_name,
-                ],
-                capture_output=True,
-                text=True,
+            if stack_exists is None:
+                stack_exists = self._stack_exists(stack_name)
+
+            # Pushing code while CloudFormation also changes the functions
+            # races the update, so only overlap when they are left alone
+            overlap = (
+                stack_exists
+                and while_updating is not None
+                and self._lambda_resources_unchanged(stack_name, template)
             )
 
-            if result.returncode == 0:
-                # Update existing stack
-                print(f"📝 Updating existing stack: {stack_name}")
-                result = subprocess.run(
-                    [
-                        "aws",
-                        "cloudformation",
-                        "update-stack",
-                        "--stack-name",
-                        stack_name,
-                        "--template-body",
-                        f"file://{template_path}",
-                        "--capabilities",
-                        "CAPABILITY_IAM",
-                        "CAPABILITY_NAMED_IAM",
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
-            else:
-                # Create new stack
-                print(f"🆕 Creating new stack: {stack_name}")
-                result = subprocess.run(
-                    [
-                        "aws",
-                        "cloudformation",
-                        "create-stack",
-                        "--stack-name",
-                        stack_name,
-                        "--template-body",
-                        f"file://{template_path}",
-                        "--capabilities",
-                        "CAPABILITY_IAM",
-                        "CAPABILITY_NAMED_IAM",
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
-
-            if result.returncode != 0:
-                if "No updates are to be performed" in result.stderr:
+            try:
+                if stack_exists:
+                    # Update existing stack
+                    print(f"📝 Updating existing stack: {stack_name}")
+                    self._cfn.update_stack(**stack_args)
+                    operation = "update"
+                else:
+                    # Create new stack
+                    print(f"🆕 Creating new stack: {stack_name}")
+                    self._cfn.create_stack(**stack_args)
+                    operation = "create"
+            except ClientError as e:
+                if "No updates are to be performed" in str(e):
                     print("ℹ️ Stack is already up to date")
+                    operation = ""
                 else:
-                    print(f"❌ Failed to deploy stack: {result.stderr}")
+                    print(f"❌ Failed to deploy stack: {e}")
                     return {}
 
             # Wait for stack to complete
-            print("⏳ Waiting for stack deployment to complete...")
-            subprocess.run(
-                [
-                    "aws",
-                    "cloudformation",
-                    "wait",
-                    (
-                        "stack-create-complete"
-                        if "create-stack" in result.args
-                        else "stack-update-complete"
+            if operation:
+                print("⏳ Waiting for stack deployment to complete...")
+                status: Dict[str, bool] = {}
+                waiter = threading.Thread(
+                    target=lambda: status.update(
+                        success=self._wait_for_stack(stack_name)
                     ),
-                    "--stack-name",
-                    stack_name,
-                ],
-                check=True,
-            )
+                    daemon=True,
+                )
+                waiter.start()
+                if operation == "update" and overlap and while_updating:
+                    while_updating()
+                waiter.join()
 
-            # Get stack outputs
-            result = subprocess.run(
-                [
-                    "aws",
-                    "cloudformation",
-                    "describe-stacks",
-                    "--stack-name",
-                    stack_name,
-                    "--query",
-                    "Stacks[0].Outputs",
-                ],
-                capture_output=True,
-                text=True,
-            )
+                if not status.get("success"):
+                    print(f"❌ Stack {operation} did not complete successfully")
+                    return {}
 
-            outputs = json.loads(result.stdout)
+            # Get stack outputs
+            response = self._cfn.describe_stacks(StackName=stack_name)
+            outputs = response["Stacks"][0].get("Outputs", [])
             output_dict = {o["OutputKey"]: o["OutputValue"] for o in outputs}
 
             print("✅ Infrastructure deployed successfully")
@@ -294,6 +375,81 @@ class MediaRegisterDeployment:
             print(f"❌ Failed to deploy infrastructure: {e}")
             return {}
 
+    def _lambda_resources_unchanged(
+        self, stack_name: str, template: Dict[str, Any]
+    ) -> bool:
+        """Check whether template leaves the deployed Lambda resources as they are."""
+        from botocore.exceptions import ClientError
+
+        from deployment.deploy_utils import lambda_resources_match
+
+        try:
+            deployed = self._cfn.get_template(
+                StackName=stack_name, TemplateStage="Original"
+            )["TemplateBody"]
+        except ClientError:
+            return False
+        return lambda_resources_match(deployed, template)
+
+    def _template_source(self, stack_name: str, template_body: str) -> Dict[str, str]:
+        """Pass small templates inline; stage larger ones in S3 by content hash."""
+        from botocore.exceptions import ClientError
+
+        from deployment.deploy_utils import template_s3_key
+        from deployment.infrastructure import MAX_INLINE_TEMPLATE_BYTES
+
+        encoded = template_body.encode()
+        if len(encoded) < MAX_INLINE_TEMPLATE_BYTES:
+            return {"TemplateBody": template_body}
+
+        account_id = self._sts.get_caller_identity()["Account"]
+        bucket = f"media-register-deployments-{account_id}"
+        key = template_s3_key(stack_name, encoded)
+        region = self._session.region_name
+
+        try:
+            self._s3.head_object(Bucket=bucket, Key=key)
+        except ClientError:
+            try:
+                self._s3.head_bucket(Bucket=bucket)
+            except ClientError:
+                if region == "us-east-1":
+                    self._s3.create_bucket(Bucket=bucket)
+                else:
+                    self._s3.create_bucket(
+                        Bucket=bucket,
+                        CreateBucketConfiguration={"LocationConstraint": region},
+                    )
+            print(f"📤 Uploading template to s3://{bucket}/{key}")
+            self._s3.put_object(Bucket=bucket, Key=key, Body=encoded)
+
+        return {"TemplateURL": f"https://{bucket}.s3.{region}.amazonaws.com/{key}"}
+
+    def _wait_for_stack(self, stack_name: str, timeout: int = 3600) -> bool:
+        """Poll a stack until it reaches a terminal state.
+
+        Returns True for CREATE_COMPLETE or UPDATE_COMPLETE, False for any
+        failed or rolled back state, or when the timeout elapses.
+        """
+        from deployment.deploy_utils import poll_delays, stack_wait_result
+
+        deadline = time.monotonic() + timeout
+        for delay in poll_delays():
+            response = self._cfn.describe_stacks(StackName=stack_name)
+            stack_status = response["Stacks"][0]["StackStatus"]
+
+            result = stack_wait_result(stack_status)
+            if result:
+                return True
+            if result is False:
+                print(f"❌ Stack {stack_name} ended in {stack_status}")
+                return False
+            if time.monotonic() + delay > deadline:
+                print(f"❌ Timed out waiting for stack {stack_name}")
+                return False
+            time.sleep(delay)
+        return False
+
     def deploy_lambda_code(self, lambda_functions: List[str]) -> bool:
         """Deploy Lambda function code."""
         print("\n📦 Deploying Lambda function code...")
@@ -304,53 +460,98 @@ class MediaRegisterDeployment:
             print("❌ Lambda packages directory not found")
             return False
 
-        for function_name in lambda_functions:
-            package_dir = packages_dir / function_name
-            if not package_dir.exists():
-                print(f"⚠️ Package not found for {function_name}, skipping...")
-                continue
+        from deployment.deploy_utils import load_deploy_cache
+
+        cache_file = self.project_root / ".deploy-cache.json"
+        cache = load_deploy_cache(cache_file)
+
+        # Each package + upload is independent network I/O; boto3 clients
+        # are thread-safe so the Lambda client is shared across workers
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {
+                executor.submit(
+                    self._package_and_upload, packages_dir / function_name, cache
+                ): function_name
+                for function_name in lambda_functions
+            }
+            for future in as_completed(futures):
+                function_name = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"❌ Failed to deploy {function_name}: {e}")
+
+        with open(cache_file, "w") as f:
+            json.dump(cache, f, indent=2)
 
-            # Create zip file
-            zip_file = f"/tmp/{function_name}.zip"
-            print(f"📦 Packaging {function_name}...")
+        return True
 
-            result = subprocess.run(
-                ["zip", "-r", zip_file, "."],
-                cwd=package_dir,
-                capture_output=True,
-                text=True,
-            )
+    def _package_and_upload(
+        self, package_dir: Path, cache: Dict[str, Dict[str, str]]
+    ) -> bool:
+        """Zip a Lambda package directory in memory and update the function code.
 
-            if result.returncode != 0:
-                print(f"❌ Failed to package {function_name}: {result.stderr}")
-                continue
+        The package is skipped when its contents hash matches the cache entry
+        and the deployed function still reports the cached CodeSha256.
+        """
+        from botocore.exceptions import ClientError
 
-            # Update Lambda function code
-            print(f"🚀 Updating {function_name}...")
-            result = subprocess.run(
-                [
-                    "aws",
-                    "lambda",
-                    "update-function-code",
-                    "--function-name",
-                    f"media-register-{self.environment}-{function_name}",
-                    "--zip-file",
-                    f"fileb://{zip_file}",
-                ],
-                capture_output=True,
-                text=True,
-            )
+        from deployment.deploy_utils import hash_package_files, list_package_files
 
-            if result.returncode != 0:
-                print(f"❌ Failed to update {function_name}: {result.stderr}")
-                continue
+        function_name = package_dir.name
+        if not package_dir.exists():
+            print(f"⚠️ Package not found for {function_name}, skipping...")
+            return False
+
+        aws_function_name = f"media-register-{self.environment}-{function_name}"
+        files = list_package_files(package_dir)
+        dir_hash = hash_package_files(package_dir, files)
+        cached = cache.get(function_name, {})
+        if cached.get("dir_hash") == dir_hash:
+            try:
+                response = self._lambda.get_function(FunctionName=aws_function_name)
+                deployed_sha = response["Configuration"]["CodeSha256"]
+            except ClientError:
+                deployed_sha = None
+            if deployed_sha and deployed_sha == cached.get("code_sha256"):
+                print(f"⏭️ {function_name} unchanged, skipping")
+                return True
+
+        # Zip in-process from the file list already walked for the hash;
+        # no zip process per function and no temporary archive on disk
+        print(f"📦 Packaging {function_name}...")
+        # Favour packaging speed over archive size outside production
+        compresslevel = 6 if self.environment == "prod" else 1
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(
+            buffer, "w", zipfile.ZIP_DEFLATED, compresslevel=compresslevel
+        ) as zf:
+            for path in files:
+                zf.write(path, os.path.relpath(path, package_dir))
+
+        # Update Lambda function code
+        print(f"🚀 Updating {function_name}...")
+        try:
+            response = self._lambda.update_function_code(
+                FunctionName=aws_function_name,
+                ZipFile=buffer.getvalue(),
+            )
+        except Exception as e:
+            print(f"❌ Failed to update {function_name}: {e}")
+            return False
 
-            print(f"✅ {function_name} deployed")
+        cache[function_name] = {
+            "dir_hash": dir_hash,
+            "code_sha256": response["CodeSha256"],
+        }
 
+        print(f"✅ {function_name} deployed")
         return True
 
     def deploy_frontend_to_s3(self, bucket_name: str, distribution_id: str) -> bool:
         """Deploy frontend files to S3."""
+        from botocore.exceptions import ClientError
+
         print("\n📤 Deploying frontend to S3...")
 
         # Determine build output directory
@@ -371,60 +572,28 @@ class MediaRegisterDeployment:
         try:
             # Sync files to S3
             print(f"📦 Syncing files to s3://{bucket_name}")
-            result = subprocess.run(
-                [
-                    "aws",
-                    "s3",
-                    "sync",
-                    str(source_dir),
-                    f"s3://{bucket_name}",
-                    "--delete",
-                    "--cache-control",
-                    "public, max-age=31536000",
-                ],
-                capture_output=True,
-                text=True,
-            )
+            changed_keys = self._sync_directory_to_s3(source_dir, bucket_name)
+            print(f"ℹ️ {len(changed_keys)} file(s) changed in the bucket")
 
-            if result.returncode != 0:
-                print(f"❌ Failed to sync files: {result.stderr}")
-                return False
-
-            # Update index.html cache control
-            subprocess.run(
-                [
-                    "aws",
-                    "s3",
-                    "cp",
-                    f"s3://{bucket_name}/index.html",
-                    f"s3://{bucket_name}/index.html",
-                    "--metadata-directive",
-                    "REPLACE",
-                    "--cache-control",
-                    "public, max-age=0, must-revalidate",
-                ],
-                capture_output=True,
-                text=True,
-            )
-
-            # Invalidate CloudFront
-            print(f"🔄 Invalidating CloudFront distribution {distribution_id}")
-            result = subprocess.run(
-                [
-                    "aws",
-                    "cloudfront",
-                    "create-invalidation",
-                    "--distribution-id",
-                    distribution_id,
-                    "--paths",
-                    "/*",
-                ],
-                capture_output=True,
-                text=True,
-            )
+            from deployment.frontend_deployer import build_invalidation_paths
 
-            if result.returncode != 0:
-                print(f"⚠️ Failed to invalidate CloudFront: {result.stderr}")
+            # Invalidate only what changed instead of purging every edge cache
+            paths = build_invalidation_paths(changed_keys)
+            if paths:
+                print(
+                    f"🔄 Invalidating {len(paths)} path(s) on CloudFront "
+                    f"distribution {distribution_id}"
+                )
+                try:
+                    self._cf.create_invalidation(
+                        DistributionId=distribution_id,
+                        InvalidationBatch={
+                            "Paths": {"Quantity": len(paths), "Items": paths},
+                            "CallerReference": str(time.time()),
+                        },
+                    )
+                except ClientError as e:
+                    print(f"⚠️ Failed to invalidate CloudFront: {e}")
 
             print("✅ Frontend deployed successfully")
             return True
@@ -433,6 +602,81 @@ class MediaRegisterDeployment:
             print(f"❌ Failed to deploy frontend: {e}")
             return False
 
+    def _sync_directory_to_s3(self, source_dir: Path, bucket_name: str) -> List[str]:
+        """Mirror a directory into a bucket, uploading only files that changed.
+
+        Objects that no longer exist locally are deleted. Returns the keys
+        that were uploaded or deleted.
+        """
+        from boto3.s3.transfer import TransferConfig
+
+        from deployment.deploy_utils import file_md5, multipart_etag
+
+        transfer_config = TransferConfig(
+            max_concurrency=20,
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=8 * 1024 * 1024,
+        )
+
+        remote: Dict[str, Tuple[str, int]] = {}
+        paginator = self._s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket_name):
+            for obj in page.get("Contents", []):
+                remote[obj["Key"]] = (obj["ETag"].strip('"'), obj["Size"])
+
+        local_files = {
+            path.relative_to(source_dir).as_posix(): path
+            for path in source_dir.rglob("*")
+            if path.is_file()
+        }
+
+        changed = []
+        for key, path in local_files.items():
+            etag, remote_size = remote.get(key, ("", -1))
+            # Size is free to compare and rules out most changed files
+            if remote_size != path.stat().st_size:
+                changed.append(key)
+            # Multipart uploads are tagged "<md5 of part md5s>-<part count>"
+            elif "-" in etag:
+                if etag != multipart_etag(path, transfer_config.multipart_chunksize):
+                    changed.append(key)
+            elif etag != file_md5(path):
+                changed.append(key)
+
+        def upload(key: str) -> None:
+            cache_control = (
+                "public, max-age=0, must-revalidate"
+                if key == "index.html"
+                else "public, max-age=31536000"
+            )
+            extra_args = {"CacheControl": cache_control}
+            content_type = mimetypes.guess_type(key)[0]
+            if content_type:
+                extra_args["ContentType"] = content_type
+            self._s3.upload_file(
+                str(local_files[key]),
+                bucket_name,
+                key,
+                ExtraArgs=extra_args,
+                Config=transfer_config,
+            )
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            # list() re-raises the first upload failure
+            list(executor.map(upload, changed))
+
+        stale = [key for key in remote if key not in local_files]
+        for i in range(0, len(stale), 1000):
+            self._s3.delete_objects(
+                Bucket=bucket_name,
+                Delete={
+                    "Objects": [{"Key": key} for key in stale[i : i + 1000]],
+                    "Quiet": True,
+                },
+            )
+
+        return changed + stale
+
     def run(self) -> bool:
         """Run the complete deployment."""
         print(
@@ -443,20 +687,26 @@ class MediaRegisterDeployment:
         if not self.validate_prerequisites():
             return False
 
-        # Build Lambda functions
-        if not self.build_lambda_functions():
-            return False
+        # Build Lambda functions and frontend concurrently; both are
+        # independent npm runs. The stack existence check overlaps with them.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            lambda_build = executor.submit(self.build_lambda_functions)
+            frontend_build = executor.submit(self.build_frontend)
+            stack_check = executor.submit(
+                self._stack_exists, f"media-register-{self.environment}"
+            )
+            lambda_built = lambda_build.result()
+            frontend_built = frontend_build.result()
 
-        # Build frontend
-        if not self.build_frontend():
+        if not (lambda_built and frontend_built):
             return False
 
-        # Deploy infrastructure
-        outputs = self.deploy_infrastructure()
-        if not outputs:
-            return False
+        try:
+            stack_exists: Optional[bool] = stack_check.result()
+        except Exception:
+            # Let deploy_infrastructure repeat the check and report errors
+            stack_exists = None
 
-        # Deploy Lambda code
         lambda_functions = [
             "registerAuthor",
             "getAuthor",
@@ -471,8 +721,23 @@ class MediaRegisterDeployment:
             "searchWorks",
             "healthCheck",
         ]
+        lambda_results: List[bool] = []
+
+        def deploy_code() -> None:
+            lambda_results.append(self.deploy_lambda_code(lambda_functions))
+
+        # Deploy infrastructure; on stack updates that leave the functions
+        # alone, their code is deployed while CloudFormation is still working
+        outputs = self.deploy_infrastructure(
+            while_updating=deploy_code, stack_exists=stack_exists
+        )
+        if not outputs:
+            return False
 
-        if not self.deploy_lambda_code(lambda_functions):
+        # Deploy Lambda code
+        if not lambda_results:
+            deploy_code()
+        if not lambda_results[0]:
             print("⚠️ Some Lambda functions failed to deploy")
 
         # Deploy frontend if we have the outputs
@@ -0,0 +1,152 @@
+"""
+Dependency-free helpers shared by the deployment scripts and deployers.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+
+def file_md5(file_path: Union[str, Path]) -> str:
+    """Hex MD5 of a file, hashed straight from a read-only memory map."""
+    with open(file_path, "rb") as f:
+        # mmap rejects empty files
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.md5().hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return hashlib.md5(data).hexdigest()
+
+
+def multipart_etag(file_path: Union[str, Path], part_size: int) -> str:
+    """ETag S3 assigns to a file uploaded in part_size multipart chunks."""
+    digests = []
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(part_size), b""):
+            digests.append(hashlib.md5(chunk).digest())
+    return f"{hashlib.md5(b''.join(digests)).hexdigest()}-{len(digests)}"
+
+
+def poll_delays() -> Iterator[int]:
+    """Yield poll delays: fast while a stack is transitioning, then back off."""
+    for _ in range(20):
+        yield 3
+    for _ in range(50):
+        yield 10
+    while True:
+        yield 30
+
+
+def stack_wait_result(status: str) -> Optional[bool]:
+    """
+    Classify a stack status for a create or update wait.
+
+    Returns:
+        True once the stack is complete, False if it failed, rolled back or
+        was deleted, and None while it is still changing
+    """
+    if status in ("CREATE_COMPLETE", "UPDATE_COMPLETE"):
+        return True
+    if (
+        status.endswith("_FAILED")
+        or status.endswith("ROLLBACK_COMPLETE")
+        or status == "DELETE_COMPLETE"
+    ):
+        return False
+    return None
+
+
+def template_s3_key(stack_name: str, encoded: bytes) -> str:
+    """S3 key for a staged template, unique to its contents."""
+    return f"templates/{stack_name}-{hashlib.sha256(encoded).hexdigest()[:12]}.json"
+
+
+def lambda_resources(template: Dict[str, Any]) -> Dict[str, Any]:
+    """Select the Lambda resources from a template, by logical ID."""
+    return {
+        name: resource
+        for name, resource in (template.get("Resources") or {}).items()
+        if str(resource.get("Type", "")).startswith("AWS::Lambda::")
+    }
+
+
+def lambda_resources_match(
+    deployed: Union[str, Dict[str, Any]], template: Dict[str, Any]
+) -> bool:
+    """
+    Check whether template leaves the deployed Lambda resources as they are.
+
+    ``deployed`` is a GetTemplate body: botocore decodes JSON bodies, while
+    YAML ones arrive as text and are never treated as matching.
+    """
+    if isinstance(deployed, str):
+        try:
+            deployed = json.loads(deployed)
+        except ValueError:
+            return False
+    if not isinstance(deployed, dict):
+        return False
+    return lambda_resources(deployed) == lambda_resources(template)
+
+
+def load_deploy_cache(cache_file: Path) -> Dict[str, Dict[str, str]]:
+    """Load the package hash cache, ignoring a missing or corrupt file."""
+    try:
+        with open(cache_file) as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def list_package_files(package_dir: Path) -> List[str]:
+    """List every file under a package directory, sorted, in one scandir walk."""
+    pending = [str(package_dir)]
+    files = []
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    files.append(entry.path)
+    return sorted(files)
+
+
+def hash_package_files(package_dir: Path, files: List[str]) -> str:
+    """Compute a SHA256 digest over the relative paths and contents of files."""
+    digest = hashlib.sha256()
+    for path in files:
+        digest.update(os.path.relpath(path, package_dir).encode())
+        digest.update(b"\0")
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def npm_stamp_file(project_root: Path, package_path: Path) -> Path:
+    """File recording the package-lock.json hash of the last successful install."""
+    relative = package_path.relative_to(project_root).as_posix()
+    slug = "root" if relative == "." else relative.replace("/", "-")
+    return project_root / f".deploy-cache.npm.{slug}"
+
+
+def lock_file_hash(package_path: Path) -> Optional[str]:
+    """SHA256 of a package's package-lock.json, or None without one."""
+    lock_file = package_path / "package-lock.json"
+    if not lock_file.exists():
+        return None
+    return hashlib.sha256(lock_file.read_bytes()).hexdigest()
+
+
+def npm_install_current(package_path: Path, stamp_file: Path, lock_hash: str) -> bool:
+    """Check whether node_modules was installed from this package-lock.json."""
+    return (
+        (package_path / "node_modules").exists()
+        and stamp_file.exists()
+        and stamp_file.read_text().strip() == lock_hash
+    )
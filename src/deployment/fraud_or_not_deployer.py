@@ -4,20 +4,50 @@ Fraud-or-Not specific deployment implementation.
 This consolidates the deployment logic from the main project's deploy.py
 """
 
+import copy
+import hashlib
 import json
 import os
-import sys
 import time
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, Iterable, List, Optional, Union
 
-import boto3
 import yaml
-
-from cloudformation.stack_manager import StackManager
+from botocore.exceptions import ClientError
 
 from .infrastructure import InfrastructureDeployer
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer the LibYAML-backed loader; safe_load silently uses the pure-Python one
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
+# Stack tag recording the SHA256 of the deployed template
+TEMPLATE_HASH_TAG = "TemplateHash"
+
+
+@lru_cache(maxsize=32)
+def _load_yaml(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML file; ``mtime_ns`` is part of the cache key only."""
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=YamlLoader) or {}
+
+
+def _load_yaml_cached(path: Path) -> Dict[str, Any]:
+    """Load a YAML file, reusing the parsed result until the file changes.
+
+    Returns a deep copy so callers are free to mutate the result.
+    """
+    return copy.deepcopy(_load_yaml(str(path), os.stat(path).st_mtime_ns))
+
 
 class FraudOrNotDeployer(InfrastructureDeployer):
     """Deploy Fraud-or-Not infrastructure with L2 constructs."""
@@ -42,16 +72,14 @@ class FraudOrNotDeployer(InfrastructureDeployer):
                 Path(__file__).parent.parent.parent / "config" / "fraud-or-not.yaml"
             )
 
-        with open(base_config_path, "r") as f:
-            config: Dict[str, Any] = yaml.safe_load(f) or {}
+        config = _load_yaml_cached(base_config_path)
 
         # Load environment-specific config
         env_config_path = (
             self.project_root / "config" / "environments" / f"{self.environment}.yaml"
         )
         if env_config_path.exists():
-            with open(env_config_path, "r") as f:
-                env_config: Dict[str, Any] = yaml.safe_load(f) or {}
+            env_config = _load_yaml_cached(env_config_path)
 
             # Deep merge configs
             config = self.deep_merge(config, env_config)
@@ -61,99 +89,145 @@ class FraudOrNotDeployer(InfrastructureDeployer):
 
         return config
 
-    def deep_merge(self, base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-        """Deep merge two dictionaries."""
-        result: Dict[str, Any] = base.copy()
-        for key, value in override.items():
-            if key == "extends":
-                continue
-            if (
-                key in result
-                and isinstance(result[key], dict)
-                and isinstance(value, dict)
-            ):
-                result[key] = self.deep_merge(result[key], value)
-            else:
-                result[key] = value
+    def deep_merge(
+        self, base: Dict[str, Any], override: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Deep merge two dictionaries.
+
+        The base is deep-copied once and merged into in place from an
+        explicit work stack, rather than copying at every nesting level.
+        """
+        if not override or override is base:
+            return base
+
+        result: Dict[str, Any] = copy.deepcopy(base)
+        pending = [(result, override)]
+        while pending:
+            target, source = pending.pop()
+            for key, value in source.items():
+                if key == "extends":
+                    continue
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    pending.append((current, value))
+                else:
+                    target[key] = value
         return result
 
     def apply_environment_config(self, config: Dict[str, Any]) -> None:
         """Apply environment-specific configuration."""
-
-        # Replace {env} placeholders
-        def replace_env(obj: Any) -> Any:
-            if isinstance(obj, str):
-                return obj.replace("{env}", self.environment)
-            elif isinstance(obj, dict):
-                return {k: replace_env(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [replace_env(item) for item in obj]
-            return obj
-
-        for key in config:
-            config[key] = replace_env(config[key])
+        # Cheap pre-check: most configs have no placeholders at all
+        if "{env}" not in json.dumps(config, default=str):
+            return
+
+        # Replace {env} placeholders in place; only strings that contain the
+        # placeholder are reallocated, and an explicit stack avoids recursion
+        pending: Deque[Union[Dict[Any, Any], List[Any]]] = deque([config])
+        while pending:
+            container = pending.pop()
+            keys: Iterable[Any] = (
+                container.keys()
+                if isinstance(container, dict)
+                else range(len(container))
+            )
+            for key in keys:
+                value = container[key]
+                if isinstance(value, (dict, list)):
+                    pending.append(value)
+                elif isinstance(value, str) and "{env}" in value:
+                    container[key] = value.replace("{env}", self.environment)
 
     def generate_template(self) -> str:
-        """Generate CloudFormation template using L2 constructs."""
-        # Import constructs
-        sys.path.insert(0, str(self.project_root))
+        """Generate a single flat CloudFormation template using L2 constructs.
+
+        Every construct adds plain ``AWS::*`` resources to one shared
+        template, so there are no nested stacks and cross-construct wiring
+        uses local ``Ref``/``GetAtt`` instead of exports and imports.
+        """
+        from troposphere import Join, Ref, Template
 
-        from constructs.api_gateway import APIGatewayConstruct
         from constructs.compute import ComputeConstruct
         from constructs.distribution import DistributionConstruct
         from constructs.network import NetworkConstruct
         from constructs.storage import StorageConstruct
 
-        # Initialize template
-        template: Dict[str, Any] = {
-            "AWSTemplateFormatVersion": "2010-09-09",
-            "Description": f"Fraud-or-Not Infrastructure - {self.environment}",
-            "Parameters": {},
-            "Resources": {},
-            "Outputs": {},
-        }
+        template = Template()
+        template.set_version("2010-09-09")
+        template.set_description(f"Fraud-or-Not Infrastructure - {self.environment}")
 
-        # Create resources using constructs
         try:
-            # Storage resources
-            storage = StorageConstruct(environment=self.environment, config=self.config)
-            storage_resources = storage.create_resources()
-            template["Resources"].update(storage_resources.get("Resources", {}))
-            template["Outputs"].update(storage_resources.get("Outputs", {}))
-
-            # Network resources
-            network = NetworkConstruct(environment=self.environment, config=self.config)
-            network_resources = network.create_resources()
-            template["Resources"].update(network_resources.get("Resources", {}))
-            template["Outputs"].update(network_resources.get("Outputs", {}))
-
-            # Compute resources
-            compute = ComputeConstruct(environment=self.environment, config=self.config)
-            compute_resources = compute.create_resources()
-            template["Resources"].update(compute_resources.get("Resources", {}))
-            template["Outputs"].update(compute_resources.get("Outputs", {}))
-
-            # API Gateway
-            api_gateway = APIGatewayConstruct(
-                environment=self.environment, config=self.config
+            storage = StorageConstruct(
+                template, self.config.get("storage", {}), self.environment
             )
-            api_resources = api_gateway.create_resources()
-            template["Resources"].update(api_resources.get("Resources", {}))
-            template["Outputs"].update(api_resources.get("Outputs", {}))
 
-            # CloudFront Distribution
-            distribution = DistributionConstruct(
-                environment=self.environment, config=self.config
+            vpc_config: Optional[Dict[str, Any]] = None
+            if self.config.get("network"):
+                network = NetworkConstruct(
+                    template, self.config["network"], self.environment
+                )
+                vpc_config = {
+                    "subnet_ids": network.get_lambda_subnet_ids(),
+                    "security_group_ids": [network.get_lambda_security_group_id()],
+                }
+
+            # Compute also creates the API Gateway REST API
+            compute = ComputeConstruct(
+                template,
+                self.config.get("compute", {}),
+                self.environment,
+                vpc_config=vpc_config,
+                dynamodb_tables=storage.get_table_names(),
+            )
+
+            api_stage = (
+                self.config.get("compute", {})
+                .get("api_gateway", {})
+                .get("stage_name", "api")
+            )
+            DistributionConstruct(
+                template,
+                self.config.get("distribution", {}),
+                self.environment,
+                api_domain_name=Join(
+                    "",
+                    [
+                        compute.get_api_gateway_id(),
+                        ".execute-api.",
+                        Ref("AWS::Region"),
+                        ".amazonaws.com",
+                    ],
+                ),
+                api_stage=api_stage,
             )
-            dist_resources = distribution.create_resources()
-            template["Resources"].update(dist_resources.get("Resources", {}))
-            template["Outputs"].update(dist_resources.get("Outputs", {}))
 
         except Exception as e:
             self.logger.error(f"Error generating template: {e}")
             raise
 
-        return json.dumps(template, indent=2)
+        template_dict = template.to_dict()
+        if orjson is not None:
+            return orjson.dumps(
+                template_dict, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+            ).decode()
+        return json.dumps(template_dict, indent=2, sort_keys=True)
+
+    def describe_existing_stack(self, stack_name: str) -> Optional[Dict[str, Any]]:
+        """Describe a stack, returning None if it does not exist."""
+        try:
+            response = self.cloudformation.describe_stacks(StackName=stack_name)
+        except ClientError as e:
+            if "does not exist" in str(e):
+                return None
+            raise
+        stacks = response.get("Stacks") or []
+        return stacks[0] if stacks else None
+
+    def get_template_bucket(self) -> str:
+        """Get the deployment bucket used to stage large templates."""
+        account_id = self.sts.get_caller_identity()["Account"]
+        bucket = f"{self.project_name}-deployments-{account_id}"
+        self.create_s3_bucket_if_needed(bucket)
+        return bucket
 
     def deploy(self, dry_run: bool = False, auto_approve: bool = False) -> bool:
         """Deploy the infrastructure."""
@@ -180,13 +254,31 @@ class FraudOrNotDeployer(InfrastructureDeployer):
 
         # Deploy using CloudFormation
         stack_name = f"{self.project_name}-{self.environment}"
-        stack_manager = StackManager(region=self.region)
+
+        template_hash = hashlib.sha256(template.encode()).hexdigest()
 
         try:
             # Check if stack exists
-            existing_stack: Optional[Dict[str, Any]] = stack_manager.describe_stack(stack_name)
-
+            existing_stack = self.describe_existing_stack(stack_name)
             if existing_stack:
+                deployed_hash = next(
+                    (
+                        tag["Value"]
+                        for tag in existing_stack.get("Tags", [])
+                        if tag["Key"] == TEMPLATE_HASH_TAG
+                    ),
+                    None,
+                )
+                # An identical template would only cost a change-set
+                # evaluation ending in "No updates are to be performed"
+                stack_status = existing_stack["StackStatus"]
+                if deployed_hash == template_hash and stack_status in (
+                    "CREATE_COMPLETE",
+                    "UPDATE_COMPLETE",
+                ):
+                    self.logger.info("Template unchanged, skipping update")
+                    return True
+
                 if not auto_approve:
                     response = input(
                         f"Stack {stack_name} already exists. Update? (y/N): "
@@ -195,36 +287,18 @@ class FraudOrNotDeployer(InfrastructureDeployer):
                         self.logger.info("Update cancelled")
                         return False
 
-                # Update stack
-                self.logger.info(f"Updating stack {stack_name}")
-                stack_manager.update_stack(
-                    stack_name=stack_name,
-                    template_body=template,
-                    tags=self.tags,
-                    capabilities=["CAPABILITY_IAM", "CAPABILITY_NAMED_IAM"],
-                )
-            else:
-                # Create stack
-                self.logger.info(f"Creating stack {stack_name}")
-                stack_manager.create_stack(
-                    stack_name=stack_name,
-                    template_body=template,
-                    tags=self.tags,
-                    capabilities=["CAPABILITY_IAM", "CAPABILITY_NAMED_IAM"],
-                )
-
-            # Wait for completion
-            self.logger.info("Waiting for stack operation to complete...")
-            stack_manager.wait_for_stack(stack_name)
+            # Create or update the stack and wait for completion; the
+            # template goes inline when small enough, otherwise via S3
+            self.tags[TEMPLATE_HASH_TAG] = template_hash
+            if not self.deploy_stack(stack_name, template, [], self.prepare_tags()):
+                return False
 
             # Get outputs
-            final_stack: Optional[Dict[str, Any]] = stack_manager.describe_stack(stack_name)
-            if final_stack and "Outputs" in final_stack:
+            outputs = self.get_stack_outputs(stack_name)
+            if outputs:
                 self.logger.info("\nStack Outputs:")
-                for output in final_stack["Outputs"]:
-                    self.logger.info(
-                        f"  {output['OutputKey']}: {output['OutputValue']}"
-                    )
+                for key, value in outputs.items():
+                    self.logger.info(f"  {key}: {value}")
 
             self.logger.info(f"Deployment complete for {stack_name}")
             return True
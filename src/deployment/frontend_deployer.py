@@ -2,15 +2,84 @@
 Frontend deployment to S3 and CloudFront.
 """
 
+import gzip
+import hashlib
+import itertools
 import json
-import mimetypes
+import mmap
 import os
 import subprocess
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import quote
+
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
 
 from .base_deployer import BaseDeployer, DeploymentResult, DeploymentStatus
+from .deploy_utils import file_md5, multipart_etag
+
+
+def build_invalidation_paths(
+    keys: Iterable[str], max_paths: int = 3000, collapse_threshold: int = 10
+) -> List[str]:
+    """
+    Build CloudFront invalidation paths for a set of changed S3 keys.
+
+    Directories with more than ``collapse_threshold`` changed files are
+    collapsed to a single ``/dir/*`` wildcard, and changed ``index.html``
+    files also invalidate their directory URL. Falls back to ``/*`` when the
+    result would exceed ``max_paths``.
+
+    Args:
+        keys: S3 keys that were uploaded or deleted
+        max_paths: Maximum number of paths before invalidating everything
+        collapse_threshold: Changed files per directory before using a wildcard
+
+    Returns:
+        Sorted list of invalidation paths (empty if nothing changed)
+    """
+    by_directory: Dict[str, List[str]] = defaultdict(list)
+    for key in keys:
+        by_directory[os.path.dirname(key)].append(key)
+
+    paths = set()
+    for directory, dir_keys in by_directory.items():
+        if len(dir_keys) > collapse_threshold:
+            paths.add(f"/{directory}/*" if directory else "/*")
+            continue
+        for key in dir_keys:
+            paths.add("/" + key)
+            if os.path.basename(key) == "index.html":
+                paths.add(f"/{directory}/" if directory else "/")
+
+    if len(paths) > max_paths or "/*" in paths:
+        return ["/*"]
+    return sorted(quote(path, safe="/*") for path in paths)
+
+
+def _walk(root: str, prefix: str = "") -> Iterator[Tuple[str, str]]:
+    """
+    Yield ``(path, key)`` for every file under ``root``.
+
+    Uses ``os.scandir`` so file/directory checks come from the directory
+    listing instead of a ``stat`` per entry, and builds S3 keys by string
+    concatenation rather than ``Path.relative_to``.
+    """
+    stack = [(root, prefix)]
+    while stack:
+        directory, key_prefix = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    stack.append((entry.path, f"{key_prefix}{entry.name}/"))
+                elif entry.is_file():
+                    yield entry.path, key_prefix + entry.name
 
 
 class FrontendDeployer(BaseDeployer):
@@ -19,9 +88,12 @@ class FrontendDeployer(BaseDeployer):
     # Content type mappings
     CONTENT_TYPES = {
         ".html": "text/html",
+        ".htm": "text/html",
         ".css": "text/css",
         ".js": "application/javascript",
+        ".mjs": "application/javascript",
         ".json": "application/json",
+        ".webmanifest": "application/manifest+json",
         ".png": "image/png",
         ".jpg": "image/jpeg",
         ".jpeg": "image/jpeg",
@@ -29,15 +101,21 @@ class FrontendDeployer(BaseDeployer):
         ".svg": "image/svg+xml",
         ".ico": "image/x-icon",
         ".txt": "text/plain",
+        ".csv": "text/csv",
         ".xml": "application/xml",
         ".woff": "font/woff",
         ".woff2": "font/woff2",
         ".ttf": "font/ttf",
+        ".otf": "font/otf",
         ".eot": "application/vnd.ms-fontobject",
         ".map": "application/json",
         ".webp": "image/webp",
+        ".avif": "image/avif",
         ".mp4": "video/mp4",
         ".webm": "video/webm",
+        ".mp3": "audio/mpeg",
+        ".wasm": "application/wasm",
+        ".pdf": "application/pdf",
     }
 
     # Cache control settings by file type
@@ -48,12 +126,44 @@ class FrontendDeployer(BaseDeployer):
         "default": "public, max-age=86400",  # 1 day default
     }
 
+    # Content types stored gzip-encoded; CloudFront serves them as-is
+    COMPRESSIBLE_TYPES = {
+        "text/html",
+        "text/css",
+        "text/plain",
+        "text/csv",
+        "application/javascript",
+        "application/json",
+        "application/manifest+json",
+        "application/xml",
+        "image/svg+xml",
+    }
+
+    # Only keep the compressed body if it saves at least 10%
+    MIN_COMPRESSION_RATIO = 0.9
+
+    # Default concurrent uploads; the S3 client pool is sized above this
+    UPLOAD_WORKERS = 16
+
+    # Seconds between upload progress lines
+    PROGRESS_INTERVAL = 2.0
+
+    # Files at or above the threshold go through the transfer manager as
+    # multipart uploads in 16 MB parts; smaller ones are a single PUT
+    TRANSFER_CONFIG = TransferConfig(
+        multipart_threshold=8 * 1024 * 1024,
+        multipart_chunksize=16 * 1024 * 1024,
+        max_concurrency=8,
+        use_threads=True,
+    )
+
     def __init__(
         self,
         project_name: str,
         environment: str,
         build_env: Optional[Dict[str, str]] = None,
         skip_build: bool = False,
+        upload_workers: Optional[int] = None,
         **kwargs,
     ):
         """
@@ -64,27 +174,48 @@ class FrontendDeployer(BaseDeployer):
             environment: Deployment environment
             build_env: Environment variables for build
             skip_build: Skip the build step
+            upload_workers: Concurrent S3 uploads (defaults to UPLOAD_WORKERS)
             **kwargs: Additional arguments for BaseDeployer
         """
         super().__init__(project_name, environment, **kwargs)
         self.build_env = build_env or {}
         self.skip_build = skip_build
+        self.upload_workers = upload_workers or self.UPLOAD_WORKERS
+
+        # Keys written by the last upload_to_s3 call
+        self.changed_keys: List[str] = []
 
         # Get project directory
         self.project_dir = Path.cwd() / ".." / project_name
         if not self.project_dir.exists():
             self.project_dir = Path.cwd()
 
+    @property
+    def s3(self) -> Any:
+        """
+        Get S3 client tuned for parallel uploads.
+
+        Builds on CLIENT_CONFIG, whose adaptive retries back off and
+        rate-limit on SlowDown, RequestTimeout and InternalError responses.
+        The connection pool is sized at twice the worker count so multipart
+        parts and HEAD checks never wait for a free connection.
+        """
+        with self._client_lock:
+            if "s3" not in self._clients:
+                config = self.CLIENT_CONFIG.merge(
+                    Config(
+                        max_pool_connections=self.upload_workers * 2,
+                        s3={"addressing_style": "virtual"},
+                    )
+                )
+                self._clients["s3"] = self._session.client("s3", config=config)
+            return self._clients["s3"]
+
     def get_content_type(self, file_path: Path) -> str:
         """Get content type for a file."""
-        # Try our mapping first
-        ext = file_path.suffix.lower()
-        if ext in self.CONTENT_TYPES:
-            return self.CONTENT_TYPES[ext]
-
-        # Fall back to mimetypes
-        content_type, _ = mimetypes.guess_type(str(file_path))
-        return content_type or "application/octet-stream"
+        return self.CONTENT_TYPES.get(
+            file_path.suffix.lower(), "application/octet-stream"
+        )
 
     def get_cache_control(self, file_path: Path) -> str:
         """Get cache control header for a file."""
@@ -102,6 +233,39 @@ class FrontendDeployer(BaseDeployer):
 
         return self.CACHE_CONTROL["default"]
 
+    @cached_property
+    def _ext_table(self) -> Dict[str, Tuple[str, str]]:
+        """(content type, cache control) by lowercase extension."""
+        return {
+            ext: (content_type, self.get_cache_control(Path("file" + ext)))
+            for ext, content_type in self.CONTENT_TYPES.items()
+        }
+
+    def classify(self, s3_key: str) -> Tuple[str, str]:
+        """
+        Get content type and cache control for an S3 key in one lookup.
+
+        Args:
+            s3_key: Object key, used for both the extension and static check
+
+        Returns:
+            Tuple of (content type, cache control)
+        """
+        name = s3_key[s3_key.rfind("/") + 1 :]
+        dot = name.rfind(".")
+        ext = name[dot:].lower() if dot > 0 else ""
+
+        entry = self._ext_table.get(ext)
+        if entry is None:
+            # Unknown extension: resolve once and remember it
+            path = Path(name)
+            entry = (self.get_content_type(path), self.get_cache_control(path))
+            self._ext_table[ext] = entry
+
+        if "/static/" in "/" + s3_key:
+            return entry[0], self.CACHE_CONTROL["static"]
+        return entry
+
     def build_frontend(self) -> bool:
         """Build the frontend application."""
         if self.skip_build:
@@ -111,7 +275,7 @@ class FrontendDeployer(BaseDeployer):
         self.log(f"Building {self.project_name} frontend...", "INFO")
 
         # Get API URL from stack outputs
-        stack_outputs = self.get_stack_outputs()
+        stack_outputs = self.stack_outputs
         api_url = stack_outputs.get("ApiGatewayUrl", "")
 
         # Set up build environment
@@ -149,98 +313,298 @@ class FrontendDeployer(BaseDeployer):
         self.log("Build completed successfully", "SUCCESS")
         return True
 
-    def get_build_files(self) -> List[Tuple[Path, str]]:
-        """Get list of files to upload with their S3 keys."""
+    def iter_build_files(self) -> Iterator[Tuple[Path, str]]:
+        """
+        Yield files to upload with their S3 keys as they are discovered.
+
+        Keys may repeat when several source directories contain the same
+        file; use get_build_files() for the deduplicated list.
+        """
         # Find build output directory
         build_dir = self.project_dir / self.config.frontend_dist_dir
 
         if not build_dir.exists():
             self.add_error(f"Build directory not found: {build_dir}")
-            return []
+            return
 
-        files = []
+        # (source directory, S3 key prefix) pairs to collect
+        sources: List[Tuple[Path, str]] = []
 
         # For Next.js static export
         if self.config.frontend_dist_dir == "out":
             # Include all files from out directory
-            for file_path in build_dir.rglob("*"):
-                if file_path.is_file():
-                    # Calculate S3 key (relative path from build_dir)
-                    s3_key = str(file_path.relative_to(build_dir))
-                    files.append((file_path, s3_key))
+            sources.append((build_dir, ""))
 
         # For Next.js with .next/static
         elif ".next" in self.config.frontend_dist_dir:
-            # Copy _next/static files
-            next_static = self.project_dir / ".next" / "static"
-            if next_static.exists():
-                for file_path in next_static.rglob("*"):
-                    if file_path.is_file():
-                        s3_key = "_next/static/" + str(
-                            file_path.relative_to(next_static)
-                        )
-                        files.append((file_path, s3_key))
-
-            # Copy public files
-            public_dir = self.project_dir / "public"
-            if public_dir.exists():
-                for file_path in public_dir.rglob("*"):
-                    if file_path.is_file():
-                        s3_key = str(file_path.relative_to(public_dir))
-                        files.append((file_path, s3_key))
-
-            # Copy exported HTML files if they exist
-            out_dir = self.project_dir / "out"
-            if out_dir.exists():
-                for file_path in out_dir.rglob("*"):
-                    if file_path.is_file():
-                        s3_key = str(file_path.relative_to(out_dir))
-                        files.append((file_path, s3_key))
-
-        return files
-
-    def upload_to_s3(self, bucket_name: str, files: List[Tuple[Path, str]]) -> bool:
-        """Upload files to S3 bucket."""
-        self.log(f"Uploading {len(files)} files to S3 bucket {bucket_name}...", "INFO")
+            sources = [
+                # Copy _next/static files
+                (self.project_dir / ".next" / "static", "_next/static/"),
+                # Copy public files
+                (self.project_dir / "public", ""),
+                # Copy exported HTML files if they exist
+                (self.project_dir / "out", ""),
+            ]
+
+        for source_dir, prefix in sources:
+            if source_dir.is_dir():
+                for path, s3_key in _walk(str(source_dir), prefix):
+                    yield Path(path), s3_key
 
+    def get_build_files(self) -> List[Tuple[Path, str]]:
+        """Get list of files to upload with their S3 keys."""
+        # Keyed on S3 key so a file present in several sources is uploaded
+        # once; later sources (the exported pages) win
+        files = {s3_key: path for path, s3_key in self.iter_build_files()}
+        return [(path, s3_key) for s3_key, path in files.items()]
+
+    def upload_to_s3(self, bucket_name: str, files: Iterable[Tuple[Path, str]]) -> bool:
+        """
+        Upload files to S3 bucket.
+
+        In dry-run mode only the first few entries of ``files`` are consumed,
+        so a lazy iterable avoids walking the whole build.
+        """
         if self.dry_run:
-            self.log("DRY RUN: Would upload files to S3", "INFO")
-            for file_path, s3_key in files[:5]:  # Show first 5 files
-                self.log(f"  {s3_key} ({self.get_content_type(file_path)})", "DEBUG")
-            if len(files) > 5:
-                self.log(f"  ... and {len(files) - 5} more files", "DEBUG")
+            self.log(f"DRY RUN: Would upload files to S3 bucket {bucket_name}", "INFO")
+            preview = list(itertools.islice(files, 6))
+            for file_path, s3_key in preview[:5]:  # Show first 5 files
+                self.log(f"  {s3_key} ({self.classify(s3_key)[0]})", "DEBUG")
+            if len(preview) > 5:
+                self.log("  ... and more files", "DEBUG")
             return True
 
-        upload_count = 0
+        files = list(files)
+        self.log(f"Uploading {len(files)} files to S3 bucket {bucket_name}...", "INFO")
+
+        # Create the shared client before the workers race to do it
+        s3 = self.s3
+        remote = self._list_remote_objects(s3, bucket_name)
+
+        # Immutable hashed assets go first so the new HTML never references
+        # files that are not in the bucket yet
+        static_cache = self.CACHE_CONTROL["static"]
+        static_files, other_files = [], []
         for file_path, s3_key in files:
+            if self.classify(s3_key)[1] == static_cache:
+                static_files.append((file_path, s3_key))
+            else:
+                other_files.append((file_path, s3_key))
+
+        self.changed_keys = []
+        upload_count = 0
+        skipped_count = 0
+        failed_count = 0
+        done = 0
+        last_report = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.upload_workers) as executor:
+            for batch in (static_files, other_files):
+                if failed_count:
+                    # Keep serving the previous pages rather than new pages
+                    # with missing assets
+                    self.log(
+                        f"Skipping {len(batch)} files after asset upload failures",
+                        "ERROR",
+                    )
+                    break
+
+                futures = {
+                    executor.submit(
+                        self._upload_one, s3, bucket_name, file_path, s3_key, remote
+                    ): s3_key
+                    for file_path, s3_key in batch
+                }
+                for future in as_completed(futures):
+                    done += 1
+                    try:
+                        if future.result():
+                            upload_count += 1
+                            self.changed_keys.append(futures[future])
+                        else:
+                            skipped_count += 1
+                    except Exception as e:
+                        self.add_error(f"Failed to upload {futures[future]}: {e}")
+                        failed_count += 1
+
+                    # Progress indicator, throttled by time rather than file count
+                    now = time.monotonic()
+                    if now - last_report >= self.PROGRESS_INTERVAL:
+                        self.log(f"Processed {done}/{len(files)} files...", "INFO")
+                        last_report = now
+
+        if failed_count:
+            self.log(f"Uploaded {upload_count} files, {failed_count} failed", "ERROR")
+            return False
+
+        self.log(
+            f"Successfully uploaded {upload_count} files "
+            f"({skipped_count} unchanged)",
+            "SUCCESS",
+        )
+        return True
+
+    def _list_remote_objects(
+        self, s3: Any, bucket_name: str
+    ) -> Optional[Dict[str, Tuple[str, int]]]:
+        """
+        List the ETag and size of every object in the bucket.
+
+        One paginated listing costs a request per 1000 keys instead of a
+        HEAD per file.
+
+        Returns:
+            Mapping of key to (ETag, size), or None if the bucket cannot be
+            listed and objects must be checked individually
+        """
+        remote: Dict[str, Tuple[str, int]] = {}
+        try:
+            paginator = s3.get_paginator("list_objects_v2")
+            for page in paginator.paginate(Bucket=bucket_name):
+                for obj in page.get("Contents", []):
+                    remote[obj["Key"]] = (obj["ETag"].strip('"'), obj["Size"])
+        except ClientError as e:
+            self.add_warning(
+                f"Cannot list {bucket_name}, checking files one by one: {e}"
+            )
+            return None
+        return remote
+
+    def _needs_upload(
+        self,
+        s3: Any,
+        bucket_name: str,
+        s3_key: str,
+        size: int,
+        md5: Callable[[], str],
+        remote: Optional[Dict[str, Tuple[str, int]]] = None,
+        part_etag: Optional[Callable[[], str]] = None,
+    ) -> bool:
+        """
+        Check whether the object in S3 differs from the body we would upload.
+
+        ``md5`` and ``part_etag`` compute the local single-part and multipart
+        ETags; they are only called when the sizes match.
+        """
+        if remote is not None:
+            if s3_key not in remote:
+                return True
+            etag, remote_size = remote[s3_key]
+        else:
             try:
-                content_type = self.get_content_type(file_path)
-                cache_control = self.get_cache_control(file_path)
-
-                # Read file
-                with open(file_path, "rb") as f:
-                    file_content = f.read()
-
-                # Upload to S3
-                self.s3.put_object(
-                    Bucket=bucket_name,
-                    Key=s3_key,
-                    Body=file_content,
-                    ContentType=content_type,
-                    CacheControl=cache_control,
-                )
+                response = s3.head_object(Bucket=bucket_name, Key=s3_key)
+            except ClientError:
+                return True
+            etag, remote_size = response["ETag"].strip('"'), response["ContentLength"]
+
+        # Size is free to compare and rules out most changed files
+        if remote_size != size:
+            return True
+
+        # Multipart ETags are "<md5 of part md5s>-<part count>"
+        if "-" in etag:
+            return part_etag is None or etag != part_etag()
+        return bool(etag != md5())
+
+    def _compress(self, path: str, size: int, content_type: str) -> Optional[bytes]:
+        """
+        Gzip a text asset if that makes it meaningfully smaller.
+
+        Files at or above the multipart threshold are left to the streaming
+        upload path. ``mtime=0`` keeps the output, and so its ETag, stable
+        across builds.
 
-                upload_count += 1
+        Returns:
+            Compressed body, or None to upload the file unchanged
+        """
+        if content_type not in self.COMPRESSIBLE_TYPES:
+            return None
+        if size == 0 or size >= self.TRANSFER_CONFIG.multipart_threshold:
+            return None
+
+        # Compress from the page cache instead of copying the file into bytes
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                body = gzip.compress(data, compresslevel=6, mtime=0)
+        if len(body) > size * self.MIN_COMPRESSION_RATIO:
+            return None
+        return body
+
+    def _upload_one(
+        self,
+        s3: Any,
+        bucket_name: str,
+        file_path: Path,
+        s3_key: str,
+        remote: Optional[Dict[str, Tuple[str, int]]] = None,
+    ) -> bool:
+        """
+        Upload a single file unless S3 already has it; runs on a worker thread.
 
-                # Progress indicator
-                if upload_count % 50 == 0:
-                    self.log(f"Uploaded {upload_count}/{len(files)} files...", "INFO")
+        ``remote`` is the bucket listing from _list_remote_objects; without
+        it each file is checked with a HEAD request.
 
-            except Exception as e:
-                self.add_error(f"Failed to upload {s3_key}: {e}")
+        Returns:
+            True if the file was uploaded, False if it was unchanged
+        """
+        # Resolve everything derived from the path once per file
+        content_type, cache_control = self.classify(s3_key)
+        path = str(file_path)
+        size = os.stat(path).st_size
+
+        body = self._compress(path, size, content_type)
+        if body is not None:
+            if not self._needs_upload(
+                s3,
+                bucket_name,
+                s3_key,
+                len(body),
+                lambda: hashlib.md5(body).hexdigest(),
+                remote,
+            ):
                 return False
 
-        self.log(f"Successfully uploaded {upload_count} files", "SUCCESS")
+            s3.put_object(
+                Bucket=bucket_name,
+                Key=s3_key,
+                Body=body,
+                ContentType=content_type,
+                CacheControl=cache_control,
+                ContentEncoding="gzip",
+            )
+            return True
+
+        if not self._needs_upload(
+            s3,
+            bucket_name,
+            s3_key,
+            size,
+            lambda: file_md5(path),
+            remote,
+            lambda: multipart_etag(path, self.TRANSFER_CONFIG.multipart_chunksize),
+        ):
+            return False
+
+        if size >= self.TRANSFER_CONFIG.multipart_threshold:
+            # Parts are read from disk as they are sent, so memory stays
+            # bounded by chunk size times concurrency
+            s3.upload_file(
+                path,
+                bucket_name,
+                s3_key,
+                ExtraArgs={"ContentType": content_type, "CacheControl": cache_control},
+                Config=self.TRANSFER_CONFIG,
+            )
+            return True
+
+        # Small files skip the transfer manager's per-call thread pool
+        with open(path, "rb") as f:
+            s3.put_object(
+                Bucket=bucket_name,
+                Key=s3_key,
+                Body=f,
+                ContentType=content_type,
+                CacheControl=cache_control,
+            )
         return True
 
     def configure_s3_website(self, bucket_name: str) -> bool:
@@ -268,9 +632,35 @@ class FrontendDeployer(BaseDeployer):
             self.add_error(f"Failed to configure website hosting: {e}")
             return False
 
-    def invalidate_cloudfront(self, distribution_id: str) -> bool:
-        """Create CloudFront invalidation."""
-        self.log("Creating CloudFront invalidation...", "INFO")
+    def invalidate_cloudfront(
+        self, distribution_id: str, changed_keys: Optional[Iterable[str]] = None
+    ) -> bool:
+        """
+        Create CloudFront invalidation.
+
+        Args:
+            distribution_id: CloudFront distribution ID
+            changed_keys: S3 keys that changed; invalidates everything if None
+
+        Returns:
+            True if the invalidation was created or nothing needed it
+        """
+        if changed_keys is None:
+            paths = ["/*"]
+        else:
+            # Hashed immutable assets get new names, so edges never hold
+            # stale copies of them
+            static_cache = self.CACHE_CONTROL["static"]
+            paths = build_invalidation_paths(
+                key for key in changed_keys if self.classify(key)[1] != static_cache
+            )
+            if not paths:
+                self.log("No changed pages, skipping CloudFront invalidation", "INFO")
+                return True
+
+        self.log(
+            f"Creating CloudFront invalidation for {len(paths)} path(s)...", "INFO"
+        )
 
         if self.dry_run:
             self.log("DRY RUN: Would create CloudFront invalidation", "INFO")
@@ -282,7 +672,7 @@ class FrontendDeployer(BaseDeployer):
             response = cloudfront.create_invalidation(
                 DistributionId=distribution_id,
                 InvalidationBatch={
-                    "Paths": {"Quantity": 1, "Items": ["/*"]},
+                    "Paths": {"Quantity": len(paths), "Items": paths},
                     "CallerReference": f"{self.project_name}-{self.environment}-{int(time.time())}",
                 },
             )
@@ -315,7 +705,7 @@ class FrontendDeployer(BaseDeployer):
             )
 
         # Get S3 bucket and CloudFront distribution from stack outputs
-        stack_outputs = self.get_stack_outputs()
+        stack_outputs = self.stack_outputs
 
         frontend_bucket = stack_outputs.get("FrontendBucketName")
         if not frontend_bucket:
@@ -326,8 +716,16 @@ class FrontendDeployer(BaseDeployer):
 
         distribution_id = stack_outputs.get("CloudFrontDistributionId")
 
-        # Get files to upload
-        files = self.get_build_files()
+        # Get files to upload; a dry run only previews the first few, so
+        # discovery is left lazy instead of walking the whole build
+        files: Iterable[Tuple[Path, str]]
+        if self.dry_run:
+            discovered = self.iter_build_files()
+            first = next(discovered, None)
+            files = itertools.chain([first], discovered) if first else []
+        else:
+            files = self.get_build_files()
+
         if not files:
             return DeploymentResult(
                 status=DeploymentStatus.FAILED,
@@ -336,7 +734,8 @@ class FrontendDeployer(BaseDeployer):
                 errors=self.errors,
             )
 
-        self.log(f"Found {len(files)} files to upload", "INFO")
+        if isinstance(files, list):
+            self.log(f"Found {len(files)} files to upload", "INFO")
 
         # Upload to S3
         if not self.upload_to_s3(frontend_bucket, files):
@@ -360,7 +759,7 @@ class FrontendDeployer(BaseDeployer):
 
         # Invalidate CloudFront if available
         if distribution_id:
-            if not self.invalidate_cloudfront(distribution_id):
+            if not self.invalidate_cloudfront(distribution_id, self.changed_keys):
                 # Invalidation failure is not critical
                 self.add_warning(
                     "CloudFront invalidation failed, content may be cached"
@@ -368,7 +767,7 @@ class FrontendDeployer(BaseDeployer):
 
         # Add deployment info to outputs
         self.add_output("FrontendBucket", frontend_bucket)
-        self.add_output("FilesUploaded", len(files))
+        self.add_output("FilesUploaded", len(self.changed_keys))
 
         if distribution_id:
             cloudfront_url = stack_outputs.get("CloudFrontDomainName", "")
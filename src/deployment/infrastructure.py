@@ -2,19 +2,76 @@
 Infrastructure deployment using CloudFormation.
 """
 
+import hashlib
 import json
+import math
 import os
+import random
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Set, Tuple, Union
 
 import yaml
+from botocore.exceptions import ClientError
 
 from .base_deployer import BaseDeployer, DeploymentResult, DeploymentStatus
 
+# Prefer the LibYAML-backed loader; safe_load silently uses the pure-Python one
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
+# CloudFormation rejects inline TemplateBody values at or above this size
+MAX_INLINE_TEMPLATE_BYTES = 51200
+
+# Template file names searched for in each candidate directory, in priority order
+TEMPLATE_FILENAMES = ("template.yaml", "template.yml", "template.json")
+
+# Default stack wait budget; CloudFront distributions alone can take 10+ minutes
+STACK_WAIT_SECONDS = 3600
+
+# Longest gap between stack status polls once a stack stops changing
+MAX_POLL_DELAY_SECONDS = 30
+
+
+@lru_cache(maxsize=1)
+def _cdk_executable() -> str:
+    """Resolve the cdk CLI once rather than searching PATH on every call."""
+    return shutil.which("cdk") or "cdk"
+
+
+class _CfnYamlLoader(YamlLoader):  # type: ignore[misc,valid-type]
+    """YAML loader that accepts CloudFormation short-form tags like !Ref."""
+
+
+_CfnYamlLoader.add_multi_constructor("!", lambda loader, suffix, node: None)
+
 
 class InfrastructureDeployer(BaseDeployer):
     """Deploy infrastructure using CloudFormation."""
 
+    # Seconds a DescribeStacks sweep of the account is reused for status checks
+    STACK_STATUS_TTL = 1.0
+
+    # Shared by all deployers so concurrent waits in one account and region
+    # make a single DescribeStacks sweep per polling tick
+    _stack_status_cache: Dict[
+        Tuple[str, Optional[str]], Tuple[float, Dict[str, str]]
+    ] = {}
+    _stack_status_lock = threading.Lock()
+
+    # Stack waits in progress per account and region; a lone wait polls its
+    # own stack rather than paginating every stack in the account
+    _stack_waiters: Dict[Tuple[str, Optional[str]], int] = {}
+
+    # Accounts and regions whose credentials may not list every stack
+    _stack_listing_denied: Set[Tuple[str, Optional[str]]] = set()
+
     def __init__(
         self,
         project_name: str,
@@ -22,6 +79,8 @@ class InfrastructureDeployer(BaseDeployer):
         template_path: Optional[Union[str, Path]] = None,
         parameters: Optional[Dict[str, str]] = None,
         tags: Optional[Dict[str, str]] = None,
+        poll_delay_seconds: int = 3,
+        max_attempts: Optional[int] = None,
         **kwargs,
     ):
         """
@@ -33,12 +92,19 @@ class InfrastructureDeployer(BaseDeployer):
             template_path: Path to CloudFormation template
             parameters: CloudFormation parameters
             tags: Tags to apply to stack
+            poll_delay_seconds: Initial seconds between stack status polls
+            max_attempts: Polls before giving up (defaults to one hour's worth)
             **kwargs: Additional arguments for BaseDeployer
         """
         super().__init__(project_name, environment, **kwargs)
         self.template_path = Path(template_path) if template_path else None
         self.parameters = parameters or {}
         self.tags = tags or {}
+        self.template_bucket: Optional[str] = None
+        self.poll_delay_seconds = poll_delay_seconds
+        self.max_attempts = max_attempts or math.ceil(
+            STACK_WAIT_SECONDS / poll_delay_seconds
+        )
 
         # Add default tags
         self.tags.update(
@@ -54,37 +120,52 @@ class InfrastructureDeployer(BaseDeployer):
         if self.template_path and self.template_path.exists():
             return self.template_path
 
-        # Look for template in common locations
-        project_dir = Path.cwd() / ".." / self.project_name
-        possible_paths = [
-            project_dir / "infrastructure" / "template.yaml",
-            project_dir / "infrastructure" / "template.yml",
-            project_dir / "infrastructure" / "template.json",
-            project_dir / "cloudformation" / "template.yaml",
-            project_dir / "cloudformation" / "template.yml",
-            project_dir / "cloudformation" / "template.json",
-            project_dir / "template.yaml",
-            project_dir / "template.yml",
-            project_dir / "template.json",
-        ]
+        # Look for template in common locations, one directory listing each
+        project_dir = self.project_dir
+        for directory in (
+            project_dir / "infrastructure",
+            project_dir / "cloudformation",
+            project_dir,
+        ):
+            try:
+                with os.scandir(directory) as entries:
+                    names = {entry.name for entry in entries if entry.is_file()}
+            except (FileNotFoundError, NotADirectoryError):
+                continue
 
-        for path in possible_paths:
-            if path.exists():
-                self.log(f"Found template at {path}", "INFO")
-                return path
+            for name in TEMPLATE_FILENAMES:
+                if name in names:
+                    path = directory / name
+                    self.log(f"Found template at {path}", "INFO")
+                    return path
 
         return None
 
-    def load_template(self, template_path: Path) -> str:
-        """Load CloudFormation template as string."""
-        with open(template_path, "r") as f:
+    def load_template(self, template_path: Path, validate: bool = False) -> str:
+        """
+        Load CloudFormation template as string.
+
+        CloudFormation accepts YAML and JSON template bodies, so the file is
+        passed through unchanged rather than converted.
+
+        Args:
+            template_path: Path to a .yaml, .yml or .json template
+            validate: Parse the template first so syntax errors surface
+                locally instead of from the CloudFormation API
+
+        Returns:
+            Template body exactly as stored on disk
+        """
+        with open(template_path, "r", encoding="utf-8") as f:
+            template_body = f.read()
+
+        if validate:
             if template_path.suffix == ".json":
-                # Already JSON
-                return f.read()
+                json.loads(template_body)
             else:
-                # Convert YAML to JSON
-                template_data = yaml.safe_load(f)
-                return json.dumps(template_data, indent=2)
+                yaml.load(template_body, Loader=_CfnYamlLoader)
+
+        return template_body
 
     def prepare_lambda_buckets(self) -> bool:
         """Create S3 buckets for Lambda deployment using rotation strategy."""
@@ -100,49 +181,129 @@ class InfrastructureDeployer(BaseDeployer):
             account_id=account_id,
         )
 
-        try:
-            # Create new Lambda bucket using rotation
-            lambda_bucket = rotation_manager.rotate_and_create()
-            self.log(f"Created Lambda bucket: {lambda_bucket}", "SUCCESS")
-
-            # Store the bucket name for later use
-            self._lambda_bucket_name = lambda_bucket
-
-        except Exception as e:
-            self.add_error(f"Failed to create Lambda bucket: {e}")
-            return False
-
-        # Create deployment bucket (non-rotating)
+        # Create deployment bucket (non-rotating) alongside the Lambda bucket
         deployment_bucket = self.config.format_name(
             self.config.deployment_bucket_pattern, environment=self.environment
         )
 
-        if not self.create_s3_bucket_if_needed(deployment_bucket):
-            return False
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            deployment_future = executor.submit(
+                self.create_s3_bucket_if_needed, deployment_bucket
+            )
 
-        return True
+            try:
+                # Create new Lambda bucket using rotation
+                lambda_bucket = rotation_manager.rotate_and_create()
+                self.log(f"Created Lambda bucket: {lambda_bucket}", "SUCCESS")
+
+                # Store the bucket name for later use
+                self._lambda_bucket_name = lambda_bucket
+
+            except Exception as e:
+                self.add_error(f"Failed to create Lambda bucket: {e}")
+                return False
+
+        return deployment_future.result()
 
     def prepare_parameters(self) -> list[Dict[str, str]]:
         """Prepare CloudFormation parameters."""
-        cf_params = []
+        # Environment parameter first, then any additional parameters
+        return [{"ParameterKey": "Environment", "ParameterValue": self.environment}] + [
+            {"ParameterKey": key, "ParameterValue": str(value)}
+            for key, value in self.parameters.items()
+        ]
 
-        # Add environment parameter
-        cf_params.append(
-            {"ParameterKey": "Environment", "ParameterValue": self.environment}
+    def prepare_tags(self) -> list[Dict[str, str]]:
+        """Prepare CloudFormation tags."""
+        return [{"Key": key, "Value": str(value)} for key, value in self.tags.items()]
+
+    def get_template_bucket(self) -> str:
+        """Get the bucket used to stage templates too large to send inline."""
+        if self.template_bucket:
+            return self.template_bucket
+        self.get_account_id()
+        return self.config.format_name(
+            self.config.deployment_bucket_pattern, environment=self.environment
         )
 
-        # Add any additional parameters
-        for key, value in self.parameters.items():
-            cf_params.append({"ParameterKey": key, "ParameterValue": str(value)})
+    def get_template_source(
+        self, stack_name: str, template_body: str
+    ) -> Dict[str, str]:
+        """
+        Get the template argument for a create/update stack call.
 
-        return cf_params
+        Templates under the inline limit are passed as TemplateBody, skipping
+        the S3 round-trip. Larger templates are uploaded under a key derived
+        from their SHA256, so an identical template is only uploaded once.
 
-    def prepare_tags(self) -> list[Dict[str, str]]:
-        """Prepare CloudFormation tags."""
-        cf_tags = []
-        for key, value in self.tags.items():
-            cf_tags.append({"Key": key, "Value": str(value)})
-        return cf_tags
+        Returns:
+            Either {"TemplateBody": ...} or {"TemplateURL": ...}
+        """
+        # ASCII text is one byte per character, so small ASCII templates skip
+        # building an encoded copy just to measure it
+        if template_body.isascii() and len(template_body) < MAX_INLINE_TEMPLATE_BYTES:
+            return {"TemplateBody": template_body}
+
+        encoded = template_body.encode()
+        if len(encoded) < MAX_INLINE_TEMPLATE_BYTES:
+            return {"TemplateBody": template_body}
+
+        bucket = self.get_template_bucket()
+        digest = hashlib.sha256(encoded).hexdigest()
+        key = f"templates/{stack_name}-{digest[:12]}.json"
+
+        try:
+            self.s3.head_object(Bucket=bucket, Key=key)
+        except ClientError:
+            self.log(f"Uploading template to s3://{bucket}/{key}", "INFO")
+            self.s3.put_object(Bucket=bucket, Key=key, Body=encoded)
+
+        return {"TemplateURL": f"https://{bucket}.s3.{self.region}.amazonaws.com/{key}"}
+
+    def check_stack_status(self, stack_name: str) -> Optional[str]:
+        """
+        Check CloudFormation stack status.
+
+        A single stack is described directly. While several stack waits poll
+        the same account and region they share one account-wide sweep per
+        STACK_STATUS_TTL instead.
+        """
+        key = (self.region, self.profile)
+        statuses: Optional[Dict[str, str]] = None
+        with self._stack_status_lock:
+            if (
+                self._stack_waiters.get(key, 0) > 1
+                and key not in self._stack_listing_denied
+            ):
+                fetched_at, statuses = self._stack_status_cache.get(key, (0.0, {}))
+                if time.monotonic() - fetched_at >= self.STACK_STATUS_TTL:
+                    statuses = self._sweep_stack_statuses(key)
+        if statuses is None:
+            return super().check_stack_status(stack_name)
+        return statuses.get(stack_name)
+
+    def _sweep_stack_statuses(
+        self, key: Tuple[str, Optional[str]]
+    ) -> Optional[Dict[str, str]]:
+        """List every stack's status; None if the account cannot be listed."""
+        statuses: Dict[str, str] = {}
+        try:
+            paginator = self.cloudformation.get_paginator("describe_stacks")
+            for page in paginator.paginate():
+                for stack in page.get("Stacks") or ():
+                    statuses[stack["StackName"]] = stack["StackStatus"]
+        except ClientError as e:
+            # Policies scoped to specific stacks will never be able to list
+            if e.response.get("Error", {}).get("Code") == "AccessDenied":
+                self._stack_listing_denied.add(key)
+            return None
+        self._stack_status_cache[key] = (time.monotonic(), statuses)
+        return statuses
+
+    def invalidate_stack_status(self) -> None:
+        """Drop the cached sweep so the next status check sees fresh state."""
+        with self._stack_status_lock:
+            self._stack_status_cache.pop((self.region, self.profile), None)
 
     def deploy_stack(
         self,
@@ -164,7 +325,7 @@ class InfrastructureDeployer(BaseDeployer):
                     try:
                         self.cloudformation.update_stack(
                             StackName=stack_name,
-                            TemplateBody=template_body,
+                            **self.get_template_source(stack_name, template_body),
                             Parameters=parameters,
                             Tags=tags,
                             Capabilities=[
@@ -173,9 +334,10 @@ class InfrastructureDeployer(BaseDeployer):
                                 "CAPABILITY_AUTO_EXPAND",
                             ],
                         )
+                        self.invalidate_stack_status()
 
                         # Wait for update
-                        if self.wait_for_stack(stack_name, "update"):
+                        if self._adaptive_wait(stack_name, "update"):
                             self.log(
                                 f"Stack {stack_name} updated successfully", "SUCCESS"
                             )
@@ -200,7 +362,7 @@ class InfrastructureDeployer(BaseDeployer):
                 if not self.dry_run:
                     self.cloudformation.create_stack(
                         StackName=stack_name,
-                        TemplateBody=template_body,
+                        **self.get_template_source(stack_name, template_body),
                         Parameters=parameters,
                         Tags=tags,
                         Capabilities=[
@@ -209,9 +371,10 @@ class InfrastructureDeployer(BaseDeployer):
                             "CAPABILITY_AUTO_EXPAND",
                         ],
                     )
+                    self.invalidate_stack_status()
 
                     # Wait for creation
-                    if self.wait_for_stack(stack_name, "create"):
+                    if self._adaptive_wait(stack_name, "create"):
                         self.log(f"Stack {stack_name} created successfully", "SUCCESS")
                         return True
                     else:
@@ -224,8 +387,73 @@ class InfrastructureDeployer(BaseDeployer):
             self.add_error(f"Failed to deploy stack: {e}")
             return False
 
-    def generate_template(self) -> str:
-        """Generate CloudFormation template dynamically."""
+    def _adaptive_wait(self, stack_name: str, operation: str = "create") -> bool:
+        """
+        Wait for a stack operation, polling quickly while its status changes.
+
+        Polling starts at poll_delay_seconds and doubles while the status stays
+        the same, up to MAX_POLL_DELAY_SECONDS. Rollback and review states go
+        straight to the cap. Sleeps are jittered by 20% either way so concurrent
+        deploys do not poll in lockstep.
+        """
+        if self.dry_run:
+            self.log(f"DRY RUN: Would wait for stack {operation}", "INFO")
+            return True
+
+        key = (self.region, self.profile)
+        with self._stack_status_lock:
+            self._stack_waiters[key] = self._stack_waiters.get(key, 0) + 1
+        try:
+            return self._poll_stack(stack_name, operation)
+        finally:
+            with self._stack_status_lock:
+                self._stack_waiters[key] -= 1
+
+    def _poll_stack(self, stack_name: str, operation: str) -> bool:
+        """Poll a stack until its operation completes, fails or times out."""
+        complete_status = f"{operation.upper()}_COMPLETE"
+        deadline = time.monotonic() + self.max_attempts * self.poll_delay_seconds
+        delay = self.poll_delay_seconds
+        last_status: Optional[str] = None
+
+        while True:
+            try:
+                status = self.check_stack_status(stack_name)
+            except ClientError as e:
+                self.add_error(f"Stack {operation} failed: {e}")
+                return False
+
+            if status == complete_status:
+                return True
+            if not status or not status.endswith("_IN_PROGRESS"):
+                self.add_error(
+                    f"Stack {operation} failed: stack is {status or 'deleted'}"
+                )
+                self.report_stack_failure(stack_name)
+                return False
+            if time.monotonic() >= deadline:
+                self.add_error(f"Stack {operation} timed out in {status}")
+                return False
+
+            if "ROLLBACK" in status or status == "REVIEW_IN_PROGRESS":
+                delay = MAX_POLL_DELAY_SECONDS
+            elif status != last_status:
+                delay = self.poll_delay_seconds
+            else:
+                delay = min(delay * 2, MAX_POLL_DELAY_SECONDS)
+            last_status = status
+
+            time.sleep(delay * random.uniform(0.8, 1.2))
+
+    def generate_template(self, fmt: Optional[str] = None) -> str:
+        """
+        Generate CloudFormation template dynamically.
+
+        Args:
+            fmt: "json" for compact JSON or "yaml" for readable YAML. Defaults
+                to YAML only when the template is saved for review (dry run or
+                SAVE_GENERATED_TEMPLATE), since YAML is rendered via JSON
+        """
         # Import the appropriate pattern based on project
         if self.project_name == "media-register":
             # Use cost-optimized serverless pattern without VPC
@@ -238,8 +466,13 @@ class InfrastructureDeployer(BaseDeployer):
 
             pattern = CloudFrontLambdaAppPattern(self.config, self.environment)
 
-        # Generate template as YAML string
-        return pattern.to_yaml()
+        if fmt is None:
+            saved = self.dry_run or os.environ.get("SAVE_GENERATED_TEMPLATE")
+            fmt = "yaml" if saved else "json"
+
+        if fmt == "yaml":
+            return pattern.to_yaml()
+        return pattern.template.to_json(indent=None, separators=(",", ":"))
 
     def deploy(self) -> DeploymentResult:
         """Execute infrastructure deployment."""
@@ -248,65 +481,73 @@ class InfrastructureDeployer(BaseDeployer):
             "INFO",
         )
 
-        # Try to find existing template first
-        template_path = self.find_template()
-
-        if template_path:
-            # Load template from file
-            try:
-                template_body = self.load_template(template_path)
-            except Exception as e:
-                return DeploymentResult(
-                    status=DeploymentStatus.FAILED,
-                    message=f"Failed to load template: {e}",
-                    duration=0,
-                    errors=[str(e)],
-                )
-        else:
-            # Generate template dynamically
-            self.log(
-                "No template file found, generating template dynamically...", "INFO"
-            )
-            try:
-                # If we have a rotating Lambda bucket, set it as environment variable
-                if hasattr(self, "_lambda_bucket_name"):
-                    os.environ["LAMBDA_S3_BUCKET"] = self._lambda_bucket_name
-                    self.log(
-                        f"Using rotating Lambda bucket: {self._lambda_bucket_name}",
-                        "INFO",
+        # Bucket setup does not depend on a template file, so it runs while the
+        # template is loaded and any failed stack is cleaned up
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            buckets_future = executor.submit(self.prepare_lambda_buckets)
+
+            # Try to find existing template first
+            template_path = self.find_template()
+
+            if template_path:
+                # Load template from file
+                try:
+                    template_body = self.load_template(template_path)
+                except Exception as e:
+                    return DeploymentResult(
+                        status=DeploymentStatus.FAILED,
+                        message=f"Failed to load template: {e}",
+                        duration=0,
+                        errors=[str(e)],
                     )
+            else:
+                # Generate template dynamically
+                self.log(
+                    "No template file found, generating template dynamically...", "INFO"
+                )
+                try:
+                    # Generated templates reference the rotating Lambda bucket
+                    buckets_future.result()
+
+                    # If we have a rotating Lambda bucket, set it as environment variable
+                    if hasattr(self, "_lambda_bucket_name"):
+                        os.environ["LAMBDA_S3_BUCKET"] = self._lambda_bucket_name
+                        self.log(
+                            f"Using rotating Lambda bucket: {self._lambda_bucket_name}",
+                            "INFO",
+                        )
 
-                template_body = self.generate_template()
+                    template_body = self.generate_template()
+
+                    # Save generated template for debugging
+                    if self.dry_run or os.environ.get("SAVE_GENERATED_TEMPLATE"):
+                        template_file = f"generated-template-{self.environment}.yaml"
+                        with open(template_file, "w", encoding="utf-8") as f:
+                            f.write(template_body)
+                        self.log(f"Saved generated template to {template_file}", "INFO")
+
+                except Exception as e:
+                    return DeploymentResult(
+                        status=DeploymentStatus.FAILED,
+                        message=f"Failed to generate template: {e}",
+                        duration=0,
+                        errors=[str(e)],
+                    )
 
-                # Save generated template for debugging
-                if self.dry_run or os.environ.get("SAVE_GENERATED_TEMPLATE"):
-                    template_file = f"generated-template-{self.environment}.yaml"
-                    with open(template_file, "w") as f:
-                        f.write(template_body)
-                    self.log(f"Saved generated template to {template_file}", "INFO")
+            # Get stack name
+            stack_name = self.get_stack_name()
 
-            except Exception as e:
+            # Clean up failed stack if necessary
+            if not self.clean_failed_stack(stack_name):
                 return DeploymentResult(
                     status=DeploymentStatus.FAILED,
-                    message=f"Failed to generate template: {e}",
+                    message="Failed to clean up existing failed stack",
                     duration=0,
-                    errors=[str(e)],
+                    errors=self.errors,
                 )
 
-        # Get stack name
-        stack_name = self.get_stack_name()
-
-        # Clean up failed stack if necessary
-        if not self.clean_failed_stack(stack_name):
-            return DeploymentResult(
-                status=DeploymentStatus.FAILED,
-                message="Failed to clean up existing failed stack",
-                duration=0,
-                errors=self.errors,
-            )
-
-        # Prepare Lambda buckets
-        if not self.prepare_lambda_buckets():
+        # Wait for Lambda buckets
+        if not buckets_future.result():
             return DeploymentResult(
                 status=DeploymentStatus.FAILED,
                 message="Failed to prepare S3 buckets",
@@ -347,6 +588,12 @@ class InfrastructureDeployer(BaseDeployer):
 class CDKInfrastructureDeployer(InfrastructureDeployer):
     """Deploy infrastructure using AWS CDK."""
 
+    # Per-process memo of checks that do not change between deploys: cdk
+    # executables that answered --version, and bootstrapped (account, region)
+    _verified_cdk: set[str] = set()
+    _bootstrapped: set[Tuple[str, str]] = set()
+    _bootstrap_lock = threading.Lock()
+
     def __init__(
         self,
         project_name: str,
@@ -366,7 +613,7 @@ class CDKInfrastructureDeployer(InfrastructureDeployer):
             **kwargs: Additional arguments for BaseDeployer
         """
         super().__init__(project_name, environment, **kwargs)
-        self.app_path = Path(app_path) if app_path else Path.cwd() / ".." / project_name
+        self.app_path = Path(app_path) if app_path else self.project_dir
         self.context = context or {}
 
         # Add environment to context
@@ -378,12 +625,16 @@ class CDKInfrastructureDeployer(InfrastructureDeployer):
             return False
 
         # Check CDK is installed
-        return_code, stdout, stderr = self.run_command(["cdk", "--version"])
-        if return_code != 0:
-            self.add_error(
-                "AWS CDK is not installed. Install with: npm install -g aws-cdk"
-            )
-            return False
+        executable = _cdk_executable()
+        if executable not in self._verified_cdk:
+            return_code, stdout, stderr = self.run_command([executable, "--version"])
+            if return_code != 0:
+                self.add_error(
+                    "AWS CDK is not installed. Install with: npm install -g aws-cdk"
+                )
+                return False
+            if not self.dry_run:
+                self._verified_cdk.add(executable)
 
         # Check CDK app exists
         cdk_json = self.app_path / "cdk.json"
@@ -397,29 +648,39 @@ class CDKInfrastructureDeployer(InfrastructureDeployer):
         """Bootstrap CDK if needed."""
         self.log("Checking CDK bootstrap...", "INFO")
 
-        # Check if bootstrap stack exists
-        bootstrap_stack = f"CDKToolkit"
-        status = self.check_stack_status(bootstrap_stack)
+        # Concurrent deployers in one account and region check (and if needed
+        # bootstrap) once; the rest wait and reuse the result
+        environment = (self.get_account_id(), self.region)
+        with self._bootstrap_lock:
+            if environment in self._bootstrapped:
+                return True
 
-        if not status:
-            self.log("Bootstrapping CDK...", "INFO")
+            # Check if bootstrap stack exists
+            bootstrap_stack = "CDKToolkit"
+            status = self.check_stack_status(bootstrap_stack)
 
-            if not self.dry_run:
-                return_code, stdout, stderr = self.run_command(
-                    [
-                        "cdk",
-                        "bootstrap",
-                        f"aws://{self.get_account_id()}/{self.region}",
-                    ],
-                    cwd=self.app_path,
-                )
+            if not status:
+                self.log("Bootstrapping CDK...", "INFO")
 
-                if return_code != 0:
-                    self.add_error(f"CDK bootstrap failed: {stderr}")
-                    return False
-            else:
-                self.log("DRY RUN: Would bootstrap CDK", "INFO")
+                if not self.dry_run:
+                    return_code, stdout, stderr = self.run_command(
+                        [
+                            _cdk_executable(),
+                            "bootstrap",
+                            f"aws://{environment[0]}/{environment[1]}",
+                        ],
+                        cwd=self.app_path,
+                    )
+
+                    if return_code != 0:
+                        self.add_error(f"CDK bootstrap failed: {stderr}")
+                        return False
+                else:
+                    self.log("DRY RUN: Would bootstrap CDK", "INFO")
+                    return True
 
+            if environment[0] != "unknown":
+                self._bootstrapped.add(environment)
         return True
 
     def deploy(self) -> DeploymentResult:
@@ -438,19 +699,20 @@ class CDKInfrastructureDeployer(InfrastructureDeployer):
                 errors=self.errors,
             )
 
-        # Prepare CDK command
-        cdk_cmd = ["cdk", "deploy", "--require-approval", "never"]
-
-        # Add context
-        for key, value in self.context.items():
-            cdk_cmd.extend(["-c", f"{key}={value}"])
-
-        # Add profile if specified
-        if self.profile:
-            cdk_cmd.extend(["--profile", self.profile])
-
-        # Add stack name pattern
-        cdk_cmd.append(f"{self.project_name}-{self.environment}-*")
+        # Prepare CDK command: context, profile if specified, stack name pattern
+        cdk_cmd = [
+            _cdk_executable(),
+            "deploy",
+            "--require-approval",
+            "never",
+            *(
+                arg
+                for key, value in self.context.items()
+                for arg in ("-c", f"{key}={value}")
+            ),
+            *(("--profile", self.profile) if self.profile else ()),
+            f"{self.project_name}-{self.environment}-*",
+        ]
 
         # Run CDK deploy
         if not self.dry_run:
@@ -479,9 +741,15 @@ class CDKInfrastructureDeployer(InfrastructureDeployer):
         else:
             # Dry run - just synthesize
             self.log("DRY RUN: Synthesizing CDK app...", "INFO")
-            synth_cmd = ["cdk", "synth"]
-            for key, value in self.context.items():
-                synth_cmd.extend(["-c", f"{key}={value}"])
+            synth_cmd = [
+                _cdk_executable(),
+                "synth",
+                *(
+                    arg
+                    for key, value in self.context.items()
+                    for arg in ("-c", f"{key}={value}")
+                ),
+            ]
 
             return_code, stdout, stderr = self.run_command(synth_cmd, cwd=self.app_path)
 
@@ -3,123 +3,172 @@ Deployment configuration for Media Register application.
 """
 
 import os
-from typing import Any, Dict, Optional
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+# Environment variables read into the base configuration; their values are
+# part of the config cache key
+_ENV_KEYS = ("AWS_REGION", "AWS_ACCOUNT_ID", "CERTIFICATE_ARN")
+
+
+def _read_env() -> Tuple[Optional[str], ...]:
+    """Read the configuration environment variables."""
+    return tuple(os.environ.get(key) for key in _ENV_KEYS)
+
+
+# Base configuration shared by every environment
+_BASE_CONFIG: Mapping[str, Any] = MappingProxyType(
+    {
+        "app_name": "media-register",
+        "aws_region": "us-east-1",
+        "aws_account": "",
+        # Domain configuration
+        "domain_name": "media-register.com",
+        "certificate_arn": "",
+        # VPC configuration - disabled for cost optimization
+        # Lambda functions run without VPC to save ~$45/month
+        "enable_vpc": False,
+        "vpc_cidr": None,  # Not used
+        "enable_nat_gateway": False,  # Not used
+        "max_azs": 0,  # Not used
+        # Lambda configuration
+        "lambda_memory": 512,
+        "lambda_timeout": 30,
+        "lambda_runtime": "nodejs20.x",
+        # DynamoDB configuration
+        "dynamodb_billing_mode": "PAY_PER_REQUEST",
+        "enable_point_in_time_recovery": False,
+        # S3 configuration
+        "enable_s3_versioning": True,
+        "s3_lifecycle_days": 90,
+        # CloudFront configuration
+        "cloudfront_price_class": "PriceClass_100",
+        "cloudfront_min_ttl": 0,
+        "cloudfront_default_ttl": 86400,
+        "cloudfront_max_ttl": 31536000,
+        # API Gateway configuration
+        "api_throttle_rate_limit": 100,
+        "api_throttle_burst_limit": 200,
+        # Monitoring
+        "enable_detailed_monitoring": False,
+        "log_retention_days": 7,
+        # Security
+        "enable_waf": False,
+        "enable_shield": False,
+    }
+)
+
+# Environment-specific overrides
+_ENV_CONFIGS: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        "dev": {
+            "domain_name": "dev.media-register.com",
+            "enable_vpc": False,  # Cost optimization
+            "enable_nat_gateway": False,
+            "lambda_memory": 256,
+            "enable_detailed_monitoring": False,
+            "log_retention_days": 3,
+            "api_throttle_rate_limit": 10,
+            "api_throttle_burst_limit": 20,
+        },
+        "staging": {
+            "domain_name": "staging.media-register.com",
+            "enable_vpc": False,  # Cost optimization
+            "enable_nat_gateway": False,
+            "lambda_memory": 512,
+            "enable_point_in_time_recovery": True,
+            "enable_detailed_monitoring": True,
+            "log_retention_days": 14,
+            "api_throttle_rate_limit": 50,
+            "api_throttle_burst_limit": 100,
+        },
+        "prod": {
+            "domain_name": "media-register.com",
+            "enable_vpc": False,  # Cost optimization
+            "enable_nat_gateway": False,
+            "max_azs": 0,
+            "lambda_memory": 1024,
+            "lambda_timeout": 60,
+            "dynamodb_billing_mode": "PROVISIONED",
+            "dynamodb_read_capacity": 5,
+            "dynamodb_write_capacity": 5,
+            "enable_point_in_time_recovery": True,
+            "enable_detailed_monitoring": True,
+            "log_retention_days": 30,
+            "cloudfront_price_class": "PriceClass_All",
+            "api_throttle_rate_limit": 1000,
+            "api_throttle_burst_limit": 2000,
+            "enable_waf": True,
+            "enable_shield": False,  # Enable for DDoS protection if needed
+        },
+    }
+)
+
+
+@lru_cache(maxsize=32)
+def _build_config(
+    environment: str,
+    overrides: Tuple[Tuple[str, Any], ...],
+    env: Tuple[Optional[str], ...],
+) -> Mapping[str, Any]:
+    """Build the merged configuration for an environment (read-only, cached)."""
+    # Base, then environment variables, environment config and overrides
+    env_values = zip(("aws_region", "aws_account", "certificate_arn"), env)
+    base_config = {
+        **_BASE_CONFIG,
+        **{key: value for key, value in env_values if value is not None},
+        **_ENV_CONFIGS.get(environment, {}),
+        **dict(overrides),
+    }
+
+    # Set derived values
+    base_config["stack_name"] = f"{base_config['app_name']}-{environment}"
+    base_config["environment"] = environment
+
+    # API and website URLs
+    if environment == "prod":
+        base_config["api_domain"] = f"api.{base_config['domain_name']}"
+        base_config["website_domain"] = base_config["domain_name"]
+    else:
+        base_config["api_domain"] = f"api.{base_config['domain_name']}"
+        base_config["website_domain"] = base_config["domain_name"]
+
+    return MappingProxyType(base_config)
 
 
 class DeploymentConfig:
     """Manages deployment configuration for different environments."""
 
+    # Cached derived values, dropped by set() when the configuration changes
+    _DERIVED = ("stack_name", "api_domain", "website_domain", "tags", "lambda_env")
+
+    # Environment variables snapshotted at import; see refresh_env()
+    _env = _read_env()
+
     def __init__(self, environment: str, overrides: Optional[Dict[str, Any]] = None):
         self.environment = environment
         self.overrides = overrides or {}
         self._load_config()
 
+    @classmethod
+    def refresh_env(cls) -> None:
+        """Re-read AWS_REGION, AWS_ACCOUNT_ID and CERTIFICATE_ARN."""
+        cls._env = _read_env()
+
     def _load_config(self):
         """Load configuration based on environment."""
-        # Base configuration
-        self.base_config = {
-            "app_name": "media-register",
-            "aws_region": os.environ.get("AWS_REGION", "us-east-1"),
-            "aws_account": os.environ.get("AWS_ACCOUNT_ID", ""),
-            # Domain configuration
-            "domain_name": "media-register.com",
-            "certificate_arn": os.environ.get("CERTIFICATE_ARN", ""),
-            # VPC configuration - disabled for cost optimization
-            # Lambda functions run without VPC to save ~$45/month
-            "enable_vpc": False,
-            "vpc_cidr": None,  # Not used
-            "enable_nat_gateway": False,  # Not used
-            "max_azs": 0,  # Not used
-            # Lambda configuration
-            "lambda_memory": 512,
-            "lambda_timeout": 30,
-            "lambda_runtime": "nodejs20.x",
-            # DynamoDB configuration
-            "dynamodb_billing_mode": "PAY_PER_REQUEST",
-            "enable_point_in_time_recovery": False,
-            # S3 configuration
-            "enable_s3_versioning": True,
-            "s3_lifecycle_days": 90,
-            # CloudFront configuration
-            "cloudfront_price_class": "PriceClass_100",
-            "cloudfront_min_ttl": 0,
-            "cloudfront_default_ttl": 86400,
-            "cloudfront_max_ttl": 31536000,
-            # API Gateway configuration
-            "api_throttle_rate_limit": 100,
-            "api_throttle_burst_limit": 200,
-            # Monitoring
-            "enable_detailed_monitoring": False,
-            "log_retention_days": 7,
-            # Security
-            "enable_waf": False,
-            "enable_shield": False,
-        }
-
-        # Environment-specific overrides
-        env_configs = {
-            "dev": {
-                "domain_name": "dev.media-register.com",
-                "enable_vpc": False,  # Cost optimization
-                "enable_nat_gateway": False,
-                "lambda_memory": 256,
-                "enable_detailed_monitoring": False,
-                "log_retention_days": 3,
-                "api_throttle_rate_limit": 10,
-                "api_throttle_burst_limit": 20,
-            },
-            "staging": {
-                "domain_name": "staging.media-register.com",
-                "enable_vpc": False,  # Cost optimization
-                "enable_nat_gateway": False,
-                "lambda_memory": 512,
-                "enable_point_in_time_recovery": True,
-                "enable_detailed_monitoring": True,
-                "log_retention_days": 14,
-                "api_throttle_rate_limit": 50,
-                "api_throttle_burst_limit": 100,
-            },
-            "prod": {
-                "domain_name": "media-register.com",
-                "enable_vpc": False,  # Cost optimization
-                "enable_nat_gateway": False,
-                "max_azs": 0,
-                "lambda_memory": 1024,
-                "lambda_timeout": 60,
-                "dynamodb_billing_mode": "PROVISIONED",
-                "dynamodb_read_capacity": 5,
-                "dynamodb_write_capacity": 5,
-                "enable_point_in_time_recovery": True,
-                "enable_detailed_monitoring": True,
-                "log_retention_days": 30,
-                "cloudfront_price_class": "PriceClass_All",
-                "api_throttle_rate_limit": 1000,
-                "api_throttle_burst_limit": 2000,
-                "enable_waf": True,
-                "enable_shield": False,  # Enable for DDoS protection if needed
-            },
-        }
-
-        # Apply environment-specific config
-        if self.environment in env_configs:
-            self.base_config.update(env_configs[self.environment])
-
-        # Apply any overrides
-        self.base_config.update(self.overrides)
-
-        # Set derived values
-        self.base_config["stack_name"] = (
-            f"{self.base_config['app_name']}-{self.environment}"
-        )
-        self.base_config["environment"] = self.environment
-
-        # API and website URLs
-        if self.environment == "prod":
-            self.base_config["api_domain"] = f"api.{self.base_config['domain_name']}"
-            self.base_config["website_domain"] = self.base_config["domain_name"]
-        else:
-            self.base_config["api_domain"] = f"api.{self.base_config['domain_name']}"
-            self.base_config["website_domain"] = self.base_config["domain_name"]
+        try:
+            merged = _build_config(
+                self.environment, tuple(sorted(self.overrides.items())), self._env
+            )
+        except TypeError:
+            # Unhashable override values (lists, dicts) bypass the cache
+            merged = _build_config.__wrapped__(
+                self.environment, tuple(self.overrides.items()), self._env
+            )
+        # Each instance gets its own mutable copy of the shared result
+        self.base_config = dict(merged)
 
     @property
     def config(self) -> Dict[str, Any]:
@@ -130,8 +179,37 @@ class DeploymentConfig:
         """Get a configuration value."""
         return self.base_config.get(key, default)
 
-    def get_tags(self) -> Dict[str, str]:
-        """Get resource tags."""
+    def set(self, key: str, value: Any) -> None:
+        """Set a configuration value and recompute derived values."""
+        self.base_config[key] = value
+        for name in self._DERIVED:
+            self.__dict__.pop(name, None)
+        # Keep the copies exposed through config in step with the new inputs
+        if key not in ("stack_name", "api_domain", "website_domain"):
+            self.base_config.update(
+                stack_name=self.stack_name,
+                api_domain=self.api_domain,
+                website_domain=self.website_domain,
+            )
+
+    @cached_property
+    def stack_name(self) -> str:
+        """CloudFormation stack name."""
+        return f"{self.base_config['app_name']}-{self.environment}"
+
+    @cached_property
+    def api_domain(self) -> str:
+        """API custom domain."""
+        return f"api.{self.base_config['domain_name']}"
+
+    @cached_property
+    def website_domain(self) -> str:
+        """Website domain."""
+        return str(self.base_config["domain_name"])
+
+    @cached_property
+    def tags(self) -> Dict[str, str]:
+        """Resource tags, built once per instance."""
         return {
             "Application": self.base_config["app_name"],
             "Environment": self.environment,
@@ -140,18 +218,27 @@ class DeploymentConfig:
             "CostCenter": f"media-register-{self.environment}",
         }
 
-    def get_lambda_environment(self) -> Dict[str, str]:
-        """Get Lambda environment variables."""
+    @cached_property
+    def lambda_env(self) -> Dict[str, str]:
+        """Lambda environment variables, built once per instance."""
         return {
             "ENVIRONMENT": self.environment,
             "AWS_REGION": self.base_config["aws_region"],
-            "DYNAMODB_TABLE": f"{self.base_config['stack_name']}-media",
-            "UPLOAD_BUCKET": f"{self.base_config['stack_name']}-uploads",
-            "WEBSITE_URL": f"https://{self.base_config['website_domain']}",
-            "API_URL": f"https://{self.base_config['api_domain']}",
+            "DYNAMODB_TABLE": f"{self.stack_name}-media",
+            "UPLOAD_BUCKET": f"{self.stack_name}-uploads",
+            "WEBSITE_URL": f"https://{self.website_domain}",
+            "API_URL": f"https://{self.api_domain}",
             "LOG_LEVEL": "DEBUG" if self.environment == "dev" else "INFO",
         }
 
+    def get_tags(self) -> Dict[str, str]:
+        """Get resource tags."""
+        return dict(self.tags)
+
+    def get_lambda_environment(self) -> Dict[str, str]:
+        """Get Lambda environment variables."""
+        return dict(self.lambda_env)
+
     def validate(self) -> bool:
         """Validate configuration."""
         required_fields = ["app_name", "aws_region", "environment"]
@@ -4,15 +4,92 @@ Simple deployment script for Media Register that generates CloudFormation templa
 This version doesn't require AWS CDK.
 """
 
+import hashlib
 import json
 import os
+import re
+import secrets
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, BinaryIO, Dict, Optional, Tuple
 
+from jsonschema import Draft7Validator
 
-def create_cloudformation_template(environment: str = "dev") -> Dict[str, Any]:
-    """Create a CloudFormation template for Media Register."""
+try:
+    import jsonschema_rs
+except ImportError:
+    jsonschema_rs = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Structural checks for generated templates: known sections, typed resources,
+# parameters with a Type and outputs with a Value
+CFN_TEMPLATE_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["AWSTemplateFormatVersion", "Resources"],
+    "additionalProperties": False,
+    "properties": {
+        "AWSTemplateFormatVersion": {"const": "2010-09-09"},
+        "Description": {"type": "string", "maxLength": 1024},
+        "Parameters": {
+            "type": "object",
+            "additionalProperties": {"type": "object", "required": ["Type"]},
+        },
+        "Resources": {
+            "type": "object",
+            "minProperties": 1,
+            "propertyNames": {"pattern": "^[A-Za-z0-9]+$"},
+            "additionalProperties": {
+                "type": "object",
+                "required": ["Type"],
+                "properties": {
+                    "Type": {
+                        "type": "string",
+                        "pattern": "^(AWS::[A-Za-z0-9]+::[A-Za-z0-9:]+|Custom::.+)$",
+                    },
+                    "Properties": {"type": "object"},
+                    "DependsOn": {
+                        "type": ["string", "array"],
+                        "items": {"type": "string"},
+                    },
+                },
+            },
+        },
+        "Outputs": {
+            "type": "object",
+            "propertyNames": {"pattern": "^[A-Za-z0-9]+$"},
+            "additionalProperties": {"type": "object", "required": ["Value"]},
+        },
+    },
+}
+
+# Checked against the meta-schema once here rather than on every validation
+Draft7Validator.check_schema(CFN_TEMPLATE_SCHEMA)
+_CFN_VALIDATOR = Draft7Validator(CFN_TEMPLATE_SCHEMA)
+_CFN_FAST_VALIDATOR = (
+    jsonschema_rs.validator_for(CFN_TEMPLATE_SCHEMA)
+    if jsonschema_rs is not None
+    else None
+)
+
+# Placeholders substituted into the serialised template skeleton
+_ENV_TOKEN = "__ENV__"
+_UPLOAD_SUFFIX_TOKEN = "__UPLOAD_SUFFIX__"
+_WEBSITE_SUFFIX_TOKEN = "__WEBSITE_SUFFIX__"
+
+# Bucket suffixes are pasted into the template unescaped, so only characters
+# valid in S3 bucket names are accepted
+_BUCKET_SUFFIX_PATTERN = re.compile(r"^[a-z0-9-]+$")
+
+
+def _build_template(
+    environment: str, upload_suffix: str, website_suffix: str
+) -> Dict[str, Any]:
+    """Build the CloudFormation template dict for Media Register."""
 
     stack_name: str = f"media-register-{environment}"
 
@@ -110,7 +187,7 @@ def create_cloudformation_template(environment: str = "dev") -> Dict[str, Any]:
     template["Resources"]["UploadBucket"] = {
         "Type": "AWS::S3::Bucket",
         "Properties": {
-            "BucketName": f"{stack_name}-uploads-{os.urandom(8).hex()}",
+            "BucketName": f"{stack_name}-uploads-{upload_suffix}",
             "CorsConfiguration": {
                 "CorsRules": [
                     {
@@ -133,7 +210,7 @@ def create_cloudformation_template(environment: str = "dev") -> Dict[str, Any]:
     template["Resources"]["WebsiteBucket"] = {
         "Type": "AWS::S3::Bucket",
         "Properties": {
-            "BucketName": f"{stack_name}-website-{os.urandom(8).hex()}",
+            "BucketName": f"{stack_name}-website-{website_suffix}",
             "WebsiteConfiguration": {
                 "IndexDocument": "index.html",
                 "ErrorDocument": "error.html",
@@ -399,6 +476,135 @@ exports.handler = async (event) => {
     return template
 
 
+# The template varies only by environment and bucket suffixes, so it is built
+# once with placeholders; each call substitutes them and re-parses in C
+_TEMPLATE_JSON = json.dumps(
+    _build_template(_ENV_TOKEN, _UPLOAD_SUFFIX_TOKEN, _WEBSITE_SUFFIX_TOKEN)
+)
+
+
+@lru_cache(maxsize=None)
+def _bucket_suffixes(environment: str) -> Tuple[str, str]:
+    """Random upload and website bucket suffixes, fixed per environment."""
+    return secrets.token_hex(8), secrets.token_hex(8)
+
+
+def create_cloudformation_template(
+    environment: str = "dev", bucket_suffix: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Create a CloudFormation template for Media Register.
+
+    Args:
+        environment: Deployment environment
+        bucket_suffix: Suffix for both bucket names; random when omitted
+
+    Raises:
+        ValueError: If bucket_suffix has characters S3 bucket names do not allow
+    """
+    if bucket_suffix is not None:
+        if not _BUCKET_SUFFIX_PATTERN.match(bucket_suffix):
+            raise ValueError(
+                f"Invalid bucket suffix {bucket_suffix!r}: use lowercase letters,"
+                " digits and hyphens"
+            )
+        upload_suffix = website_suffix = bucket_suffix
+    else:
+        upload_suffix, website_suffix = _bucket_suffixes(environment)
+
+    # Escape the environment as it would appear inside a JSON string
+    escaped_environment = json.dumps(environment)[1:-1]
+    template: Dict[str, Any] = json.loads(
+        _TEMPLATE_JSON.replace(_ENV_TOKEN, escaped_environment)
+        .replace(_UPLOAD_SUFFIX_TOKEN, upload_suffix)
+        .replace(_WEBSITE_SUFFIX_TOKEN, website_suffix)
+    )
+    validate_template(template)
+    return template
+
+
+def validate_template(template: Dict[str, Any]) -> None:
+    """Raise ValueError if the template breaks CFN_TEMPLATE_SCHEMA."""
+    # jsonschema-rs answers the common valid case; failures are described by
+    # jsonschema so the messages are the same with or without it
+    if _CFN_FAST_VALIDATOR is not None and _CFN_FAST_VALIDATOR.is_valid(template):
+        return
+
+    error = next(_CFN_VALIDATOR.iter_errors(template), None)
+    if error is not None:
+        location = " -> ".join(str(part) for part in error.absolute_path) or "root"
+        raise ValueError(
+            f"Invalid CloudFormation template at {location}: {error.message}"
+        )
+
+
+# Templates generated by the CLI, reused so bucket suffixes stay stable
+TEMPLATE_CACHE_DIR = Path.home() / ".cache" / "media-register" / "cfn"
+
+# Environment variables naming the target account and region; each target gets
+# its own cached template, since bucket names must be globally unique
+_CACHE_SCOPE_KEYS = (
+    "AWS_ACCOUNT_ID",
+    "AWS_PROFILE",
+    "AWS_REGION",
+    "AWS_DEFAULT_REGION",
+)
+
+
+def _template_cache_path(environment: str) -> Path:
+    """Cache file for an environment's template in the current account and region."""
+    scope = "\0".join(os.environ.get(key, "") for key in _CACHE_SCOPE_KEYS)
+    key = hashlib.blake2b(
+        f"{environment}\0{scope}\0".encode() + Path(__file__).read_bytes(),
+        digest_size=16,
+    ).hexdigest()
+    return TEMPLATE_CACHE_DIR / f"{key}.json"
+
+
+def _load_template(
+    environment: str, fresh: bool, bucket_suffix: Optional[str] = None
+) -> bytes:
+    """Return the minified template for environment, from the cache if possible."""
+    if bucket_suffix is not None:
+        # Explicit suffixes are already stable, so there is nothing to cache
+        template = create_cloudformation_template(environment, bucket_suffix)
+        return _serialise_template(template, compact=True)
+
+    cache_path = _template_cache_path(environment)
+    if not fresh and cache_path.exists():
+        return cache_path.read_bytes()
+
+    template = create_cloudformation_template(environment)
+    data = _serialise_template(template, compact=True)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent runs never read a partial file
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(cache_path)
+    except OSError:
+        pass  # Caching is best effort
+    return data
+
+
+def _serialise_template(template: Dict[str, Any], compact: bool) -> bytes:
+    """Serialise a template as UTF-8 JSON, minified or indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(template, option=0 if compact else orjson.OPT_INDENT_2)
+    elif compact:
+        return json.dumps(template, separators=(",", ":")).encode()
+    else:
+        return json.dumps(template, indent=2).encode()
+
+
+def _write_template(data: bytes, stream: BinaryIO, compact: bool) -> None:
+    """Write minified template JSON, re-indenting it unless compact is set."""
+    if not compact:
+        template = orjson.loads(data) if orjson is not None else json.loads(data)
+        data = _serialise_template(template, compact=False)
+    stream.write(data)
+
+
 def main() -> None:
     """Main entry point."""
     import argparse
@@ -414,19 +620,44 @@ def main() -> None:
     parser.add_argument(
         "--output", "-o", help="Output file for CloudFormation template"
     )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write minified JSON (default when stdout is not a terminal)",
+    )
+
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Regenerate the template, with new bucket suffixes, ignoring the cache",
+    )
+    parser.add_argument(
+        "--bucket-suffix",
+        help="Suffix for the bucket names instead of a cached random one",
+    )
 
     args = parser.parse_args()
+    if args.bucket_suffix is not None and not _BUCKET_SUFFIX_PATTERN.match(
+        args.bucket_suffix
+    ):
+        parser.error("--bucket-suffix may only contain lowercase letters, digits and -")
+
+    # Generate template, or reuse the one cached for this environment
+    data = _load_template(args.environment, args.fresh, args.bucket_suffix)
 
-    # Generate template
-    template = create_cloudformation_template(args.environment)
+    # Machine consumers get minified JSON; people at a terminal get it indented
+    compact = args.compact or not sys.stdout.isatty()
 
     # Output template
     if args.output:
-        with open(args.output, "w") as f:
-            json.dump(template, f, indent=2)
+        with open(args.output, "wb") as f:
+            _write_template(data, f, compact)
         print(f"CloudFormation template written to {args.output}")
     else:
-        print(json.dumps(template, indent=2))
+        sys.stdout.flush()
+        _write_template(data, sys.stdout.buffer, compact)
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":
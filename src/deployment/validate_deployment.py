@@ -5,16 +5,90 @@ Validate Media Register deployment by running health checks and basic tests.
 
 import json
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     requests = None
 
 
+def _create_session() -> "requests.Session":
+    """Create a keep-alive session that retries transient gateway errors."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False,
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+WEBSITE_MARKER = b"Media Register"
+WEBSITE_SCAN_LIMIT = 64 * 1024
+CORS_HEADERS: frozenset[str] = frozenset(
+    {
+        "access-control-allow-origin",
+        "access-control-allow-methods",
+        "access-control-allow-headers",
+    }
+)
+
+
+def _body_contains(response: Any, marker: bytes, limit: int) -> bool:
+    """Scan a streamed body for marker, stopping at the first match or limit."""
+    body = b""
+    for chunk in response.iter_content(8192):
+        # Only the tail can combine with the new chunk into a match
+        start = max(0, len(body) - len(marker) + 1)
+        body += chunk
+        if body.find(marker, start) != -1:
+            return True
+        if len(body) >= limit:
+            break
+    return False
+
+
+def _requires_requests(
+    result_name: Optional[str] = None,
+) -> Callable[[Callable[..., bool]], Callable[..., bool]]:
+    """Fail a check up front when requests is missing, recording result_name."""
+
+    def decorator(check: Callable[..., bool]) -> Callable[..., bool]:
+        @wraps(check)
+        def wrapper(self: "DeploymentValidator", *args: Any, **kwargs: Any) -> bool:
+            if requests is None:
+                if result_name is not None:
+                    self.add_result(
+                        result_name, False, "requests library not installed"
+                    )
+                return False
+            return check(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
 class DeploymentValidator:
     """Validates a deployed Media Register application."""
 
@@ -24,6 +98,8 @@ class DeploymentValidator:
         self.api_url = self.outputs.get("ApiUrl", "")
         self.website_url = self.outputs.get("WebsiteUrl", "")
         self.results: List[Tuple[str, bool, str]] = []
+        self.session = _create_session() if requests is not None else None
+        self._results_lock = threading.Lock()
 
     def _load_outputs(self) -> Dict[str, str]:
         """Load deployment outputs."""
@@ -31,28 +107,27 @@ class DeploymentValidator:
             print(f"❌ Outputs file not found: {self.outputs_file}")
             return {}
 
-        with open(self.outputs_file) as f:
-            return json.load(f)
+        data = self.outputs_file.read_bytes()
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
 
     def add_result(self, test_name: str, success: bool, message: str) -> None:
         """Add a test result."""
-        self.results.append((test_name, success, message))
-
         icon = "✅" if success else "❌"
-        print(f"{icon} {test_name}: {message}")
+        with self._results_lock:
+            self.results.append((test_name, success, message))
+            print(f"{icon} {test_name}: {message}")
 
+    @_requires_requests("API Health")
     def test_api_health(self) -> bool:
         """Test API health endpoint."""
-        if requests is None:
-            self.add_result("API Health", False, "requests library not installed")
-            return False
-        
         if not self.api_url:
             self.add_result("API Health", False, "No API URL found")
             return False
 
         try:
-            response = requests.get(f"{self.api_url}/health", timeout=10)
+            response = self.session.get(f"{self.api_url}/health", timeout=10)
 
             if response.status_code == 200:
                 data: Dict[str, Any] = response.json()
@@ -72,16 +147,14 @@ class DeploymentValidator:
             self.add_result("API Health", False, f"Failed: {e}")
             return False
 
+    @_requires_requests()
     def test_api_detailed_health(self) -> bool:
         """Test API detailed health endpoint."""
-        if requests is None:
-            return False
-        
         if not self.api_url:
             return False
 
         try:
-            response = requests.get(f"{self.api_url}/health/detailed", timeout=10)
+            response = self.session.get(f"{self.api_url}/health/detailed", timeout=10)
 
             if response.status_code == 200:
                 data: Dict[str, Any] = response.json()
@@ -105,49 +178,49 @@ class DeploymentValidator:
             self.add_result("API Detailed Health", False, f"Failed: {e}")
             return False
 
+    @_requires_requests("Website")
     def test_website_availability(self) -> bool:
         """Test website availability."""
-        if requests is None:
-            self.add_result("Website", False, "requests library not installed")
-            return False
-        
         if not self.website_url:
             self.add_result("Website", False, "No website URL found")
             return False
 
         try:
-            response = requests.get(self.website_url, timeout=10, allow_redirects=True)
-
-            if response.status_code == 200:
-                # Check for expected content
-                has_content: bool = "Media Register" in response.text
-
-                self.add_result(
-                    "Website",
-                    has_content,
-                    f"{'Available' if has_content else 'Available but missing expected content'}",
-                )
-                return has_content
-            else:
-                self.add_result(
-                    "Website", False, f"Unavailable - Status: {response.status_code}"
-                )
-                return False
+            with self.session.get(
+                self.website_url, timeout=10, allow_redirects=True, stream=True
+            ) as response:
+                if response.status_code == 200:
+                    # Check for expected content near the top of the page
+                    has_content: bool = _body_contains(
+                        response, WEBSITE_MARKER, WEBSITE_SCAN_LIMIT
+                    )
+
+                    self.add_result(
+                        "Website",
+                        has_content,
+                        f"{'Available' if has_content else 'Available but missing expected content'}",
+                    )
+                    return has_content
+                else:
+                    self.add_result(
+                        "Website",
+                        False,
+                        f"Unavailable - Status: {response.status_code}",
+                    )
+                    return False
 
         except Exception as e:
             self.add_result("Website", False, f"Failed: {e}")
             return False
 
+    @_requires_requests()
     def test_api_cors(self) -> bool:
         """Test API CORS configuration."""
-        if requests is None:
-            return False
-        
         if not self.api_url:
             return False
 
         try:
-            response = requests.options(
+            response = self.session.options(
                 f"{self.api_url}/health",
                 headers={
                     "Origin": self.website_url or "https://example.com",
@@ -156,13 +229,7 @@ class DeploymentValidator:
                 timeout=10,
             )
 
-            cors_headers: set[str] = {
-                "access-control-allow-origin",
-                "access-control-allow-methods",
-                "access-control-allow-headers",
-            }
-
-            has_cors: bool = all(h in response.headers for h in cors_headers)
+            has_cors: bool = CORS_HEADERS.issubset(h.lower() for h in response.headers)
 
             self.add_result(
                 "API CORS", has_cors, "Configured" if has_cors else "Not configured"
@@ -173,11 +240,9 @@ class DeploymentValidator:
             self.add_result("API CORS", False, f"Failed: {e}")
             return False
 
+    @_requires_requests()
     def test_api_endpoints(self) -> bool:
         """Test various API endpoints."""
-        if requests is None:
-            return False
-        
         if not self.api_url:
             return False
 
@@ -188,45 +253,46 @@ class DeploymentValidator:
             ("GET", "/health/liveness", "Liveness Check"),
         ]
 
-        all_passed: bool = True
-
-        for method, path, name in endpoints:
-            try:
-                response = requests.request(method, f"{self.api_url}{path}", timeout=10)
+        with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+            results: List[bool] = list(
+                executor.map(
+                    lambda endpoint: self._check_endpoint(*endpoint), endpoints
+                )
+            )
 
-                # We expect 200 for successful endpoints
-                # Some might return empty lists which is fine
-                success: bool = response.status_code in [200, 201]
+        return all(results)
 
-                self.add_result(
-                    f"API {name}", success, f"Status: {response.status_code}"
-                )
+    def _check_endpoint(self, method: str, path: str, name: str) -> bool:
+        """Request a single API endpoint and record the result."""
+        try:
+            response = self.session.request(method, f"{self.api_url}{path}", timeout=10)
 
-                if not success:
-                    all_passed = False
+            # We expect 200 for successful endpoints
+            # Some might return empty lists which is fine
+            success: bool = response.status_code in [200, 201]
 
-            except Exception as e:
-                self.add_result(f"API {name}", False, f"Failed: {e}")
-                all_passed = False
+            self.add_result(f"API {name}", success, f"Status: {response.status_code}")
+            return success
 
-        return all_passed
+        except Exception as e:
+            self.add_result(f"API {name}", False, f"Failed: {e}")
+            return False
 
+    @_requires_requests()
     def test_cloudfront_headers(self) -> bool:
         """Test CloudFront cache headers."""
-        if requests is None:
-            return False
-        
         if not self.website_url:
             return False
 
         try:
-            response = requests.get(self.website_url, timeout=10)
+            response = self.session.head(
+                self.website_url, timeout=10, allow_redirects=True
+            )
 
             # Check for CloudFront headers
+            header_names: set[str] = {h.lower() for h in response.headers}
             cf_headers: List[str] = [
-                h
-                for h in response.headers
-                if h.lower().startswith("x-amz-cf-") or h.lower() == "x-cache"
+                h for h in header_names if h.startswith("x-amz-cf-") or h == "x-cache"
             ]
 
             has_cf: bool = len(cf_headers) > 0
@@ -250,17 +316,17 @@ class DeploymentValidator:
         """Run all validation tests."""
         print("\n🔍 Running deployment validation tests...\n")
 
-        # Basic connectivity tests
-        self.test_website_availability()
-        self.test_api_health()
-
-        # Detailed tests
-        self.test_api_detailed_health()
-        self.test_api_cors()
-        self.test_cloudfront_headers()
-
-        # API endpoint tests
-        self.test_api_endpoints()
+        # The probes hit independent URLs, so run them concurrently
+        probes = (
+            self.test_website_availability,
+            self.test_api_health,
+            self.test_api_detailed_health,
+            self.test_api_cors,
+            self.test_cloudfront_headers,
+            self.test_api_endpoints,
+        )
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            list(executor.map(lambda probe: probe(), probes))
 
         # Summary
         print("\n" + "=" * 50)
@@ -292,19 +358,22 @@ class DeploymentValidator:
         print(f"\n⏳ Waiting for deployment to be ready (max {max_wait}s)...")
 
         start_time: float = time.time()
+        delay: float = 1.0
 
         while time.time() - start_time < max_wait:
             # Check API health
             try:
-                response = requests.get(f"{self.api_url}/health", timeout=5)
-                if response.status_code == 200:
+                response = self.session.get(f"{self.api_url}/health", timeout=(3, 5))
+                if 200 <= response.status_code < 300:
                     print("✅ Deployment is ready!")
                     return True
-            except:
+            except Exception:
                 pass
 
-            # Wait before retrying
-            time.sleep(10)
+            # Back off exponentially, without sleeping past the deadline
+            remaining: float = max_wait - (time.time() - start_time)
+            time.sleep(max(0.0, min(delay, remaining)))
+            delay = min(delay * 2, 10.0)
             elapsed: int = int(time.time() - start_time)
             print(f"  Still waiting... ({elapsed}s elapsed)")
 
@@ -3,10 +3,11 @@ Comprehensive tests for deployment commands and infrastructure deployment.
 """
 
 import json
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, call, mock_open, patch
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 import pytest
 import yaml
@@ -14,7 +15,8 @@ from botocore.exceptions import ClientError
 
 from config import ProjectConfig
 from deployment.base_deployer import BaseDeployer, DeploymentResult, DeploymentStatus
-from deployment.infrastructure import InfrastructureDeployer
+from deployment import infrastructure
+from deployment.infrastructure import CDKInfrastructureDeployer, InfrastructureDeployer
 
 
 class TestInfrastructureDeployer:
@@ -132,7 +134,7 @@ class TestInfrastructureDeployer:
             assert result == template_content
 
     def test_load_template_yaml(self, deployer) -> None:
-        """Test loading YAML template and converting to JSON."""
+        """Test loading YAML template passes it through unchanged."""
         yaml_content = """
 Resources:
   Bucket:
@@ -143,11 +145,7 @@ Resources:
         with patch("builtins.open", mock_open(read_data=yaml_content)):
             result = deployer.load_template(template_path)
 
-            # Parse result to verify it's valid JSON
-            parsed = json.loads(result)
-            assert "Resources" in parsed
-            assert "Bucket" in parsed["Resources"]
-            assert parsed["Resources"]["Bucket"]["Type"] == "AWS::S3::Bucket"
+            assert result == yaml_content
 
     def test_prepare_lambda_buckets_success(self, deployer, mock_aws_clients) -> None:
         """Test successful Lambda bucket preparation."""
@@ -390,6 +388,549 @@ Resources:
         assert deployer.tags["CostCenter"] == "12345"
 
 
+@pytest.fixture
+def infra_deployer() -> Any:
+    """Create an InfrastructureDeployer with mocked clients."""
+    config = ProjectConfig(
+        name="test-project",
+        display_name="Test Project",
+        aws_region="us-east-1",
+        aws_account_id="123456789012",
+    )
+    with patch("boto3.Session"):
+        deployer = InfrastructureDeployer(
+            project_name="test-project", environment="dev", config=config
+        )
+    deployer._clients["s3"] = Mock()
+    return deployer
+
+
+class TestInfrastructureTemplateSource:
+    """Test how InfrastructureDeployer passes templates to CloudFormation."""
+
+    @pytest.fixture
+    def deployer(self, infra_deployer) -> Any:
+        """Use the shared mocked InfrastructureDeployer."""
+        return infra_deployer
+
+    def test_small_template_inline(self, deployer) -> None:
+        """Test templates under the inline limit skip S3."""
+        source = deployer.get_template_source("stack", '{"Resources": {}}')
+
+        assert source == {"TemplateBody": '{"Resources": {}}'}
+        deployer.s3.put_object.assert_not_called()
+
+    def test_large_template_uploaded_once(self, deployer) -> None:
+        """Test large templates go through S3 under a content-addressed key."""
+        template = json.dumps({"Description": "x" * 60000})
+        deployer.s3.head_object.side_effect = ClientError(
+            {"Error": {"Code": "404"}}, "HeadObject"
+        )
+
+        source = deployer.get_template_source("stack", template)
+
+        url = source["TemplateURL"]
+        assert url.startswith(
+            "https://test-project-deployments-123456789012.s3.us-east-1.amazonaws.com/"
+            "templates/stack-"
+        )
+        deployer.s3.put_object.assert_called_once()
+
+        # Same content already staged: no second upload
+        deployer.s3.head_object.side_effect = None
+        deployer.s3.put_object.reset_mock()
+        assert deployer.get_template_source("stack", template) == source
+        deployer.s3.put_object.assert_not_called()
+
+    def test_non_ascii_measured_in_bytes(self, deployer) -> None:
+        """Test multi-byte characters count towards the inline byte limit."""
+        template = json.dumps({"Description": "é" * 30000}, ensure_ascii=False)
+        deployer.s3.head_object.return_value = {}
+
+        assert len(template) < infrastructure.MAX_INLINE_TEMPLATE_BYTES
+        assert "TemplateURL" in deployer.get_template_source("stack", template)
+
+
+class TestPrepareStackInputs:
+    """Test CloudFormation parameter and tag list construction."""
+
+    def test_parameters_and_tags(self, infra_deployer) -> None:
+        """Test Environment leads the parameters and values are stringified."""
+        infra_deployer.parameters = {"MemorySize": 512}
+        infra_deployer.tags = {"Team": "DevOps", "CostCenter": 42}
+
+        assert infra_deployer.prepare_parameters() == [
+            {"ParameterKey": "Environment", "ParameterValue": "dev"},
+            {"ParameterKey": "MemorySize", "ParameterValue": "512"},
+        ]
+        assert infra_deployer.prepare_tags() == [
+            {"Key": "Team", "Value": "DevOps"},
+            {"Key": "CostCenter", "Value": "42"},
+        ]
+
+
+class TestFindTemplate:
+    """Test InfrastructureDeployer.find_template directory search."""
+
+    def test_priority_order(self, infra_deployer, tmp_path, monkeypatch) -> None:
+        """Test infrastructure/ wins over the project root and .yaml over .json."""
+        project_dir = tmp_path / "test-project"
+        (project_dir / "infrastructure").mkdir(parents=True)
+        (project_dir / "infrastructure" / "template.json").write_text("{}")
+        (project_dir / "infrastructure" / "template.yaml").write_text("{}")
+        (project_dir / "template.yaml").write_text("{}")
+        (tmp_path / "cwd").mkdir()
+        monkeypatch.chdir(tmp_path / "cwd")
+
+        result = infra_deployer.find_template()
+
+        assert result is not None
+        assert (
+            result.resolve()
+            == (project_dir / "infrastructure" / "template.yaml").resolve()
+        )
+
+    def test_falls_back_to_project_root(
+        self, infra_deployer, tmp_path, monkeypatch
+    ) -> None:
+        """Test missing subdirectories are skipped without error."""
+        project_dir = tmp_path / "test-project"
+        project_dir.mkdir()
+        (project_dir / "template.yml").write_text("{}")
+        (project_dir / "cloudformation").write_text("not a directory")
+        (tmp_path / "cwd").mkdir()
+        monkeypatch.chdir(tmp_path / "cwd")
+
+        result = infra_deployer.find_template()
+
+        assert result is not None
+        assert result.name == "template.yml"
+
+    def test_not_found(self, infra_deployer, tmp_path, monkeypatch) -> None:
+        """Test None is returned when no directory holds a template."""
+        monkeypatch.chdir(tmp_path)
+
+        assert infra_deployer.find_template() is None
+
+
+class TestLoadTemplate:
+    """Test InfrastructureDeployer.load_template passthrough and validation."""
+
+    def test_yaml_passed_through(self, infra_deployer, tmp_path) -> None:
+        """Test YAML with short-form intrinsics is returned byte for byte."""
+        template = "Resources:\n  Topic:\n    Properties:\n      Name: !Ref Env\n"
+        template_path = tmp_path / "template.yaml"
+        template_path.write_text(template)
+
+        with patch.object(infrastructure.yaml, "load") as mock_load:
+            assert infra_deployer.load_template(template_path) == template
+
+        mock_load.assert_not_called()
+
+    def test_validate_accepts_intrinsic_tags(self, infra_deployer, tmp_path) -> None:
+        """Test validation understands !Ref, !GetAtt and friends."""
+        template_path = tmp_path / "template.yaml"
+        template_path.write_text("Outputs:\n  Arn:\n    Value: !GetAtt [Topic, Arn]\n")
+
+        assert infra_deployer.load_template(template_path, validate=True)
+
+    def test_validate_rejects_bad_syntax(self, infra_deployer, tmp_path) -> None:
+        """Test validation raises on malformed templates."""
+        yaml_path = tmp_path / "template.yaml"
+        yaml_path.write_text("Resources: [unclosed\n")
+        json_path = tmp_path / "template.json"
+        json_path.write_text('{"Resources": ')
+
+        with pytest.raises(yaml.YAMLError):
+            infra_deployer.load_template(yaml_path, validate=True)
+        with pytest.raises(json.JSONDecodeError):
+            infra_deployer.load_template(json_path, validate=True)
+
+
+class TestCheckStackStatus:
+    """Test concurrent stack waits share one DescribeStacks sweep per tick."""
+
+    @pytest.fixture(autouse=True)
+    def clear_status_cache(self) -> Iterator[None]:
+        """Start every test without a cached sweep, waiters or denials."""
+        InfrastructureDeployer._stack_status_cache.clear()
+        InfrastructureDeployer._stack_listing_denied.clear()
+        yield
+        InfrastructureDeployer._stack_waiters.clear()
+        InfrastructureDeployer._stack_listing_denied.clear()
+
+    @pytest.fixture
+    def concurrent_waits(self, infra_deployer) -> None:
+        """Pretend two stack waits are polling the deployer's region."""
+        key = (infra_deployer.region, infra_deployer.profile)
+        InfrastructureDeployer._stack_waiters[key] = 2
+
+    def test_single_wait_describes_stack(self, infra_deployer) -> None:
+        """Test a lone check describes its own stack without listing."""
+        cloudformation = Mock()
+        cloudformation.describe_stacks.return_value = {
+            "Stacks": [{"StackStatus": "CREATE_IN_PROGRESS"}]
+        }
+        infra_deployer._clients["cloudformation"] = cloudformation
+
+        assert infra_deployer.check_stack_status("a") == "CREATE_IN_PROGRESS"
+
+        cloudformation.describe_stacks.assert_called_once_with(StackName="a")
+        cloudformation.get_paginator.assert_not_called()
+
+    @pytest.mark.usefixtures("concurrent_waits")
+    def test_sweep_shared_between_deployers(self, infra_deployer) -> None:
+        """Test deployers in one region reuse a fresh sweep."""
+        cloudformation = Mock()
+        cloudformation.get_paginator.return_value.paginate.return_value = [
+            {"Stacks": [{"StackName": "a", "StackStatus": "CREATE_COMPLETE"}]},
+            {"Stacks": [{"StackName": "b", "StackStatus": "UPDATE_IN_PROGRESS"}]},
+        ]
+        infra_deployer._clients["cloudformation"] = cloudformation
+        other = InfrastructureDeployer.__new__(InfrastructureDeployer)
+        other.region = infra_deployer.region
+        other.profile = infra_deployer.profile
+        other._clients = {"cloudformation": Mock()}
+
+        assert infra_deployer.check_stack_status("a") == "CREATE_COMPLETE"
+        assert other.check_stack_status("b") == "UPDATE_IN_PROGRESS"
+        assert other.check_stack_status("missing") is None
+
+        cloudformation.get_paginator.return_value.paginate.assert_called_once_with()
+        other._clients["cloudformation"].get_paginator.assert_not_called()
+
+    @pytest.mark.usefixtures("concurrent_waits")
+    def test_invalidate_forces_new_sweep(self, infra_deployer) -> None:
+        """Test invalidating picks up a stack created after the last sweep."""
+        cloudformation = Mock()
+        cloudformation.get_paginator.return_value.paginate.side_effect = [
+            [{"Stacks": []}],
+            [{"Stacks": [{"StackName": "a", "StackStatus": "CREATE_IN_PROGRESS"}]}],
+        ]
+        infra_deployer._clients["cloudformation"] = cloudformation
+
+        assert infra_deployer.check_stack_status("a") is None
+        infra_deployer.invalidate_stack_status()
+
+        assert infra_deployer.check_stack_status("a") == "CREATE_IN_PROGRESS"
+
+    @pytest.mark.usefixtures("concurrent_waits")
+    def test_falls_back_when_listing_denied(self, infra_deployer) -> None:
+        """Test a denied sweep falls back to per-stack lookups and is not retried."""
+        cloudformation = Mock()
+        cloudformation.get_paginator.return_value.paginate.side_effect = ClientError(
+            {"Error": {"Code": "AccessDenied", "Message": "denied"}}, "DescribeStacks"
+        )
+        cloudformation.describe_stacks.return_value = {
+            "Stacks": [{"StackStatus": "UPDATE_COMPLETE"}]
+        }
+        infra_deployer._clients["cloudformation"] = cloudformation
+
+        assert infra_deployer.check_stack_status("a") == "UPDATE_COMPLETE"
+        assert infra_deployer.check_stack_status("b") == "UPDATE_COMPLETE"
+
+        cloudformation.get_paginator.return_value.paginate.assert_called_once_with()
+        assert cloudformation.describe_stacks.call_count == 2
+
+
+class TestDeployStackWaiting:
+    """Test deploy_stack's adaptive stack status polling."""
+
+    @pytest.fixture
+    def cloudformation(self, infra_deployer, monkeypatch) -> Mock:
+        """Attach a CloudFormation mock and poll it without status caching."""
+        monkeypatch.setattr(InfrastructureDeployer, "STACK_STATUS_TTL", 0)
+        cloudformation = Mock()
+        infra_deployer._clients["cloudformation"] = cloudformation
+        return cloudformation
+
+    def _statuses(self, *statuses: str) -> list[Any]:
+        """Build one DescribeStacks result per status, starting before creation."""
+        missing = ClientError(
+            {"Error": {"Code": "ValidationError", "Message": "does not exist"}},
+            "DescribeStacks",
+        )
+        return [missing] + [{"Stacks": [{"StackStatus": s}]} for s in statuses]
+
+    def test_backs_off_while_unchanged(self, infra_deployer, cloudformation) -> None:
+        """Test the delay doubles up to the cap and resets on a transition."""
+        cloudformation.describe_stacks.side_effect = self._statuses(
+            *["UPDATE_IN_PROGRESS"] * 6,
+            "UPDATE_COMPLETE_CLEANUP_IN_PROGRESS",
+            "UPDATE_COMPLETE",
+        )[1:]
+
+        with (
+            patch.object(infrastructure.time, "sleep") as mock_sleep,
+            patch.object(infrastructure.random, "uniform", return_value=1.0),
+        ):
+            assert infra_deployer._adaptive_wait("stack", "update") is True
+
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == [3, 6, 12, 24, 30, 30, 3]
+        cloudformation.get_waiter.assert_not_called()
+        cloudformation.get_paginator.assert_not_called()
+
+    def test_rollback_polls_slowly_and_fails(
+        self, infra_deployer, cloudformation
+    ) -> None:
+        """Test rollback states use the capped delay and report failure."""
+        cloudformation.describe_stacks.side_effect = self._statuses(
+            "CREATE_IN_PROGRESS", "ROLLBACK_IN_PROGRESS", "ROLLBACK_COMPLETE"
+        )
+        cloudformation.describe_stack_events.return_value = {"StackEvents": []}
+
+        with (
+            patch.object(infrastructure.time, "sleep") as mock_sleep,
+            patch.object(infrastructure.random, "uniform", return_value=1.0),
+        ):
+            assert infra_deployer.deploy_stack("stack", "{}", [], []) is False
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [3, 30]
+        assert "ROLLBACK_COMPLETE" in infra_deployer.errors[0]
+        cloudformation.describe_stack_events.assert_called_once_with(StackName="stack")
+
+    def test_max_attempts_scales_with_delay(self) -> None:
+        """Test a custom delay keeps the one-hour wait budget."""
+        config = ProjectConfig(name="test-project", display_name="Test Project")
+        with patch("boto3.Session"):
+            deployer = InfrastructureDeployer(
+                project_name="test-project",
+                environment="dev",
+                config=config,
+                poll_delay_seconds=10,
+            )
+
+        assert deployer.max_attempts * deployer.poll_delay_seconds >= 3600
+
+
+class TestGenerateTemplate:
+    """Test generated templates are compact JSON unless saved for review."""
+
+    @pytest.fixture
+    def pattern(self) -> Iterator[Mock]:
+        """Provide a pattern whose module import is replaced by a mock."""
+        pattern = Mock()
+        pattern.template.to_json.return_value = '{"Resources":{}}'
+        pattern.to_yaml.return_value = "Resources: {}\n"
+        module = Mock(CloudFrontLambdaAppPattern=Mock(return_value=pattern))
+        with patch.dict("sys.modules", {"patterns.cloudfront_lambda_app": module}):
+            yield pattern
+
+    def test_compact_json_by_default(
+        self, infra_deployer, pattern, monkeypatch
+    ) -> None:
+        """Test deploys skip the YAML rendering."""
+        monkeypatch.delenv("SAVE_GENERATED_TEMPLATE", raising=False)
+
+        assert infra_deployer.generate_template() == '{"Resources":{}}'
+        pattern.template.to_json.assert_called_once_with(
+            indent=None, separators=(",", ":")
+        )
+        pattern.to_yaml.assert_not_called()
+
+    def test_yaml_when_saved(self, infra_deployer, pattern, monkeypatch) -> None:
+        """Test saved templates stay human-readable YAML."""
+        monkeypatch.setenv("SAVE_GENERATED_TEMPLATE", "1")
+
+        assert infra_deployer.generate_template() == "Resources: {}\n"
+        assert infra_deployer.generate_template(fmt="json") == '{"Resources":{}}'
+
+
+class TestDeployBucketSetup:
+    """Test deploy() overlaps Lambda bucket setup with template handling."""
+
+    def test_generated_template_waits_for_bucket(
+        self, infra_deployer, monkeypatch
+    ) -> None:
+        """Test the rotated bucket name is exported before generating."""
+        monkeypatch.delenv("LAMBDA_S3_BUCKET", raising=False)
+
+        def prepare_buckets() -> bool:
+            infra_deployer._lambda_bucket_name = "app-lambda-001-002"
+            return True
+
+        def generate() -> str:
+            assert os.environ["LAMBDA_S3_BUCKET"] == "app-lambda-001-002"
+            return "{}"
+
+        with (
+            patch.object(infra_deployer, "find_template", return_value=None),
+            patch.object(
+                infra_deployer, "prepare_lambda_buckets", side_effect=prepare_buckets
+            ),
+            patch.object(infra_deployer, "generate_template", side_effect=generate),
+            patch.object(infra_deployer, "clean_failed_stack", return_value=True),
+            patch.object(infra_deployer, "deploy_stack", return_value=True),
+            patch.object(infra_deployer, "get_stack_outputs", return_value={}),
+        ):
+            result = infra_deployer.deploy()
+
+        assert result.status == DeploymentStatus.SUCCESS
+
+    def test_clients_created_once(self, tmp_path) -> None:
+        """Test bucket setup and stack cleanup threads share each client."""
+        clients = {
+            "cloudformation": Mock(**{"describe_stacks.return_value": {"Stacks": []}}),
+            "s3": Mock(),
+            "sts": Mock(**{"get_caller_identity.return_value": {"Account": "1234"}}),
+        }
+        session = Mock()
+        session.client.side_effect = lambda service, **kwargs: clients[service]
+        config = ProjectConfig(name="test-project", display_name="Test Project")
+        with patch("boto3.Session", return_value=session):
+            deployer = InfrastructureDeployer(
+                project_name="test-project", environment="dev", config=config
+            )
+        template_path = tmp_path / "template.json"
+        template_path.write_text("{}")
+
+        with (
+            patch.object(deployer, "find_template", return_value=template_path),
+            patch("deployment.bucket_rotation.BucketRotationManager") as manager,
+            patch.object(deployer, "deploy_stack", return_value=True),
+            patch.object(deployer, "get_stack_outputs", return_value={}),
+        ):
+            manager.return_value.rotate_and_create.return_value = "app-lambda-001"
+            result = deployer.deploy()
+
+        assert result.status == DeploymentStatus.SUCCESS
+        services = sorted(c.args[0] for c in session.client.call_args_list)
+        assert services == ["cloudformation", "s3", "sts"]
+
+    def test_bucket_failure_stops_deploy(self, infra_deployer, tmp_path) -> None:
+        """Test a failed bucket setup is reported after the template loads."""
+        template_path = tmp_path / "template.json"
+        template_path.write_text("{}")
+
+        with (
+            patch.object(infra_deployer, "find_template", return_value=template_path),
+            patch.object(infra_deployer, "prepare_lambda_buckets", return_value=False),
+            patch.object(infra_deployer, "clean_failed_stack", return_value=True),
+            patch.object(infra_deployer, "deploy_stack") as mock_deploy_stack,
+        ):
+            result = infra_deployer.deploy()
+
+        assert result.message == "Failed to prepare S3 buckets"
+        mock_deploy_stack.assert_not_called()
+
+
+class TestCDKDeploy:
+    """Test CDKInfrastructureDeployer command construction and memoised checks."""
+
+    @pytest.fixture
+    def cdk_deployer(self, tmp_path) -> CDKInfrastructureDeployer:
+        """Create a CDK deployer with an app directory and clean memo."""
+        (tmp_path / "cdk.json").write_text("{}")
+        config = ProjectConfig(
+            name="test-project",
+            display_name="Test Project",
+            aws_account_id="123456789012",
+        )
+        with patch("boto3.Session"):
+            deployer = CDKInfrastructureDeployer(
+                project_name="test-project",
+                environment="dev",
+                app_path=tmp_path,
+                config=config,
+            )
+        CDKInfrastructureDeployer._verified_cdk.clear()
+        CDKInfrastructureDeployer._bootstrapped.clear()
+        return deployer
+
+    def test_version_checked_once(self, cdk_deployer) -> None:
+        """Test a working cdk CLI is only asked for --version once."""
+        with (
+            patch.object(
+                InfrastructureDeployer, "validate_prerequisites", return_value=True
+            ),
+            patch.object(
+                cdk_deployer, "run_command", return_value=(0, "2.0", "")
+            ) as run,
+        ):
+            assert cdk_deployer.validate_prerequisites() is True
+            assert cdk_deployer.validate_prerequisites() is True
+
+        run.assert_called_once()
+
+    def test_bootstrap_checked_once_per_environment(self, cdk_deployer) -> None:
+        """Test the CDKToolkit stack is looked up once per account and region."""
+        with patch.object(
+            cdk_deployer, "check_stack_status", return_value="CREATE_COMPLETE"
+        ) as check:
+            assert cdk_deployer.bootstrap_cdk() is True
+            assert cdk_deployer.bootstrap_cdk() is True
+
+        check.assert_called_once_with("CDKToolkit")
+
+    def test_deploy_command(self, tmp_path) -> None:
+        """Test context, profile and stack pattern are passed as argv."""
+        config = ProjectConfig(name="test-project", display_name="Test Project")
+        with patch("boto3.Session"):
+            deployer = CDKInfrastructureDeployer(
+                project_name="test-project",
+                environment="dev",
+                app_path=tmp_path,
+                context={"stage": "blue"},
+                config=config,
+                profile="ops",
+            )
+        infrastructure._cdk_executable.cache_clear()
+
+        with (
+            patch.object(infrastructure.shutil, "which", return_value="/bin/cdk"),
+            patch.object(deployer, "bootstrap_cdk", return_value=True),
+            patch.object(deployer, "run_command", return_value=(0, "", "")) as run,
+            patch.object(deployer, "get_stack_outputs", return_value={}),
+        ):
+            assert deployer.deploy().status == DeploymentStatus.SUCCESS
+        infrastructure._cdk_executable.cache_clear()
+
+        run.assert_called_once_with(
+            [
+                "/bin/cdk",
+                "deploy",
+                "--require-approval",
+                "never",
+                "-c",
+                "stage=blue",
+                "-c",
+                "environment=dev",
+                "--profile",
+                "ops",
+                "test-project-dev-*",
+            ],
+            cwd=tmp_path,
+        )
+
+    def test_dry_run_synth_command(self, tmp_path) -> None:
+        """Test a dry run synthesises with the resolved cdk binary and context."""
+        config = ProjectConfig(name="test-project", display_name="Test Project")
+        with patch("boto3.Session"):
+            deployer = CDKInfrastructureDeployer(
+                project_name="test-project",
+                environment="dev",
+                app_path=tmp_path,
+                context={"stage": "blue"},
+                config=config,
+                dry_run=True,
+            )
+        infrastructure._cdk_executable.cache_clear()
+
+        with (
+            patch.object(infrastructure.shutil, "which", return_value="/bin/cdk"),
+            patch.object(deployer, "bootstrap_cdk", return_value=True),
+            patch.object(deployer, "run_command", return_value=(0, "{}", "")) as run,
+        ):
+            assert deployer.deploy().status == DeploymentStatus.SUCCESS
+        infrastructure._cdk_executable.cache_clear()
+
+        run.assert_called_once_with(
+            ["/bin/cdk", "synth", "-c", "stage=blue", "-c", "environment=dev"],
+            cwd=tmp_path,
+        )
+
+
 class TestBaseDeployer:
     """Test BaseDeployer base class functionality."""
 
@@ -11,7 +11,7 @@ from typing import Any, Dict, List, Optional
 from unittest.mock import MagicMock, Mock, patch, call
 
 import pytest
-from botocore.exceptions import ClientError
+from botocore.exceptions import ClientError, WaiterError
 
 from deployment.base_deployer import (
     DeploymentStatus,
@@ -368,6 +368,170 @@ class TestBaseDeployerErrorHandling:
             # This depends on the implementation
 
 
+class TestValidatePrerequisites:
+    """Test BaseDeployer.validate_prerequisites."""
+
+    @pytest.fixture
+    def deployer(self) -> ConcreteDeployer:
+        """Create a deployer with an explicit config and mocked session."""
+        from config import ProjectConfig
+
+        config = ProjectConfig(name="test-project", display_name="Test Project")
+        with patch("boto3.Session"):
+            return ConcreteDeployer(
+                project_name="test-project", environment="dev", config=config
+            )
+
+    def test_all_checks_pass(self, deployer: ConcreteDeployer) -> None:
+        """Test prerequisites pass when STS and project directory succeed."""
+        with patch.object(Path, "exists", return_value=True):
+            assert deployer.validate_prerequisites() is True
+        deployer.sts.get_caller_identity.assert_called_once()
+        assert deployer.errors == []
+
+    def test_all_failures_reported(self, deployer: ConcreteDeployer) -> None:
+        """Test every failing check is reported, not just the first."""
+        deployer.sts.get_caller_identity.side_effect = Exception("no credentials")
+        with patch.object(Path, "exists", return_value=False):
+            assert deployer.validate_prerequisites() is False
+        assert len(deployer.errors) == 2
+        assert any("AWS credentials" in error for error in deployer.errors)
+        assert any("Project directory" in error for error in deployer.errors)
+
+
+
+class TestDeployerCaching:
+    """Test per-deployer caching of AWS clients and stack outputs."""
+
+    @pytest.fixture
+    def deployer(self) -> ConcreteDeployer:
+        """Create a deployer with an explicit config and mocked session."""
+        from config import ProjectConfig
+
+        config = ProjectConfig(name="test-project", display_name="Test Project")
+        with patch("boto3.Session"):
+            deployer = ConcreteDeployer(
+                project_name="test-project", environment="dev", config=config
+            )
+        deployer.cloudformation.describe_stacks.return_value = {
+            "Stacks": [{"Outputs": [{"OutputKey": "Bucket", "OutputValue": "b"}]}]
+        }
+        return deployer
+
+    def test_outputs_fetched_once(self, deployer: ConcreteDeployer) -> None:
+        """Test repeated access reuses a single DescribeStacks call."""
+        assert deployer.stack_outputs == {"Bucket": "b"}
+        assert deployer.stack_outputs == {"Bucket": "b"}
+        deployer.cloudformation.describe_stacks.assert_called_once()
+
+    def test_clients_use_shared_config(self, deployer: ConcreteDeployer) -> None:
+        """Test clients are created once with the shared client config."""
+        deployer._clients = {}
+        deployer._session = Mock()
+
+        assert deployer.sts is deployer.sts
+        deployer._session.client.assert_called_once_with(
+            "sts", config=BaseDeployer.CLIENT_CONFIG
+        )
+
+    def test_delete_refreshes(self, deployer: ConcreteDeployer) -> None:
+        """Test deleting the cached value forces a new lookup."""
+        assert deployer.stack_outputs == {"Bucket": "b"}
+        del deployer.stack_outputs
+        assert deployer.stack_outputs == {"Bucket": "b"}
+        assert deployer.cloudformation.describe_stacks.call_count == 2
+
+    def test_project_dir_resolved_once(
+        self, deployer: ConcreteDeployer, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the sibling project directory is absolute and cached."""
+        (tmp_path / "cwd").mkdir()
+        monkeypatch.chdir(tmp_path / "cwd")
+
+        assert deployer.project_dir == (tmp_path / "test-project").resolve()
+
+        monkeypatch.chdir(tmp_path)
+        assert deployer.project_dir == (tmp_path / "test-project").resolve()
+
+
+class TestStackResponseGuards:
+    """Test sparse DescribeStacks responses are handled without exceptions."""
+
+    @pytest.fixture
+    def deployer(self) -> ConcreteDeployer:
+        """Create a deployer with a mocked CloudFormation client."""
+        from config import ProjectConfig
+
+        config = ProjectConfig(name="test-project", display_name="Test Project")
+        with patch("boto3.Session"):
+            deployer = ConcreteDeployer(
+                project_name="test-project", environment="dev", config=config
+            )
+        deployer._clients["cloudformation"] = Mock()
+        return deployer
+
+    @pytest.mark.parametrize("response", [{}, {"Stacks": []}, {"Stacks": [{}]}])
+    def test_sparse_responses(
+        self, deployer: ConcreteDeployer, response: Dict[str, Any]
+    ) -> None:
+        """Test missing Stacks, StackStatus and Outputs read as empty."""
+        deployer.cloudformation.describe_stacks.return_value = response
+
+        assert deployer.check_stack_status("test-stack") is None
+        assert deployer.get_stack_outputs("test-stack") == {}
+        assert deployer.warnings == []
+
+
+class TestWaitForStackErrors:
+    """Test wait_for_stack tells rollbacks apart from timeouts."""
+
+    @pytest.fixture
+    def deployer(self) -> ConcreteDeployer:
+        """Create a deployer whose waiter is mocked."""
+        from config import ProjectConfig
+
+        config = ProjectConfig(name="test-project", display_name="Test Project")
+        with patch("boto3.Session"):
+            deployer = ConcreteDeployer(
+                project_name="test-project", environment="dev", config=config
+            )
+        deployer._clients["cloudformation"] = Mock()
+        deployer.cloudformation.describe_stack_events.return_value = {"StackEvents": []}
+        return deployer
+
+    def _fail_with(self, deployer: ConcreteDeployer, status: str) -> None:
+        waiter = deployer.cloudformation.get_waiter.return_value
+        waiter.wait.side_effect = WaiterError(
+            name="StackCreateComplete",
+            reason="stopped",
+            last_response={"Stacks": [{"StackStatus": status}]},
+        )
+
+    def test_default_waiter_config(self, deployer: ConcreteDeployer) -> None:
+        """Test the waiter polls every 5s for up to an hour."""
+        assert deployer.wait_for_stack("test-stack") is True
+
+        deployer.cloudformation.get_waiter.return_value.wait.assert_called_once_with(
+            StackName="test-stack", WaiterConfig={"Delay": 5, "MaxAttempts": 720}
+        )
+
+    def test_rollback_reports_root_cause(self, deployer: ConcreteDeployer) -> None:
+        """Test a rollback is reported as a failure with stack events."""
+        self._fail_with(deployer, "ROLLBACK_COMPLETE")
+
+        assert deployer.wait_for_stack("test-stack") is False
+        assert deployer.errors == ["Stack create failed: ROLLBACK_COMPLETE"]
+        deployer.cloudformation.describe_stack_events.assert_called_once()
+
+    def test_timeout_reported_separately(self, deployer: ConcreteDeployer) -> None:
+        """Test a stack still in progress is reported as a timeout."""
+        self._fail_with(deployer, "CREATE_IN_PROGRESS")
+
+        assert deployer.wait_for_stack("test-stack") is False
+        assert "Timed out" in deployer.errors[0]
+        deployer.cloudformation.describe_stack_events.assert_not_called()
+
+
 @pytest.mark.integration
 class TestBaseDeployerIntegration:
     """Integration tests for BaseDeployer."""
@@ -0,0 +1,220 @@
+"""
+Tests for deployment.deploy_utils.
+"""
+
+import hashlib
+import itertools
+import json
+from pathlib import Path
+
+import pytest
+
+from deployment.deploy_utils import (
+    file_md5,
+    hash_package_files,
+    lambda_resources,
+    lambda_resources_match,
+    list_package_files,
+    load_deploy_cache,
+    lock_file_hash,
+    multipart_etag,
+    npm_install_current,
+    npm_stamp_file,
+    poll_delays,
+    stack_wait_result,
+    template_s3_key,
+)
+
+
+class TestFileMd5:
+    """Test memory-mapped file hashing."""
+
+    def test_matches_hashlib(self, tmp_path: Path) -> None:
+        """Test the digest matches hashing the file contents directly."""
+        file_path = tmp_path / "bundle.js"
+        file_path.write_bytes(b"x" * 100_000)
+
+        assert file_md5(file_path) == hashlib.md5(b"x" * 100_000).hexdigest()
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        """Test empty files hash without mapping them."""
+        file_path = tmp_path / "empty.txt"
+        file_path.write_bytes(b"")
+
+        assert file_md5(file_path) == hashlib.md5(b"").hexdigest()
+
+
+class TestMultipartEtag:
+    """Test local computation of S3 multipart ETags."""
+
+    def test_digest_of_part_digests(self, tmp_path: Path) -> None:
+        """Test the ETag hashes each part's MD5 and appends the part count."""
+        file_path = tmp_path / "video.mp4"
+        file_path.write_bytes(b"a" * 10 + b"b" * 10 + b"c" * 5)
+        parts = [b"a" * 10, b"b" * 10, b"c" * 5]
+        expected = hashlib.md5(
+            b"".join(hashlib.md5(part).digest() for part in parts)
+        ).hexdigest()
+
+        assert multipart_etag(file_path, 10) == f"{expected}-3"
+
+    def test_single_part(self, tmp_path: Path) -> None:
+        """Test a file smaller than one part still gets a part count of one."""
+        file_path = tmp_path / "small.bin"
+        file_path.write_bytes(b"x" * 4)
+        expected = hashlib.md5(hashlib.md5(b"x" * 4).digest()).hexdigest()
+
+        assert multipart_etag(file_path, 10) == f"{expected}-1"
+
+
+class TestStackWait:
+    """Test stack wait polling and status classification."""
+
+    def test_poll_delays_back_off(self) -> None:
+        """Test delays step from 3 to 10 to 30 seconds and then stay there."""
+        delays = list(itertools.islice(poll_delays(), 75))
+
+        assert delays[:20] == [3] * 20
+        assert delays[20:70] == [10] * 50
+        assert delays[70:] == [30] * 5
+
+    @pytest.mark.parametrize(
+        ("status", "expected"),
+        [
+            ("CREATE_COMPLETE", True),
+            ("UPDATE_COMPLETE", True),
+            ("CREATE_IN_PROGRESS", None),
+            ("UPDATE_COMPLETE_CLEANUP_IN_PROGRESS", None),
+            ("UPDATE_ROLLBACK_IN_PROGRESS", None),
+            ("CREATE_FAILED", False),
+            ("ROLLBACK_COMPLETE", False),
+            ("UPDATE_ROLLBACK_COMPLETE", False),
+            ("DELETE_COMPLETE", False),
+        ],
+    )
+    def test_stack_wait_result(self, status: str, expected: object) -> None:
+        """Test terminal and in-progress statuses are told apart."""
+        assert stack_wait_result(status) is expected
+
+
+class TestTemplateS3Key:
+    """Test staged template keys."""
+
+    def test_key_follows_contents(self) -> None:
+        """Test the key changes with the template and not otherwise."""
+        key = template_s3_key("app-dev", b"{}")
+
+        assert key == f"templates/app-dev-{hashlib.sha256(b'{}').hexdigest()[:12]}.json"
+        assert template_s3_key("app-dev", b"{}") == key
+        assert template_s3_key("app-dev", b"{ }") != key
+
+
+class TestLambdaResources:
+    """Test detecting Lambda changes between templates."""
+
+    TEMPLATE = {
+        "Resources": {
+            "Handler": {
+                "Type": "AWS::Lambda::Function",
+                "Properties": {"MemorySize": 256},
+            },
+            "Bucket": {"Type": "AWS::S3::Bucket"},
+        }
+    }
+
+    def test_selects_lambda_resources(self) -> None:
+        """Test only AWS::Lambda:: resources are kept."""
+        assert list(lambda_resources(self.TEMPLATE)) == ["Handler"]
+        assert lambda_resources({}) == {}
+
+    def test_other_resource_changes_ignored(self) -> None:
+        """Test non-Lambda changes still count as a match."""
+        deployed = json.loads(json.dumps(self.TEMPLATE))
+        deployed["Resources"]["Bucket"]["Properties"] = {"BucketName": "old"}
+
+        assert lambda_resources_match(deployed, self.TEMPLATE) is True
+        assert lambda_resources_match(json.dumps(deployed), self.TEMPLATE) is True
+
+    def test_lambda_change_detected(self) -> None:
+        """Test a changed function property is not a match."""
+        deployed = json.loads(json.dumps(self.TEMPLATE))
+        deployed["Resources"]["Handler"]["Properties"]["MemorySize"] = 512
+
+        assert lambda_resources_match(deployed, self.TEMPLATE) is False
+
+    def test_yaml_body_never_matches(self) -> None:
+        """Test text bodies that are not JSON are treated as changed."""
+        assert lambda_resources_match("Resources: {}\n", {"Resources": {}}) is False
+
+
+class TestPackageCache:
+    """Test the Lambda package hash cache helpers."""
+
+    def test_load_missing_or_corrupt(self, tmp_path: Path) -> None:
+        """Test unreadable caches load as empty."""
+        cache_file = tmp_path / ".deploy-cache.json"
+        assert load_deploy_cache(cache_file) == {}
+
+        cache_file.write_text("{not json")
+        assert load_deploy_cache(cache_file) == {}
+
+        cache_file.write_text("[]")
+        assert load_deploy_cache(cache_file) == {}
+
+        cache_file.write_text('{"fn": {"dir_hash": "abc"}}')
+        assert load_deploy_cache(cache_file) == {"fn": {"dir_hash": "abc"}}
+
+    def test_lists_nested_files_sorted(self, tmp_path: Path) -> None:
+        """Test files in subdirectories are listed in sorted order."""
+        (tmp_path / "lib").mkdir()
+        (tmp_path / "lib" / "util.js").write_text("u")
+        (tmp_path / "index.js").write_text("i")
+
+        assert list_package_files(tmp_path) == [
+            str(tmp_path / "index.js"),
+            str(tmp_path / "lib" / "util.js"),
+        ]
+
+    def test_hash_covers_paths_and_contents(self, tmp_path: Path) -> None:
+        """Test renaming or editing a file changes the package hash."""
+        (tmp_path / "index.js").write_text("i")
+        before = hash_package_files(tmp_path, list_package_files(tmp_path))
+
+        assert hash_package_files(tmp_path, list_package_files(tmp_path)) == before
+
+        (tmp_path / "index.js").rename(tmp_path / "main.js")
+        renamed = hash_package_files(tmp_path, list_package_files(tmp_path))
+        (tmp_path / "main.js").write_text("j")
+        edited = hash_package_files(tmp_path, list_package_files(tmp_path))
+
+        assert len({before, renamed, edited}) == 3
+
+
+class TestNpmStamp:
+    """Test skipping npm installs when package-lock.json is unchanged."""
+
+    def test_stamp_file_names(self, tmp_path: Path) -> None:
+        """Test each package gets its own stamp beside the project root."""
+        assert npm_stamp_file(tmp_path, tmp_path) == tmp_path / ".deploy-cache.npm.root"
+        assert npm_stamp_file(tmp_path, tmp_path / "src" / "lambda") == (
+            tmp_path / ".deploy-cache.npm.src-lambda"
+        )
+
+    def test_install_current(self, tmp_path: Path) -> None:
+        """Test the install is current only with node_modules and a matching stamp."""
+        stamp_file = tmp_path / ".deploy-cache.npm.root"
+        assert lock_file_hash(tmp_path) is None
+
+        (tmp_path / "package-lock.json").write_text("{}")
+        lock_hash = lock_file_hash(tmp_path)
+        assert lock_hash == hashlib.sha256(b"{}").hexdigest()
+        assert npm_install_current(tmp_path, stamp_file, lock_hash) is False
+
+        (tmp_path / "node_modules").mkdir()
+        stamp_file.write_text(lock_hash)
+        assert npm_install_current(tmp_path, stamp_file, lock_hash) is True
+
+        (tmp_path / "package-lock.json").write_text('{"lockfileVersion": 3}')
+        changed = lock_file_hash(tmp_path)
+        assert changed is not None
+        assert npm_install_current(tmp_path, stamp_file, changed) is False
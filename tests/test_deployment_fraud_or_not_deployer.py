@@ -0,0 +1,157 @@
+"""
+Tests for deployment.fraud_or_not_deployer configuration handling.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from deployment import fraud_or_not_deployer
+from deployment.fraud_or_not_deployer import (
+    TEMPLATE_HASH_TAG,
+    FraudOrNotDeployer,
+    _load_yaml_cached,
+)
+
+
+@pytest.fixture
+def deployer() -> FraudOrNotDeployer:
+    """Create a deployer without touching AWS or the filesystem."""
+    instance = FraudOrNotDeployer.__new__(FraudOrNotDeployer)
+    instance.environment = "dev"
+    return instance
+
+
+class TestLoadYamlCached:
+    """Test the mtime-keyed YAML cache."""
+
+    def test_reuses_parse_until_file_changes(self, tmp_path: Path) -> None:
+        """Test the file is parsed once and re-parsed after it changes."""
+        config_file = tmp_path / "base.yaml"
+        config_file.write_text("name: first\n")
+        fraud_or_not_deployer._load_yaml.cache_clear()
+
+        assert _load_yaml_cached(config_file) == {"name": "first"}
+        assert _load_yaml_cached(config_file) == {"name": "first"}
+        assert fraud_or_not_deployer._load_yaml.cache_info().hits == 1
+
+        config_file.write_text("name: second\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert _load_yaml_cached(config_file) == {"name": "second"}
+
+    def test_returns_independent_copies(self, tmp_path: Path) -> None:
+        """Test mutating a loaded config does not corrupt the cache."""
+        config_file = tmp_path / "base.yaml"
+        config_file.write_text("storage:\n  bucket: data\n")
+
+        first = _load_yaml_cached(config_file)
+        first["storage"]["bucket"] = "changed"
+
+        assert _load_yaml_cached(config_file) == {"storage": {"bucket": "data"}}
+
+
+class TestConfigMerging:
+    """Test deep_merge and apply_environment_config."""
+
+    def test_deep_merge_nested(self, deployer: FraudOrNotDeployer) -> None:
+        """Test nested keys are merged and extends is ignored."""
+        base: dict[str, Any] = {"a": {"x": 1, "y": 2}, "b": 1}
+        override: dict[str, Any] = {"a": {"y": 3}, "extends": "base", "c": 4}
+
+        result = deployer.deep_merge(base, override)
+
+        assert result == {"a": {"x": 1, "y": 3}, "b": 1, "c": 4}
+
+    def test_deep_merge_leaves_inputs_untouched(
+        self, deployer: FraudOrNotDeployer
+    ) -> None:
+        """Test merging does not mutate the base or override."""
+        base: dict[str, Any] = {"a": {"b": {"c": 1}}}
+        override: dict[str, Any] = {"a": {"b": {"d": 2}}}
+
+        result = deployer.deep_merge(base, override)
+
+        assert result == {"a": {"b": {"c": 1, "d": 2}}}
+        assert base == {"a": {"b": {"c": 1}}}
+        assert override == {"a": {"b": {"d": 2}}}
+
+    def test_deep_merge_empty_override(self, deployer: FraudOrNotDeployer) -> None:
+        """Test an empty override returns the base unchanged."""
+        base = {"a": 1}
+        assert deployer.deep_merge(base, {}) is base
+
+    def test_apply_environment_config(self, deployer: FraudOrNotDeployer) -> None:
+        """Test {env} placeholders are replaced at every nesting level."""
+        config: dict[str, Any] = {
+            "name": "app-{env}",
+            "nested": {"items": ["{env}-a", 1, {"key": "{env}"}]},
+            "count": 3,
+        }
+
+        deployer.apply_environment_config(config)
+
+        assert config == {
+            "name": "app-dev",
+            "nested": {"items": ["dev-a", 1, {"key": "dev"}]},
+            "count": 3,
+        }
+
+
+class TestDeploySkipsUnchangedTemplate:
+    """Test deploy() skips stacks whose template hash tag already matches."""
+
+    @pytest.fixture
+    def stack_deployer(
+        self, deployer: FraudOrNotDeployer, tmp_path: Path
+    ) -> FraudOrNotDeployer:
+        """Prepare a deployer with mocked CloudFormation and a fixed template."""
+        deployer.project_name = "fraud-or-not"
+        deployer.project_root = tmp_path
+        deployer.tags = {}
+        deployer.logger = Mock()
+        deployer._clients = {"cloudformation": Mock()}
+        deployer.generate_template = Mock(return_value='{"Resources": {}}')
+        deployer.deploy_stack = Mock(return_value=True)
+        deployer.get_stack_outputs = Mock(return_value={})
+        return deployer
+
+    def _stack(self, template_hash: str, status: str) -> dict[str, Any]:
+        return {
+            "Stacks": [
+                {
+                    "StackStatus": status,
+                    "Tags": [{"Key": TEMPLATE_HASH_TAG, "Value": template_hash}],
+                }
+            ]
+        }
+
+    def test_unchanged_template_skips_update(
+        self, stack_deployer: FraudOrNotDeployer
+    ) -> None:
+        """Test a matching TemplateHash tag short-circuits the update."""
+        template_hash = hashlib.sha256(b'{"Resources": {}}').hexdigest()
+        stack_deployer.cloudformation.describe_stacks.return_value = self._stack(
+            template_hash, "UPDATE_COMPLETE"
+        )
+
+        assert stack_deployer.deploy(auto_approve=True) is True
+        stack_deployer.deploy_stack.assert_not_called()
+
+    def test_changed_template_updates_with_hash_tag(
+        self, stack_deployer: FraudOrNotDeployer
+    ) -> None:
+        """Test a changed template is deployed and tagged with its hash."""
+        stack_deployer.cloudformation.describe_stacks.return_value = self._stack(
+            "stale", "UPDATE_COMPLETE"
+        )
+
+        assert stack_deployer.deploy(auto_approve=True) is True
+        stack_deployer.deploy_stack.assert_called_once()
+        tags = stack_deployer.deploy_stack.call_args[0][3]
+        expected = hashlib.sha256(b'{"Resources": {}}').hexdigest()
+        assert {"Key": TEMPLATE_HASH_TAG, "Value": expected} in tags
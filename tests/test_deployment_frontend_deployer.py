@@ -0,0 +1,437 @@
+"""
+Tests for deployment.frontend_deployer helpers.
+"""
+
+import gzip
+import hashlib
+import itertools
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
+
+from deployment.deploy_utils import multipart_etag
+from deployment.frontend_deployer import FrontendDeployer, build_invalidation_paths
+
+
+@pytest.fixture
+def deployer() -> FrontendDeployer:
+    """Create a deployer with a mocked S3 client and no AWS session."""
+    instance = FrontendDeployer.__new__(FrontendDeployer)
+    instance.project_name = "test-project"
+    instance.environment = "dev"
+    instance.dry_run = False
+    instance.upload_workers = FrontendDeployer.UPLOAD_WORKERS
+    instance.errors = []
+    instance.warnings = []
+    instance.outputs = {}
+    instance._clients = {"s3": Mock()}
+    set_bucket_listing(instance, {})
+    instance.s3.head_object.side_effect = ClientError(
+        {"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject"
+    )
+    return instance
+
+
+def set_bucket_listing(deployer: FrontendDeployer, objects: dict[str, bytes]) -> None:
+    """Make list_objects_v2 report the given keys with their bodies' ETags."""
+    contents = [
+        {"Key": key, "ETag": f'"{hashlib.md5(body).hexdigest()}"', "Size": len(body)}
+        for key, body in objects.items()
+    ]
+    paginator = deployer.s3.get_paginator.return_value
+    paginator.paginate.return_value = [{"Contents": contents}]
+
+
+@pytest.fixture
+def build_files(tmp_path: Path) -> list[tuple[Path, str]]:
+    """Create a small build output and return its (path, key) pairs."""
+    files = []
+    for name in ["index.html", "app.js", "style.css"]:
+        file_path = tmp_path / name
+        file_path.write_text(name)
+        files.append((file_path, name))
+    return files
+
+
+class TestBuildInvalidationPaths:
+    """Test targeted CloudFront invalidation path building."""
+
+    def test_no_changes(self) -> None:
+        """Test nothing is invalidated when nothing changed."""
+        assert build_invalidation_paths([]) == []
+
+    def test_index_invalidates_directory(self) -> None:
+        """Test index.html changes also invalidate the directory URL."""
+        paths = build_invalidation_paths(["index.html", "about/index.html"])
+
+        assert paths == ["/", "/about/", "/about/index.html", "/index.html"]
+
+    def test_busy_directory_collapses_to_wildcard(self) -> None:
+        """Test a directory with many changes becomes a single wildcard."""
+        keys = [f"static/js/chunk-{i}.js" for i in range(11)] + ["favicon.ico"]
+
+        assert build_invalidation_paths(keys) == ["/favicon.ico", "/static/js/*"]
+
+    def test_falls_back_to_everything(self) -> None:
+        """Test exceeding the path limit invalidates everything."""
+        keys = [f"dir{i}/file.js" for i in range(5)]
+
+        assert build_invalidation_paths(keys, max_paths=4) == ["/*"]
+
+    def test_paths_are_url_encoded(self) -> None:
+        """Test keys with spaces are encoded for CloudFront."""
+        assert build_invalidation_paths(["my file.png"]) == ["/my%20file.png"]
+
+
+class TestUploadToS3:
+    """Test parallel uploads in upload_to_s3."""
+
+    def test_uploads_every_file(
+        self, deployer: FrontendDeployer, build_files: list[tuple[Path, str]]
+    ) -> None:
+        """Test each file is uploaded with its content type and cache control."""
+        assert deployer.upload_to_s3("bucket", build_files) is True
+
+        calls = {
+            c.kwargs["Key"]: c.kwargs for c in deployer.s3.put_object.call_args_list
+        }
+        assert set(calls) == {"index.html", "app.js", "style.css"}
+        assert calls["index.html"]["Body"].name == str(build_files[0][0])
+        assert calls["index.html"]["ContentType"] == "text/html"
+        assert calls["app.js"]["CacheControl"] == "public, max-age=86400"
+        deployer.s3.upload_file.assert_not_called()
+
+    def test_large_files_use_multipart_transfer(
+        self,
+        deployer: FrontendDeployer,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test files above the multipart threshold are streamed by upload_file."""
+        monkeypatch.setattr(
+            FrontendDeployer, "TRANSFER_CONFIG", TransferConfig(multipart_threshold=16)
+        )
+        video = tmp_path / "intro.mp4"
+        video.write_bytes(b"\0" * 32)
+
+        assert deployer.upload_to_s3("bucket", [(video, "intro.mp4")]) is True
+
+        deployer.s3.put_object.assert_not_called()
+        call = deployer.s3.upload_file.call_args
+        assert call.args == (str(video), "bucket", "intro.mp4")
+        assert call.kwargs["ExtraArgs"]["ContentType"] == "video/mp4"
+        assert call.kwargs["Config"] is FrontendDeployer.TRANSFER_CONFIG
+
+    def test_unchanged_multipart_file_skipped(
+        self,
+        deployer: FrontendDeployer,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test a large file matching its multipart ETag is not re-uploaded."""
+        config = TransferConfig(multipart_threshold=16, multipart_chunksize=16)
+        monkeypatch.setattr(FrontendDeployer, "TRANSFER_CONFIG", config)
+        video = tmp_path / "intro.mp4"
+        video.write_bytes(b"\0" * 40)
+        paginator = deployer.s3.get_paginator.return_value
+        paginator.paginate.return_value = [
+            {
+                "Contents": [
+                    {
+                        "Key": "intro.mp4",
+                        "ETag": f'"{multipart_etag(video, 16)}"',
+                        "Size": 40,
+                    }
+                ]
+            }
+        ]
+
+        assert deployer.upload_to_s3("bucket", [(video, "intro.mp4")]) is True
+
+        deployer.s3.upload_file.assert_not_called()
+        deployer.s3.put_object.assert_not_called()
+
+    def test_collects_all_failures(
+        self, deployer: FrontendDeployer, build_files: list[tuple[Path, str]]
+    ) -> None:
+        """Test one failed upload does not stop the rest."""
+
+        def put_object(**kwargs: Any) -> None:
+            if kwargs["Key"] == "app.js":
+                raise RuntimeError("boom")
+
+        deployer.s3.put_object.side_effect = put_object
+
+        assert deployer.upload_to_s3("bucket", build_files) is False
+        assert deployer.s3.put_object.call_count == 3
+        assert deployer.errors == ["Failed to upload app.js: boom"]
+
+    def test_progress_is_time_throttled(
+        self,
+        deployer: FrontendDeployer,
+        build_files: list[tuple[Path, str]],
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test progress lines follow the interval, not the file count."""
+        monkeypatch.setattr(FrontendDeployer, "PROGRESS_INTERVAL", 3600.0)
+        deployer.upload_to_s3("bucket", build_files)
+        assert "Processed" not in capsys.readouterr().out
+
+        monkeypatch.setattr(FrontendDeployer, "PROGRESS_INTERVAL", 0.0)
+        deployer.upload_to_s3("bucket", build_files)
+        assert capsys.readouterr().out.count("Processed") == 3
+
+    def test_static_assets_uploaded_before_pages(
+        self, deployer: FrontendDeployer, tmp_path: Path
+    ) -> None:
+        """Test hashed assets finish uploading before any HTML is written."""
+        page = tmp_path / "index.html"
+        asset = tmp_path / "main.js"
+        page.write_text("page")
+        asset.write_text("asset")
+
+        deployer.upload_to_s3(
+            "bucket", [(page, "index.html"), (asset, "_next/static/main.js")]
+        )
+
+        keys = [c.kwargs["Key"] for c in deployer.s3.put_object.call_args_list]
+        assert keys == ["_next/static/main.js", "index.html"]
+
+    def test_asset_failure_keeps_old_pages(
+        self, deployer: FrontendDeployer, tmp_path: Path
+    ) -> None:
+        """Test pages are not replaced when their assets failed to upload."""
+        page = tmp_path / "index.html"
+        asset = tmp_path / "main.js"
+        page.write_text("page")
+        asset.write_text("asset")
+        deployer.s3.put_object.side_effect = RuntimeError("boom")
+
+        assert (
+            deployer.upload_to_s3(
+                "bucket", [(page, "index.html"), (asset, "_next/static/main.js")]
+            )
+            is False
+        )
+        deployer.s3.put_object.assert_called_once()
+
+    def test_dry_run_reads_only_a_preview(
+        self, deployer: FrontendDeployer, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test a dry run stops consuming the file iterable after the preview."""
+        deployer.dry_run = True
+        files = ((Path(f"f{i}.js"), f"f{i}.js") for i in itertools.count())
+
+        assert deployer.upload_to_s3("bucket", files) is True
+
+        assert next(files)[1] == "f6.js"
+        assert "... and more files" in capsys.readouterr().out
+        deployer.s3.put_object.assert_not_called()
+
+    def test_skips_unchanged_files(
+        self, deployer: FrontendDeployer, build_files: list[tuple[Path, str]]
+    ) -> None:
+        """Test files whose size and MD5 match the bucket listing are skipped."""
+        set_bucket_listing(deployer, {"index.html": b"old-page!!", "app.js": b"app.js"})
+
+        assert deployer.upload_to_s3("bucket", build_files) is True
+        uploaded = {c.kwargs["Key"] for c in deployer.s3.put_object.call_args_list}
+        assert uploaded == {"index.html", "style.css"}
+        deployer.s3.get_paginator.assert_called_once_with("list_objects_v2")
+        deployer.s3.head_object.assert_not_called()
+
+    def test_falls_back_to_head_when_listing_denied(
+        self, deployer: FrontendDeployer, build_files: list[tuple[Path, str]]
+    ) -> None:
+        """Test each file is checked with HEAD when the bucket cannot be listed."""
+        deployer.s3.get_paginator.return_value.paginate.side_effect = ClientError(
+            {"Error": {"Code": "AccessDenied"}}, "ListObjectsV2"
+        )
+
+        def head_object(Bucket: str, Key: str) -> dict[str, Any]:
+            if Key != "app.js":
+                raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+            return {
+                "ContentLength": 6,
+                "ETag": f'"{hashlib.md5(b"app.js").hexdigest()}"',
+            }
+
+        deployer.s3.head_object.side_effect = head_object
+
+        assert deployer.upload_to_s3("bucket", build_files) is True
+        uploaded = {c.kwargs["Key"] for c in deployer.s3.put_object.call_args_list}
+        assert uploaded == {"index.html", "style.css"}
+        assert deployer.s3.head_object.call_count == 3
+        assert len(deployer.warnings) == 1
+
+    def test_text_assets_uploaded_gzipped(
+        self, deployer: FrontendDeployer, tmp_path: Path
+    ) -> None:
+        """Test compressible files are stored gzip-encoded when it pays off."""
+        page = tmp_path / "index.html"
+        page.write_text("<p>hello</p>" * 500)
+
+        assert deployer.upload_to_s3("bucket", [(page, "index.html")]) is True
+
+        deployer.s3.upload_file.assert_not_called()
+        kwargs = deployer.s3.put_object.call_args.kwargs
+        assert kwargs["ContentEncoding"] == "gzip"
+        assert kwargs["ContentType"] == "text/html"
+        assert gzip.decompress(kwargs["Body"]) == page.read_bytes()
+
+    def test_unchanged_gzipped_asset_skipped(
+        self, deployer: FrontendDeployer, tmp_path: Path
+    ) -> None:
+        """Test the skip check compares against the compressed body."""
+        script = tmp_path / "app.js"
+        script.write_text("console.log(1);" * 500)
+        body = gzip.compress(script.read_bytes(), compresslevel=6, mtime=0)
+        set_bucket_listing(deployer, {"app.js": body})
+
+        assert deployer.upload_to_s3("bucket", [(script, "app.js")]) is True
+
+        deployer.s3.put_object.assert_not_called()
+
+
+class TestGetBuildFiles:
+    """Test build output discovery."""
+
+    def test_next_build_layout(
+        self, deployer: FrontendDeployer, tmp_path: Path
+    ) -> None:
+        """Test _next/static, public and out files are mapped to their S3 keys."""
+        for rel in [
+            ".next/static/chunks/main.js",
+            "public/images/logo.png",
+            "out/index.html",
+            "out/about/index.html",
+        ]:
+            (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel).write_text(rel)
+        deployer.project_dir = tmp_path
+        deployer.config = Mock(frontend_dist_dir=".next")
+
+        files = deployer.get_build_files()
+
+        assert sorted(key for _, key in files) == [
+            "_next/static/chunks/main.js",
+            "about/index.html",
+            "images/logo.png",
+            "index.html",
+        ]
+        assert all(path.read_text() for path, _ in files)
+        assert (tmp_path / "out" / "about" / "index.html", "about/index.html") in files
+
+    def test_duplicate_keys_uploaded_once(
+        self, deployer: FrontendDeployer, tmp_path: Path
+    ) -> None:
+        """Test a file in both public and out is listed once, from out."""
+        for rel in ["public/robots.txt", "out/robots.txt"]:
+            (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel).write_text(rel)
+        (tmp_path / ".next").mkdir()
+        deployer.project_dir = tmp_path
+        deployer.config = Mock(frontend_dist_dir=".next")
+
+        files = deployer.get_build_files()
+
+        assert files == [(tmp_path / "out" / "robots.txt", "robots.txt")]
+
+
+class TestClassify:
+    """Test content type and cache control classification."""
+
+    @pytest.mark.parametrize(
+        ("s3_key", "expected"),
+        [
+            ("index.html", ("text/html", "public, max-age=0, must-revalidate")),
+            ("data/feed.json", ("application/json", "public, max-age=3600")),
+            (
+                "_next/static/chunks/Main.JS",
+                ("application/javascript", "public, max-age=31536000, immutable"),
+            ),
+            (
+                "static/logo.svg",
+                ("image/svg+xml", "public, max-age=31536000, immutable"),
+            ),
+            ("about.htm", ("text/html", "public, max-age=0, must-revalidate")),
+            ("LICENSE", ("application/octet-stream", "public, max-age=86400")),
+            ("app.wasm", ("application/wasm", "public, max-age=86400")),
+            ("notes.xyz", ("application/octet-stream", "public, max-age=86400")),
+            (
+                ".well-known/.hidden",
+                ("application/octet-stream", "public, max-age=86400"),
+            ),
+        ],
+    )
+    def test_classify(
+        self, deployer: FrontendDeployer, s3_key: str, expected: tuple[str, str]
+    ) -> None:
+        """Test classification matches get_content_type/get_cache_control."""
+        assert deployer.classify(s3_key) == expected
+
+
+class TestS3Client:
+    """Test the upload-tuned S3 client."""
+
+    def test_client_config(self, deployer: FrontendDeployer) -> None:
+        """Test the shared config is extended with a pool sized for the workers."""
+        deployer._clients = {}
+        deployer._session = Mock()
+
+        assert deployer.s3 is deployer._session.client.return_value
+        assert deployer.s3 is deployer._session.client.return_value
+        deployer._session.client.assert_called_once()
+
+        config = deployer._session.client.call_args.kwargs["config"]
+        assert config.max_pool_connections == deployer.upload_workers * 2
+        assert config.retries == {"mode": "adaptive", "max_attempts": 10}
+        assert config.tcp_keepalive is True
+        assert config.s3 == {"addressing_style": "virtual"}
+
+
+class TestInvalidateCloudFront:
+    """Test targeted CloudFront invalidation."""
+
+    @pytest.fixture
+    def cloudfront(self, deployer: FrontendDeployer) -> Mock:
+        """Attach a mocked CloudFront client."""
+        client = Mock()
+        client.create_invalidation.return_value = {"Invalidation": {"Id": "I1"}}
+        deployer._clients["cloudfront"] = client
+        return client
+
+    def test_only_changed_pages_invalidated(
+        self, deployer: FrontendDeployer, cloudfront: Mock
+    ) -> None:
+        """Test immutable assets are left out of the invalidation."""
+        changed = ["index.html", "_next/static/chunks/main.abc123.js"]
+
+        assert deployer.invalidate_cloudfront("DIST", changed) is True
+
+        batch = cloudfront.create_invalidation.call_args.kwargs["InvalidationBatch"]
+        assert batch["Paths"] == {"Quantity": 2, "Items": ["/", "/index.html"]}
+        assert deployer.outputs["CloudFrontInvalidationId"] == "I1"
+
+    def test_nothing_changed_skips_invalidation(
+        self, deployer: FrontendDeployer, cloudfront: Mock
+    ) -> None:
+        """Test no invalidation is created when only hashed assets changed."""
+        changed = ["_next/static/chunks/main.abc123.js"]
+
+        assert deployer.invalidate_cloudfront("DIST", changed) is True
+        cloudfront.create_invalidation.assert_not_called()
+
+    def test_defaults_to_everything(
+        self, deployer: FrontendDeployer, cloudfront: Mock
+    ) -> None:
+        """Test callers without a change list still invalidate /*."""
+        assert deployer.invalidate_cloudfront("DIST") is True
+
+        batch = cloudfront.create_invalidation.call_args.kwargs["InvalidationBatch"]
+        assert batch["Paths"] == {"Quantity": 1, "Items": ["/*"]}
@@ -0,0 +1,135 @@
+"""
+Tests for deployment.media_register_config.
+"""
+
+import pytest
+
+from deployment import media_register_config
+from deployment.media_register_config import DeploymentConfig
+
+
+@pytest.fixture(autouse=True)
+def clear_config_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start every test with an empty cache and a known environment."""
+    for key in media_register_config._ENV_KEYS:
+        monkeypatch.delenv(key, raising=False)
+    DeploymentConfig.refresh_env()
+    media_register_config._build_config.cache_clear()
+
+
+class TestDeploymentConfigCache:
+    """Test configuration is built once per environment and overrides."""
+
+    def test_repeated_instances_share_build(self) -> None:
+        """Test a second instance for the same environment hits the cache."""
+        first = DeploymentConfig("prod")
+        second = DeploymentConfig("prod")
+
+        assert first.config == second.config
+        assert first.get("stack_name") == "media-register-prod"
+        assert media_register_config._build_config.cache_info().hits == 1
+
+    def test_instances_get_independent_copies(self) -> None:
+        """Test mutating one instance's config does not leak to the next."""
+        first = DeploymentConfig("dev")
+        first.base_config["lambda_memory"] = 4096
+
+        assert DeploymentConfig("dev").get("lambda_memory") == 256
+
+    def test_environment_read_until_refreshed(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test AWS_REGION changes apply only after refresh_env()."""
+        assert DeploymentConfig("dev").get("aws_region") == "us-east-1"
+
+        monkeypatch.setenv("AWS_REGION", "eu-west-1")
+        assert DeploymentConfig("dev").get("aws_region") == "us-east-1"
+
+        DeploymentConfig.refresh_env()
+        assert DeploymentConfig("dev").get("aws_region") == "eu-west-1"
+
+    def test_unhashable_overrides_bypass_cache(self) -> None:
+        """Test list-valued overrides are applied without caching."""
+        config = DeploymentConfig("dev", {"allowed_origins": ["https://a.test"]})
+
+        assert config.get("allowed_origins") == ["https://a.test"]
+        assert media_register_config._build_config.cache_info().currsize == 0
+
+
+class TestDerivedValues:
+    """Test derived values are cached per instance and refreshed by set()."""
+
+    def test_lambda_environment(self) -> None:
+        """Test Lambda variables are derived from the stack and domains."""
+        config = DeploymentConfig("staging")
+
+        env = config.get_lambda_environment()
+
+        assert env["DYNAMODB_TABLE"] == "media-register-staging-media"
+        assert env["API_URL"] == "https://api.staging.media-register.com"
+        assert config.lambda_env is config.lambda_env
+
+    def test_returned_dicts_are_copies(self) -> None:
+        """Test callers cannot mutate the cached tags."""
+        config = DeploymentConfig("dev")
+        config.get_tags()["Project"] = "Other"
+
+        assert config.get_tags()["Project"] == "MediaRegister"
+
+    def test_set_invalidates_cache(self) -> None:
+        """Test set() drops cached values that depend on the config."""
+        config = DeploymentConfig("dev")
+        assert config.get_tags()["Application"] == "media-register"
+
+        config.set("app_name", "media-vault")
+
+        assert config.get("app_name") == "media-vault"
+        assert config.get_tags()["Application"] == "media-vault"
+
+    def test_set_recomputes_names_and_domains(self) -> None:
+        """Test set() refreshes stack names, domains and Lambda variables."""
+        config = DeploymentConfig("dev")
+        assert config.lambda_env["API_URL"] == "https://api.dev.media-register.com"
+
+        config.set("domain_name", "dev.example.org")
+        config.set("app_name", "media-vault")
+
+        assert config.stack_name == "media-vault-dev"
+        assert config.api_domain == "api.dev.example.org"
+        assert config.lambda_env["API_URL"] == "https://api.dev.example.org"
+        assert config.lambda_env["DYNAMODB_TABLE"] == "media-vault-dev-media"
+        assert config.lambda_env["UPLOAD_BUCKET"] == "media-vault-dev-uploads"
+        assert config.config["stack_name"] == "media-vault-dev"
+        assert config.config["api_domain"] == "api.dev.example.org"
+        assert config.config["website_domain"] == "dev.example.org"
+
+
+class TestConfigPrecedence:
+    """Test base, environment variable, environment and override layering."""
+
+    def test_overrides_win(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test explicit overrides beat environment variables and env config."""
+        monkeypatch.setenv("AWS_REGION", "eu-west-1")
+        DeploymentConfig.refresh_env()
+
+        config = DeploymentConfig("prod", {"aws_region": "ap-south-1"})
+
+        assert config.get("aws_region") == "ap-south-1"
+        assert config.get("lambda_memory") == 1024
+        assert config.get("enable_s3_versioning") is True
+
+    def test_empty_environment_variable_kept(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a variable set to an empty string overrides the base default."""
+        monkeypatch.setenv("AWS_REGION", "")
+        DeploymentConfig.refresh_env()
+
+        assert DeploymentConfig("dev").get("aws_region") == ""
+
+    def test_unknown_environment_uses_base(self) -> None:
+        """Test an environment without overrides gets the base values."""
+        config = DeploymentConfig("qa")
+
+        assert config.get("lambda_memory") == 512
+        assert config.get("stack_name") == "media-register-qa"
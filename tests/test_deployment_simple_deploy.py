@@ -0,0 +1,286 @@
+"""
+Tests for deployment.simple_deploy template generation.
+"""
+
+import io
+import json
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from deployment import simple_deploy
+from deployment.simple_deploy import (
+    create_cloudformation_template,
+    main,
+    validate_template,
+)
+
+
+@pytest.fixture(autouse=True)
+def template_cache(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Keep the CLI template cache out of the home directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(simple_deploy, "TEMPLATE_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+class TestCreateCloudFormationTemplate:
+    """Test the placeholder-based template generation."""
+
+    def test_environment_substituted(self) -> None:
+        """Test every environment-derived value is filled in."""
+        template = create_cloudformation_template("prod")
+        resources = template["Resources"]
+
+        assert template["Parameters"]["Environment"]["Default"] == "prod"
+        assert resources["UserPool"]["Properties"]["UserPoolName"] == (
+            "media-register-prod-users"
+        )
+        assert resources["ApiDeployment"]["Properties"]["StageName"] == "prod"
+        assert template["Outputs"]["ApiUrl"]["Value"]["Fn::Sub"].endswith(
+            ".amazonaws.com/prod"
+        )
+        assert "__" not in str(template)
+
+    def test_calls_return_independent_templates(self) -> None:
+        """Test each call gets fresh dicts built from the shared skeleton."""
+        first = create_cloudformation_template("dev")
+        second = create_cloudformation_template("dev")
+
+        first["Resources"].clear()
+
+        assert "UserPool" in second["Resources"]
+
+    def test_bucket_suffixes_fixed_per_environment(self) -> None:
+        """Test bucket names repeat within an environment but not across them."""
+
+        def buckets(environment: str) -> tuple[str, str]:
+            resources = create_cloudformation_template(environment)["Resources"]
+            return (
+                resources["UploadBucket"]["Properties"]["BucketName"],
+                resources["WebsiteBucket"]["Properties"]["BucketName"],
+            )
+
+        upload, website = buckets("dev")
+
+        assert upload.startswith("media-register-dev-uploads-")
+        assert website.startswith("media-register-dev-website-")
+        assert upload.rsplit("-", 1)[1] != website.rsplit("-", 1)[1]
+        assert buckets("dev") == (upload, website)
+        assert buckets("staging")[0].rsplit("-", 1)[1] != upload.rsplit("-", 1)[1]
+
+    def test_environment_is_json_escaped(self) -> None:
+        """Test quotes in the environment name cannot break the template."""
+        template = create_cloudformation_template('qa"1')
+
+        assert template["Description"] == 'Media Register Application - qa"1'
+
+
+class TestValidateTemplate:
+    """Test generated templates are checked against the structural schema."""
+
+    def test_generated_templates_valid(self) -> None:
+        """Test every CLI environment produces a valid template."""
+        for environment in ("dev", "staging", "prod"):
+            validate_template(create_cloudformation_template(environment))
+
+    def test_untyped_resource_rejected(self) -> None:
+        """Test a resource without a Type is reported with its path."""
+        template = create_cloudformation_template("dev")
+        del template["Resources"]["UserPool"]["Type"]
+
+        with pytest.raises(ValueError, match="Resources -> UserPool"):
+            validate_template(template)
+
+    def test_unknown_section_rejected(self) -> None:
+        """Test a misspelt top-level section is rejected."""
+        template = create_cloudformation_template("dev")
+        template["Output"] = template.pop("Outputs")
+
+        with pytest.raises(ValueError, match="'Output' was unexpected"):
+            validate_template(template)
+
+    def test_fast_validator_short_circuits(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a passing fast validator skips the jsonschema walk."""
+        monkeypatch.setattr(
+            simple_deploy, "_CFN_FAST_VALIDATOR", Mock(is_valid=Mock(return_value=True))
+        )
+        monkeypatch.setattr(simple_deploy, "_CFN_VALIDATOR", Mock())
+
+        validate_template({"Resources": {}})
+
+        simple_deploy._CFN_VALIDATOR.iter_errors.assert_not_called()
+
+    def test_fast_validator_failure_described(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a failing fast validator still reports the jsonschema error."""
+        monkeypatch.setattr(
+            simple_deploy,
+            "_CFN_FAST_VALIDATOR",
+            Mock(is_valid=Mock(return_value=False)),
+        )
+
+        with pytest.raises(ValueError, match="'AWSTemplateFormatVersion'"):
+            validate_template({"Resources": {"A": {"Type": "AWS::S3::Bucket"}}})
+
+
+class TestMain:
+    """Test the simple_deploy command line output."""
+
+    def test_compact_when_piped(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test output is minified when stdout is not a terminal."""
+        monkeypatch.setattr("sys.argv", ["simple_deploy", "-e", "staging"])
+
+        main()
+
+        out = capsys.readouterr().out
+        assert out.startswith('{"AWSTemplateFormatVersion":"2010-09-09",')
+        assert json.loads(out)["Parameters"]["Environment"]["Default"] == "staging"
+
+    def test_indented_for_terminal(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test an interactive run writes an indented file."""
+        output = tmp_path / "template.json"
+        monkeypatch.setattr("sys.argv", ["simple_deploy", "-o", str(output)])
+        monkeypatch.setattr("sys.stdout.isatty", lambda: True)
+
+        main()
+
+        assert output.read_text().startswith('{\n  "AWSTemplateFormatVersion"')
+
+    @pytest.mark.parametrize("compact", [True, False])
+    def test_stdlib_fallback_matches(
+        self, monkeypatch: pytest.MonkeyPatch, compact: bool
+    ) -> None:
+        """Test output is the same with and without orjson installed."""
+        template = create_cloudformation_template("dev")
+        with_orjson = simple_deploy._serialise_template(template, compact)
+
+        monkeypatch.setattr(simple_deploy, "orjson", None)
+        without_orjson = simple_deploy._serialise_template(template, compact)
+
+        assert with_orjson == without_orjson
+
+    def test_compact_bytes_written_as_is(self) -> None:
+        """Test compact output copies the cached bytes without re-serialising."""
+        stream = io.BytesIO()
+
+        simple_deploy._write_template(b'{"a":[1]}', stream, compact=True)
+        assert stream.getvalue() == b'{"a":[1]}'
+
+        stream = io.BytesIO()
+        simple_deploy._write_template(b'{"a":1}', stream, compact=False)
+        assert stream.getvalue() == b'{\n  "a": 1\n}'
+
+
+class TestTemplateCache:
+    """Test the CLI reuses templates between runs."""
+
+    def _buckets(self, output: Path) -> str:
+        resources = json.loads(output.read_text())["Resources"]
+        return str(resources["UploadBucket"]["Properties"]["BucketName"])
+
+    def test_cached_template_reused(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path, template_cache: Path
+    ) -> None:
+        """Test a second run reads the cache instead of regenerating."""
+        output = tmp_path / "template.json"
+        monkeypatch.setattr("sys.argv", ["simple_deploy", "-o", str(output)])
+        main()
+        first = self._buckets(output)
+
+        simple_deploy._bucket_suffixes.cache_clear()
+        main()
+
+        assert self._buckets(output) == first
+        assert len(list(template_cache.glob("*.json"))) == 1
+
+    def test_fresh_regenerates(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test --fresh ignores the cache and stores the new template."""
+        output = tmp_path / "template.json"
+        monkeypatch.setattr("sys.argv", ["simple_deploy", "-o", str(output)])
+        main()
+        first = self._buckets(output)
+
+        simple_deploy._bucket_suffixes.cache_clear()
+        monkeypatch.setattr("sys.argv", ["simple_deploy", "-o", str(output), "--fresh"])
+        main()
+        fresh = self._buckets(output)
+
+        assert fresh != first
+        monkeypatch.setattr("sys.argv", ["simple_deploy", "-o", str(output)])
+        main()
+        assert self._buckets(output) == fresh
+
+    def test_cache_scoped_to_account_and_region(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path, template_cache: Path
+    ) -> None:
+        """Test another region or profile gets its own bucket names."""
+        output = tmp_path / "template.json"
+        monkeypatch.setattr("sys.argv", ["simple_deploy", "-o", str(output)])
+        monkeypatch.setenv("AWS_PROFILE", "team-a")
+        monkeypatch.setenv("AWS_REGION", "us-east-1")
+        main()
+        first = self._buckets(output)
+
+        simple_deploy._bucket_suffixes.cache_clear()
+        monkeypatch.setenv("AWS_REGION", "eu-west-1")
+        main()
+
+        assert self._buckets(output) != first
+        assert len(list(template_cache.glob("*.json"))) == 2
+
+    def test_explicit_bucket_suffix(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path, template_cache: Path
+    ) -> None:
+        """Test --bucket-suffix names both buckets and bypasses the cache."""
+        output = tmp_path / "template.json"
+        monkeypatch.setattr(
+            "sys.argv",
+            ["simple_deploy", "-o", str(output), "--bucket-suffix", "acct1-euw1"],
+        )
+        main()
+
+        resources = json.loads(output.read_text())["Resources"]
+        assert self._buckets(output) == "media-register-dev-uploads-acct1-euw1"
+        assert resources["WebsiteBucket"]["Properties"]["BucketName"] == (
+            "media-register-dev-website-acct1-euw1"
+        )
+        assert not template_cache.exists()
+
+    @pytest.mark.parametrize("suffix", ['a"b', "a\\b", "Team_A", ""])
+    def test_invalid_bucket_suffix_rejected(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path, suffix: str
+    ) -> None:
+        """Test suffixes that would break the JSON or the bucket name are refused."""
+        output = tmp_path / "template.json"
+        monkeypatch.setattr(
+            "sys.argv", ["simple_deploy", "-o", str(output), "--bucket-suffix", suffix]
+        )
+
+        with pytest.raises(SystemExit):
+            main()
+        with pytest.raises(ValueError, match="Invalid bucket suffix"):
+            create_cloudformation_template("dev", suffix)
+        assert not output.exists()
+
+    def test_unwritable_cache_ignored(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test a cache directory that cannot be created does not fail the run."""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+        monkeypatch.setattr(simple_deploy, "TEMPLATE_CACHE_DIR", blocker / "cfn")
+
+        data = simple_deploy._load_template("dev", fresh=False)
+
+        assert json.loads(data) == create_cloudformation_template("dev")
@@ -0,0 +1,271 @@
+"""
+Tests for deployment.validate_deployment.
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from deployment import validate_deployment
+from deployment.validate_deployment import DeploymentValidator
+
+API_URL = "https://api.example.com"
+WEBSITE_URL = "https://www.example.com"
+
+
+@pytest.fixture
+def validator(tmp_path: Path) -> DeploymentValidator:
+    """Create a validator whose HTTP session is mocked out."""
+    outputs_file = tmp_path / "outputs.json"
+    outputs_file.write_text(json.dumps({"ApiUrl": API_URL, "WebsiteUrl": WEBSITE_URL}))
+    instance = DeploymentValidator(str(outputs_file))
+    instance.session = Mock()
+    return instance
+
+
+def _response(status_code: int = 200, **kwargs: Any) -> Mock:
+    response = MagicMock(status_code=status_code, headers=kwargs.pop("headers", {}))
+    response.__enter__.return_value = response
+    response.json.return_value = kwargs.pop("json", {})
+    body = kwargs.pop("text", "").encode()
+    response.iter_content.side_effect = lambda size: (
+        body[i : i + size] for i in range(0, len(body), size)
+    )
+    return response
+
+
+class TestSession:
+    """Test HTTP calls share one pooled session."""
+
+    def test_session_retries_gateway_errors(self, tmp_path: Path) -> None:
+        """Test the session adapter retries 502/503/504 without raising."""
+        validator = DeploymentValidator(str(tmp_path / "missing.json"))
+
+        retries = validator.session.get_adapter(API_URL).max_retries
+
+        assert retries.total == 2
+        assert set(retries.status_forcelist) == {502, 503, 504}
+        assert retries.raise_on_status is False
+        assert validator.session.get_adapter("http://x").max_retries is retries
+
+    def test_probes_use_session(self, validator: DeploymentValidator) -> None:
+        """Test health and endpoint probes go through the session."""
+        validator.session.get.return_value = _response(
+            json={"service": "api", "version": "1.0"}
+        )
+        validator.session.request.return_value = _response()
+
+        assert validator.test_api_health() is True
+        assert validator.test_api_endpoints() is True
+
+        validator.session.get.assert_called_once_with(f"{API_URL}/health", timeout=10)
+        assert validator.session.request.call_count == 4
+
+    def test_endpoints_requested_concurrently(
+        self, validator: DeploymentValidator
+    ) -> None:
+        """Test the four endpoint requests are in flight at the same time."""
+        barrier = threading.Barrier(4, timeout=5)
+
+        def request(method: str, url: str, **kwargs: Any) -> Mock:
+            barrier.wait()
+            return _response(404 if url.endswith("/works") else 200)
+
+        validator.session.request.side_effect = request
+
+        assert validator.test_api_endpoints() is False
+        failed = [name for name, success, _ in validator.results if not success]
+        assert failed == ["API List Works"]
+        assert len(validator.results) == 4
+
+
+class TestRunAllTests:
+    """Test run_all_tests fans the probes out concurrently."""
+
+    def test_probes_run_concurrently(self, validator: DeploymentValidator) -> None:
+        """Test the website and health probes are in flight at the same time."""
+        barrier = threading.Barrier(4, timeout=5)
+
+        def get(url: str, **kwargs: Any) -> Mock:
+            barrier.wait()
+            return _response(
+                json={"database": {"healthy": True}},
+                text="Media Register",
+                headers={"X-Cache": "Hit from cloudfront"},
+            )
+
+        validator.session.get.side_effect = get
+        validator.session.head.side_effect = get
+        validator.session.options.return_value = _response(
+            headers={
+                "access-control-allow-origin": "*",
+                "access-control-allow-methods": "GET",
+                "access-control-allow-headers": "*",
+            }
+        )
+        validator.session.request.return_value = _response()
+
+        assert validator.run_all_tests() is True
+        assert len(validator.results) == 9
+
+    def test_failure_reported(self, validator: DeploymentValidator) -> None:
+        """Test a failing probe fails the run without stopping the others."""
+        validator.session.get.side_effect = ConnectionError("down")
+        validator.session.head.side_effect = ConnectionError("down")
+        validator.session.options.side_effect = ConnectionError("down")
+        validator.session.request.return_value = _response()
+
+        assert validator.run_all_tests() is False
+        passed = {name for name, success, _ in validator.results if success}
+        assert passed == {
+            "API List Authors",
+            "API List Works",
+            "API Readiness Check",
+            "API Liveness Check",
+        }
+
+
+class TestWaitForDeployment:
+    """Test the readiness poll backs off exponentially."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch: pytest.MonkeyPatch) -> list[float]:
+        """Replace time.time/time.sleep with a fake clock recording sleeps."""
+        now = [0.0]
+        sleeps: list[float] = []
+
+        def sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        monkeypatch.setattr(validate_deployment.time, "time", lambda: now[0])
+        monkeypatch.setattr(validate_deployment.time, "sleep", sleep)
+        return sleeps
+
+    def test_backoff_until_ready(
+        self, validator: DeploymentValidator, clock: list[float]
+    ) -> None:
+        """Test delays double from one second and stop on a 2xx."""
+        validator.session.get.side_effect = [
+            ConnectionError("refused"),
+            _response(503),
+            _response(503),
+            _response(204),
+        ]
+
+        assert validator.wait_for_deployment(max_wait=60) is True
+        assert clock == [1.0, 2.0, 4.0]
+        validator.session.get.assert_called_with(f"{API_URL}/health", timeout=(3, 5))
+
+    def test_delay_capped_and_deadline_respected(
+        self, validator: DeploymentValidator, clock: list[float]
+    ) -> None:
+        """Test delays cap at ten seconds and never overshoot max_wait."""
+        validator.session.get.return_value = _response(503)
+
+        assert validator.wait_for_deployment(max_wait=30) is False
+        assert clock == [1.0, 2.0, 4.0, 8.0, 10.0, 5.0]
+
+
+class TestWebsiteAvailability:
+    """Test the website content check reads only as much as it needs."""
+
+    def test_marker_split_across_chunks(self, validator: DeploymentValidator) -> None:
+        """Test a marker straddling a chunk boundary is still found."""
+        page = "x" * (8192 - 5) + "Media Register" + "y" * 100_000
+        validator.session.get.return_value = _response(text=page)
+
+        assert validator.test_website_availability() is True
+        assert validator.session.get.call_args.kwargs["stream"] is True
+
+    def test_scan_stops_at_limit(self, validator: DeploymentValidator) -> None:
+        """Test content beyond the scan limit is not read."""
+        page = "x" * (validate_deployment.WEBSITE_SCAN_LIMIT + 8192) + "Media Register"
+        validator.session.get.return_value = _response(text=page)
+
+        assert validator.test_website_availability() is False
+        assert validator.results[-1][2] == "Available but missing expected content"
+
+
+class TestCloudFrontHeaders:
+    """Test the CloudFront check inspects headers only."""
+
+    def test_uses_head_request(self, validator: DeploymentValidator) -> None:
+        """Test headers are read from a HEAD request following redirects."""
+        validator.session.head.return_value = _response(
+            headers={"X-Amz-Cf-Id": "abc", "X-Cache": "Miss from cloudfront"}
+        )
+
+        assert validator.test_cloudfront_headers() is True
+        validator.session.head.assert_called_once_with(
+            WEBSITE_URL, timeout=10, allow_redirects=True
+        )
+        validator.session.get.assert_not_called()
+        assert validator.results[-1][2] == "Active - 2 CF headers found"
+
+
+class TestApiCors:
+    """Test the CORS check matches header names case-insensitively."""
+
+    def test_mixed_case_headers(self, validator: DeploymentValidator) -> None:
+        """Test CORS headers are recognised whatever their case."""
+        validator.session.options.return_value = _response(
+            headers={
+                "Access-Control-Allow-Origin": "*",
+                "ACCESS-CONTROL-ALLOW-METHODS": "GET",
+                "access-control-allow-headers": "*",
+            }
+        )
+
+        assert validator.test_api_cors() is True
+
+    def test_missing_header(self, validator: DeploymentValidator) -> None:
+        """Test a missing CORS header is reported as not configured."""
+        validator.session.options.return_value = _response(
+            headers={"Access-Control-Allow-Origin": "*"}
+        )
+
+        assert validator.test_api_cors() is False
+        assert validator.results[-1][2] == "Not configured"
+
+
+class TestRequiresRequests:
+    """Test checks fail cleanly when requests is not installed."""
+
+    def test_checks_fail_without_requests(
+        self, validator: DeploymentValidator, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test named checks record a result and the rest fail silently."""
+        monkeypatch.setattr(validate_deployment, "requests", None)
+
+        assert validator.run_all_tests() is False
+        assert sorted(validator.results) == [
+            ("API Health", False, "requests library not installed"),
+            ("Website", False, "requests library not installed"),
+        ]
+        validator.session.get.assert_not_called()
+        assert validator.test_api_cors.__name__ == "test_api_cors"
+
+
+class TestLoadOutputs:
+    """Test deployment outputs are read with or without orjson."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_outputs_loaded(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+    ) -> None:
+        """Test URLs are taken from the outputs file."""
+        if not use_orjson:
+            monkeypatch.setattr(validate_deployment, "orjson", None)
+        outputs_file = tmp_path / "outputs.json"
+        outputs_file.write_text(json.dumps({"ApiUrl": API_URL, "Note": "café"}))
+
+        validator = DeploymentValidator(str(outputs_file))
+
+        assert validator.api_url == API_URL
+        assert validator.outputs["Note"] == "café"
+        assert validator.website_url == ""
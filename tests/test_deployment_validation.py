@@ -0,0 +1,458 @@
+"""
+Tests for deployment.validation pre-deployment checks.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Any, Iterator
+from unittest.mock import Mock
+
+from botocore.exceptions import ClientError
+
+import pytest
+
+from deployment import validation
+from deployment.validation import (
+    CheckStatus,
+    PreDeploymentValidator,
+    ValidationCheck,
+)
+
+
+@pytest.fixture(autouse=True)
+def fake_boto3(monkeypatch: pytest.MonkeyPatch) -> Iterator[Mock]:
+    """Replace boto3 with a mock and start with empty session caches."""
+    boto3 = Mock()
+    monkeypatch.setattr(validation, "boto3", boto3)
+    PreDeploymentValidator.refresh_aws()
+    yield boto3
+    PreDeploymentValidator.refresh_aws()
+
+
+@pytest.fixture
+def validator(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> PreDeploymentValidator:
+    """Create a validator rooted in an empty project with mocked AWS clients."""
+    monkeypatch.chdir(tmp_path)
+    return PreDeploymentValidator("demo", "dev", region="us-east-1")
+
+
+class TestValidateAll:
+    """Test validate_all runs checks concurrently and keeps their order."""
+
+    def test_aws_checks_run_concurrently(
+        self, validator: PreDeploymentValidator
+    ) -> None:
+        """Test the AWS calls from different checks overlap."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def wait(*args: Any, **kwargs: Any) -> dict[str, Any]:
+            barrier.wait()
+            return {"Account": "123", "Arn": "arn", "Stacks": []}
+
+        client = validator.session.client.return_value
+        client.get_caller_identity.side_effect = wait
+        client.describe_stacks.side_effect = wait
+        client.head_bucket.side_effect = wait
+
+        checks = validator.validate_all(
+            skip_categories=["Configuration", "Dependencies", "Security"]
+        )
+
+        by_name = {check.name: check.status for check in checks}
+        assert by_name["AWS Credentials"] == CheckStatus.PASS
+        assert by_name["S3 Deployment Bucket"] == CheckStatus.PASS
+        client.describe_stacks.assert_called_once_with(StackName="demo-dev")
+
+    def test_order_and_error_handling(self, validator: PreDeploymentValidator) -> None:
+        """Test results follow declaration order and errors become failures."""
+        validator.check_aws_credentials = Mock(  # type: ignore[method-assign]
+            side_effect=RuntimeError("boom"), __name__="check_aws_credentials"
+        )
+        validator.check_aws_permissions = Mock(  # type: ignore[method-assign]
+            return_value=[
+                ValidationCheck("Perm A", "AWS", CheckStatus.PASS, "ok"),
+                ValidationCheck("Perm B", "AWS", CheckStatus.PASS, "ok"),
+            ]
+        )
+        validator.session.client.return_value.describe_stacks.return_value = {
+            "Stacks": []
+        }
+
+        checks = validator.validate_all(
+            skip_categories=["Configuration", "Dependencies", "Security", "Resources"]
+        )
+
+        assert [check.name for check in checks] == [
+            "aws_credentials",
+            "Perm A",
+            "Perm B",
+            "Service Limits",
+            "Existing Stack",
+        ]
+        assert checks[0].status == CheckStatus.FAIL
+        assert checks[0].message == "Check failed with error: boom"
+
+    def test_clients_created_once(self, validator: PreDeploymentValidator) -> None:
+        """Test concurrent checks share one client per service."""
+        validator.validate_all(
+            skip_categories=["Configuration", "Dependencies", "Security"]
+        )
+
+        services = [call.args[0] for call in validator.session.client.call_args_list]
+        assert sorted(services) == ["cloudformation", "s3", "sts"]
+
+
+class TestSessionCache:
+    """Test sessions and caller identity are shared until refreshed."""
+
+    def test_session_shared_per_region(self, fake_boto3: Mock) -> None:
+        """Test validators for one region reuse a single session."""
+        fake_boto3.Session.side_effect = lambda region_name: Mock()
+
+        first = PreDeploymentValidator("demo", "dev", region="us-east-1")
+        second = PreDeploymentValidator("demo", "prod", region="us-east-1")
+        other = PreDeploymentValidator("demo", "dev", region="eu-west-1")
+
+        assert first.session is second.session
+        assert other.session is not first.session
+
+    def test_identity_fetched_once(self, fake_boto3: Mock) -> None:
+        """Test STS is called once across validators until refresh_aws()."""
+        sts = fake_boto3.Session.return_value.client.return_value
+        sts.get_caller_identity.return_value = {"Account": "123", "Arn": "arn"}
+
+        for _ in range(2):
+            check = PreDeploymentValidator("demo", "dev").check_aws_credentials()
+            assert check.details == {"account": "123", "arn": "arn"}
+        assert sts.get_caller_identity.call_count == 1
+
+        PreDeploymentValidator.refresh_aws()
+        PreDeploymentValidator("demo", "dev").check_aws_credentials()
+        assert sts.get_caller_identity.call_count == 2
+
+    def test_failed_identity_not_cached(self, fake_boto3: Mock) -> None:
+        """Test a credentials failure is retried on the next check."""
+        sts = fake_boto3.Session.return_value.client.return_value
+        sts.get_caller_identity.side_effect = [
+            RuntimeError("expired"),
+            {"Account": "123", "Arn": "arn"},
+        ]
+        validator = PreDeploymentValidator("demo", "dev")
+
+        assert validator.check_aws_credentials().status == CheckStatus.FAIL
+        assert validator.check_aws_credentials().status == CheckStatus.PASS
+
+
+class TestCheckNoSecrets:
+    """Test the hardcoded-secret scan."""
+
+    def test_assignments_reported_by_pattern(
+        self, validator: PreDeploymentValidator, tmp_path: Path
+    ) -> None:
+        """Test keyword lines with an assignment are reported once per pattern."""
+        (tmp_path / "settings.py").write_text(
+            "import os\n"
+            "PASSWORD = 'hunter2'  # pwd\n"
+            "token_name = 'x'\n"
+            "print('token')\n"
+            "Api_Key = 'abc'\n"
+        )
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "lib.js").write_text("password = 1\n")
+
+        (check,) = validator.check_no_secrets()
+
+        assert check.status == CheckStatus.WARNING
+        assert check.details == {
+            "issues": [
+                {"file": "settings.py", "line": 5, "pattern": "API keys"},
+                {"file": "settings.py", "line": 2, "pattern": "Passwords"},
+                {"file": "settings.py", "line": 3, "pattern": "Tokens"},
+            ]
+        }
+
+    def test_clean_project_passes(
+        self, validator: PreDeploymentValidator, tmp_path: Path
+    ) -> None:
+        """Test keywords without an assignment are not reported."""
+        (tmp_path / "app.ts").write_text("// rotate the token daily\nlet a = 1;\n")
+
+        (check,) = validator.check_no_secrets()
+
+        assert check.status == CheckStatus.PASS
+
+    def test_single_walk_prunes_build_dirs(
+        self,
+        validator: PreDeploymentValidator,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test the tree is walked once and skipped directories are not entered."""
+        for directory in ("src/app", "dist/assets", "node_modules/pkg"):
+            (tmp_path / directory).mkdir(parents=True)
+        (tmp_path / "src" / "app" / "config.yml").write_text("password = x\n")
+        (tmp_path / "src" / "app" / "notes.txt").write_text("password = x\n")
+        (tmp_path / "dist" / "assets" / "bundle.js").write_text("token = 1\n")
+
+        visited: list[str] = []
+        real_walk = os.walk
+
+        def walk(top: Path) -> Any:
+            for root, dirs, files in real_walk(top):
+                visited.append(os.path.relpath(root, tmp_path))
+                yield root, dirs, files
+
+        monkeypatch.setattr(os, "walk", walk)
+
+        (check,) = validator.check_no_secrets()
+
+        assert check.details == {
+            "issues": [
+                {
+                    "file": os.path.join("src", "app", "config.yml"),
+                    "line": 1,
+                    "pattern": "Passwords",
+                }
+            ]
+        }
+        assert sorted(visited) == [".", "src", os.path.join("src", "app")]
+
+    def test_binary_and_oversized_files_skipped(
+        self,
+        validator: PreDeploymentValidator,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test files with NUL bytes or over the size cap are not scanned."""
+        monkeypatch.setattr(validation, "SECRET_SCAN_MAX_BYTES", 64)
+        (tmp_path / "blob.json").write_bytes(b"\0\x01password = x\n")
+        (tmp_path / "big.yaml").write_bytes(b"password = x\n" + b"#" * 64)
+        (tmp_path / "latin1.py").write_bytes(b"# caf\xe9\npwd = 'x'\n")
+
+        (check,) = validator.check_no_secrets()
+
+        assert check.details == {
+            "issues": [{"file": "latin1.py", "line": 2, "pattern": "Passwords"}]
+        }
+
+
+class TestCheckAwsPermissions:
+    """Test the DescribeStacks permission probe."""
+
+    def _error(self, code: str) -> ClientError:
+        return ClientError({"Error": {"Code": code, "Message": code}}, "DescribeStacks")
+
+    def test_probe_scoped_to_stack(self, validator: PreDeploymentValidator) -> None:
+        """Test only this project's stack is described."""
+        (check,) = validator.check_aws_permissions()
+
+        cf = validator.session.client.return_value
+        cf.describe_stacks.assert_called_once_with(StackName="demo-dev")
+        assert check.status == CheckStatus.WARNING
+
+    def test_missing_stack_proves_access(
+        self, validator: PreDeploymentValidator
+    ) -> None:
+        """Test a ValidationError for a missing stack still counts as allowed."""
+        cf = validator.session.client.return_value
+        cf.describe_stacks.side_effect = self._error("ValidationError")
+
+        (check,) = validator.check_aws_permissions()
+
+        assert check.message.startswith("Basic permissions verified")
+
+    def test_access_denied(self, validator: PreDeploymentValidator) -> None:
+        """Test AccessDenied is reported as a failed check."""
+        cf = validator.session.client.return_value
+        cf.describe_stacks.side_effect = self._error("AccessDenied")
+
+        (check,) = validator.check_aws_permissions()
+
+        assert check.status == CheckStatus.FAIL
+
+
+class TestDescribeStackSharing:
+    """Test the AWS checks share one describe_stacks call per run."""
+
+    def test_missing_stack_shared(self, validator: PreDeploymentValidator) -> None:
+        """Test a missing stack is looked up once and reported by both checks."""
+        cf = validator.session.client.return_value
+        cf.describe_stacks.side_effect = ClientError(
+            {"Error": {"Code": "ValidationError", "Message": "missing"}},
+            "DescribeStacks",
+        )
+
+        (permissions,) = validator.check_aws_permissions()
+        existing = validator.check_existing_resources()
+
+        assert permissions.status == CheckStatus.WARNING
+        assert existing.message == "No existing stack found"
+        assert cf.describe_stacks.call_count == 1
+
+    def test_refreshed_each_run(self, validator: PreDeploymentValidator) -> None:
+        """Test every validate_all run describes the stack afresh."""
+        cf = validator.session.client.return_value
+        cf.describe_stacks.return_value = {
+            "Stacks": [{"StackStatus": "CREATE_COMPLETE"}]
+        }
+        skip = ["Configuration", "Dependencies", "Security", "Resources"]
+
+        validator.validate_all(skip_categories=skip)
+        checks = validator.validate_all(skip_categories=skip)
+
+        assert cf.describe_stacks.call_count == 2
+        existing = next(c for c in checks if c.name == "Existing Stack")
+        assert existing.details == {
+            "status": "CREATE_COMPLETE",
+            "last_updated": "N/A",
+        }
+
+
+class TestCheckLambdaCode:
+    """Test the Lambda build checks."""
+
+    def test_uncompiled_typescript(
+        self, validator: PreDeploymentValidator, tmp_path: Path
+    ) -> None:
+        """Test TypeScript without JavaScript output fails the check."""
+        handlers = tmp_path / "src" / "lambda" / "handlers"
+        handlers.mkdir(parents=True)
+        (handlers / "index.ts").write_text("")
+
+        compiled, packages = validator.check_lambda_code()
+
+        assert compiled.status == CheckStatus.FAIL
+        assert packages.status == CheckStatus.WARNING
+
+    def test_compiled_and_packaged(
+        self, validator: PreDeploymentValidator, tmp_path: Path
+    ) -> None:
+        """Test compiled output anywhere below src/lambda and zips are counted."""
+        lambda_dir = tmp_path / "src" / "lambda"
+        (lambda_dir / "dist").mkdir(parents=True)
+        (lambda_dir / "index.ts").write_text("")
+        (lambda_dir / "dist" / "index.js").write_text("")
+        for name in ("a.zip", "b.zip"):
+            (lambda_dir / name).write_bytes(b"")
+
+        compiled, packages = validator.check_lambda_code()
+
+        assert compiled.status == CheckStatus.PASS
+        assert packages.message == "Found 2 Lambda deployment packages"
+
+
+class TestCheckConfigFiles:
+    """Test required configuration files are found by directory listing."""
+
+    def test_yaml_json_and_missing(
+        self,
+        validator: PreDeploymentValidator,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test YAML, JSON fallback and missing files with one listing per dir."""
+        (tmp_path / "config" / "environments").mkdir(parents=True)
+        (tmp_path / "config" / "base.yaml").write_text("")
+        (tmp_path / "config" / "environments" / "dev.json").write_text("{}")
+
+        listed: list[Path] = []
+        real_listdir = os.listdir
+
+        def listdir(path: Path) -> list[str]:
+            listed.append(Path(path))
+            return real_listdir(path)
+
+        monkeypatch.setattr(os, "listdir", listdir)
+
+        base, environment, pyproject = validator.check_config_files()
+
+        assert base.message == "Base configuration exists"
+        assert environment.message == "Environment configuration exists (JSON format)"
+        assert pyproject.status == CheckStatus.FAIL
+        assert sorted(listed) == sorted(
+            [tmp_path, tmp_path / "config", tmp_path / "config" / "environments"]
+        )
+
+
+class TestValidationCheck:
+    """Test the check result record."""
+
+    def test_slotted(self) -> None:
+        """Test results carry no per-instance __dict__."""
+        check = ValidationCheck("a", "AWS", CheckStatus.PASS, "ok")
+
+        assert not hasattr(check, "__dict__")
+        with pytest.raises(AttributeError):
+            check.extra = 1  # type: ignore[attr-defined]
+
+
+class TestGenerateReport:
+    """Test report counts and readiness."""
+
+    def test_counts_by_status_and_category(
+        self, validator: PreDeploymentValidator
+    ) -> None:
+        """Test every category lists all statuses, including zero counts."""
+        checks = [
+            ValidationCheck("a", "AWS", CheckStatus.PASS, "ok"),
+            ValidationCheck("b", "AWS", CheckStatus.WARNING, "hmm"),
+            ValidationCheck("c", "Security", CheckStatus.FAIL, "bad", fix_command="x"),
+            ValidationCheck("d", "Security", CheckStatus.SKIPPED, "skip"),
+        ]
+
+        report = validator.generate_report(checks)
+
+        assert report["summary"] == {"pass": 1, "fail": 1, "warning": 1, "skipped": 1}
+        assert report["by_category"] == {
+            "AWS": {"pass": 1, "fail": 0, "warning": 1, "skipped": 0},
+            "Security": {"pass": 0, "fail": 1, "warning": 0, "skipped": 1},
+        }
+        assert type(report["by_category"]) is dict
+        assert report["failed_checks"] == [{"name": "c", "message": "bad", "fix": "x"}]
+        assert report["warnings"] == [{"name": "b", "message": "hmm"}]
+        assert report["readiness_score"] == 50.0
+        assert report["ready_to_deploy"] is False
+
+
+class TestCheckPythonPackages:
+    """Test required packages are located without importing them."""
+
+    def test_installed(self, validator: PreDeploymentValidator) -> None:
+        """Test the check passes when boto3 and yaml can be found."""
+        assert validator.check_python_packages().status == CheckStatus.PASS
+
+    def test_missing(
+        self, validator: PreDeploymentValidator, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a package without a module spec is reported by name."""
+        monkeypatch.setattr(
+            validation.importlib.util,
+            "find_spec",
+            lambda name: None if name == "yaml" else Mock(),
+        )
+
+        check = validator.check_python_packages()
+
+        assert check.status == CheckStatus.FAIL
+        assert check.message == "Missing Python package: yaml"
+
+
+class TestClientConfig:
+    """Test AWS clients are built with the probe retry and timeout settings."""
+
+    def test_clients_use_probe_config(self, validator: PreDeploymentValidator) -> None:
+        """Test both cached clients and the STS identity client get the config."""
+        validator.check_s3_buckets()
+        validator.check_aws_credentials()
+
+        configs = [
+            call.kwargs["config"] for call in validator.session.client.call_args_list
+        ]
+        assert len(configs) == 2
+        for config in configs:
+            assert config.retries == {"mode": "adaptive", "max_attempts": 5}
+            assert config.connect_timeout == 3
+            assert config.read_timeout == 10